@@ -102,7 +102,7 @@ class MumbleLauncher:
         
         quick_info = ttk.Label(
             info_frame,
-            text="• Mumble Quick: Runs hidden, press Ctrl+Alt to use",
+            text="• Mumble Quick: Runs hidden, press Ctrl+Alt+Space to use",
             font=("Arial", 8),
             foreground="blue"
         )
@@ -334,7 +334,7 @@ class EnhancedMumbleLauncher:
         
         quick_desc = tk.Label(
             quick_container,
-            text="Background voice input - Press Ctrl+Alt to dictate anywhere",
+            text="Background voice input - Press Ctrl+Alt+Space to dictate anywhere",
             font=ModernStyle.FONTS['small'],
             bg=ModernStyle.COLORS['bg_primary'],
             fg=ModernStyle.COLORS['text_secondary']
@@ -388,7 +388,7 @@ class EnhancedMumbleLauncher:
         tips = [
             "💡 Mumble Notes opens a dedicated editor window for longer text",
             "🎯 Mumble Quick runs in background - perfect for quick dictation",
-            "⌨️ Use Ctrl+Alt hotkey to activate Mumble Quick from anywhere",
+            "⌨️ Use Ctrl+Alt+Space hotkey to activate Mumble Quick from anywhere",
             "🔄 Switch between apps easily - the launcher handles the rest"
         ]
         
@@ -624,7 +624,7 @@ class EnhancedMumbleLauncher:
                 "Help", 
                 "Documentation: https://github.com/yourusername/mumble\n\n"
                 "Mumble Notes: Full editor with speech-to-text\n"
-                "Mumble Quick: Background voice input (Ctrl+Alt to activate)",
+                "Mumble Quick: Background voice input (Ctrl+Alt+Space to activate)",
                 icon='info'
             )
     
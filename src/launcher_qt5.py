@@ -147,7 +147,7 @@ class MumbleLauncher(QWidget):
             notes_info.setObjectName("info_label")
             info_layout.addWidget(notes_info)
             
-            quick_info = QLabel("• Mumble Quick: Runs hidden, press Ctrl+Alt to use")
+            quick_info = QLabel("• Mumble Quick: Runs hidden, press Ctrl+Alt+Space to use")
             quick_info.setObjectName("info_label")
             info_layout.addWidget(quick_info)
             
@@ -490,7 +490,7 @@ class MumbleLauncher(QWidget):
                 self, "Help", 
                 "Documentation: https://github.com/yourusername/mumble\n\n"
                 "Mumble Notes: Full editor with speech-to-text\n"
-                "Mumble Quick: Background voice input (Ctrl+Alt to activate)"
+                "Mumble Quick: Background voice input (Ctrl+Alt+Space to activate)"
             )
     
     def closeEvent(self, event):
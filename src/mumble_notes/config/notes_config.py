@@ -4,12 +4,13 @@ Configuration module for Mumble Notes
 
 import os
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 
 from shared.config import ConfigHandler
 
-# Default configuration
-DEFAULTS: Dict[str, Any] = {
+# Default configuration (read-only so the sections cannot be swapped out)
+DEFAULTS: Mapping[str, Any] = MappingProxyType({
     # Window settings
     'window': {
         'width': 1200,
@@ -55,6 +56,13 @@ DEFAULTS: Dict[str, Any] = {
         'auto_punctuate': True,
         'capitalize_sentences': True,
     }
+})
+
+# Expected value type for each default setting, built once from DEFAULTS.
+# Settings that default to None accept any value.
+SETTING_TYPES: Dict[str, Dict[str, type]] = {
+    section: {key: type(value) for key, value in values.items() if value is not None}
+    for section, values in DEFAULTS.items()
 }
 
 class NotesConfig:
@@ -65,58 +73,98 @@ class NotesConfig:
         config_dir = Path(__file__).parent
         self.handler = ConfigHandler('notes', config_dir, DEFAULTS)
         
+        # Section dicts fetched from the handler, invalidated on reset
+        self._sections: Dict[str, Dict[str, Any]] = {}
+        
         # Ensure document storage directory exists
         self.documents_path.mkdir(parents=True, exist_ok=True)
         
+    def _section(self, name: str) -> Dict[str, Any]:
+        """Get a settings section, fetching it from the handler once"""
+        section = self._sections.get(name)
+        if section is None:
+            section = self.handler.config.get(name)
+            if section is None:
+                # Missing from the file: add a copy of the defaults, marked
+                # unsaved so the next save writes it
+                section = self.handler.patch(name, {}, save=False)
+            self._sections[name] = section
+        return section
+        
+    def _check_types(self, name: str, updates: Dict[str, Any]) -> None:
+        """Raise ValueError if any update does not match its default's type"""
+        types = SETTING_TYPES[name]
+        for key, value in updates.items():
+            expected = types.get(key)
+            if expected is None or type(value) is expected:
+                continue
+            # Whole numbers are fine where the default is a float
+            if expected is float and type(value) is int:
+                continue
+            raise ValueError(
+                f"Invalid {name} setting {key!r}: expected {expected.__name__}, "
+                f"got {type(value).__name__}"
+            )
+            
+    def _update_section(self, name: str, updates: Dict[str, Any]) -> None:
+        """Update a settings section in place and persist it"""
+        self._check_types(name, updates)
+        self._sections[name] = self.handler.patch(name, updates)
+        
+    def get_settings(self, name: str) -> Dict[str, Any]:
+        """Get a settings section by name"""
+        return self._section(name)
+        
+    def update_settings(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """Update several settings sections and persist them once"""
+        # Check every section first so a bad value changes nothing
+        for name, section_updates in updates.items():
+            self._check_types(name, section_updates)
+        for name, section_updates in updates.items():
+            self._section(name).update(section_updates)
+        self.handler.update({name: self._section(name) for name in updates})
+        
     @property
     def documents_path(self) -> Path:
         """Get path to documents storage"""
-        storage_path = self.handler.get('documents')['storage_path']
+        storage_path = self._section('documents')['storage_path']
         return Path(self.handler.config_dir) / storage_path
         
     @property
     def window_settings(self) -> Dict[str, Any]:
         """Get window settings"""
-        return self.handler.get('window')
+        return self._section('window')
         
     def update_window_settings(self, updates: Dict[str, Any]) -> None:
         """Update window settings"""
-        current = self.window_settings
-        current.update(updates)
-        self.handler.set('window', current)
+        self._update_section('window', updates)
         
     @property
     def editor_settings(self) -> Dict[str, Any]:
         """Get editor settings"""
-        return self.handler.get('editor')
+        return self._section('editor')
         
     def update_editor_settings(self, updates: Dict[str, Any]) -> None:
         """Update editor settings"""
-        current = self.editor_settings
-        current.update(updates)
-        self.handler.set('editor', current)
+        self._update_section('editor', updates)
         
     @property
     def theme_settings(self) -> Dict[str, Any]:
         """Get theme settings"""
-        return self.handler.get('theme')
+        return self._section('theme')
         
     def update_theme_settings(self, updates: Dict[str, Any]) -> None:
         """Update theme settings"""
-        current = self.theme_settings
-        current.update(updates)
-        self.handler.set('theme', current)
+        self._update_section('theme', updates)
         
     @property
     def document_settings(self) -> Dict[str, Any]:
         """Get document settings"""
-        return self.handler.get('documents')
+        return self._section('documents')
         
     def update_document_settings(self, updates: Dict[str, Any]) -> None:
         """Update document settings"""
-        current = self.document_settings
-        current.update(updates)
-        self.handler.set('documents', current)
+        self._update_section('documents', updates)
         
     def add_category(self, category: str) -> None:
         """Add a new document category"""
@@ -135,13 +183,11 @@ class NotesConfig:
     @property
     def speech_settings(self) -> Dict[str, Any]:
         """Get speech recognition settings"""
-        return self.handler.get('speech')
+        return self._section('speech')
         
     def update_speech_settings(self, updates: Dict[str, Any]) -> None:
         """Update speech recognition settings"""
-        current = self.speech_settings
-        current.update(updates)
-        self.handler.set('speech', current)
+        self._update_section('speech', updates)
         
     def save_window_position(self, x: int, y: int, width: int, height: int, maximized: bool) -> None:
         """Save window position and size"""
@@ -154,4 +200,5 @@ class NotesConfig:
         
     def reset_to_defaults(self) -> None:
         """Reset all settings to defaults"""
-        self.handler.reset() 
\ No newline at end of file
+        self.handler.reset()
+        self._sections.clear() 
\ No newline at end of file
@@ -27,3 +27,11 @@ def speech_manager(mock_recognizer):
         callback = MagicMock()
         manager = SpeechManager(callback)
         yield manager, callback
+
+@pytest.fixture(autouse=True)
+def _stub_dialogs(monkeypatch):
+    """Answer modal dialogs without opening them; tests override as needed"""
+    monkeypatch.setattr('tkinter.messagebox.askyesno', lambda *a, **k: True)
+    monkeypatch.setattr('tkinter.messagebox.showinfo', lambda *a, **k: None)
+    monkeypatch.setattr('tkinter.messagebox.showerror', lambda *a, **k: None)
+    monkeypatch.setattr('tkinter.colorchooser.askcolor', lambda *a, **k: ('#FFFFFF', '#FFFFFF'))
@@ -2,17 +2,19 @@
 Tests for the document manager component
 """
 
+import time
 import pytest
 import tkinter as tk
 from tkinter import ttk
 from unittest.mock import MagicMock, patch
 import logging
+from collections.abc import Mapping
 
 from ..ui.document_manager import DocumentManager
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def root():
-    """Create root window"""
+    """Create root window shared by the module's tests"""
     root = tk.Tk()
     yield root
     root.destroy()
@@ -21,7 +23,33 @@ def root():
 def manager(root):
     """Create DocumentManager instance"""
     manager = DocumentManager(root)
-    return manager
+    yield manager
+    manager.destroy()
+
+# Documents shared by the read-only tests
+FILTER_DOCS = [
+    ("Test 1", "Content 1"),
+    ("Test 2", "Content 2"),
+    ("Other 1", "Content 3"),
+    ("Other 2", "Content 4"),
+    ("Mixed Test", "Content 5")
+]
+PERF_DOCS = [(f"Perf Doc {i}", f"Content {i}") for i in range(100)]
+LARGE_DOC = ("Large Doc", "Test content\n" * 1000)
+
+@pytest.fixture(scope='module')
+def shared_manager(root):
+    """Create one DocumentManager populated for the read-only tests"""
+    manager = DocumentManager(root)
+    manager.add_documents(FILTER_DOCS + PERF_DOCS + [LARGE_DOC])
+    yield manager
+    manager.destroy()
+
+@pytest.fixture
+def populated_manager(shared_manager):
+    """Provide the shared populated manager, clearing its search afterwards"""
+    yield shared_manager
+    shared_manager.clear_search()
 
 def test_initialization(manager):
     """Test document manager initialization"""
@@ -30,25 +58,16 @@ def test_initialization(manager):
     assert manager.grid_info()['column'] == 0
     
     # Test search bar setup
-    search_frame = None
-    for child in manager.winfo_children():
-        if isinstance(child, ttk.Frame):
-            if child.winfo_children()[0].winfo_class() == 'TEntry':
-                search_frame = child
-                break
-    assert search_frame is not None
+    assert isinstance(manager.search_frame, ttk.Frame)
+    assert isinstance(manager.search_entry, ttk.Entry)
+    assert manager.search_entry.master is manager.search_frame
     
     # Test tree view setup
-    tree_frame = None
-    for child in manager.winfo_children():
-        if isinstance(child, ttk.Frame):
-            if child.winfo_children()[0].winfo_class() == 'Treeview':
-                tree_frame = child
-                break
-    assert tree_frame is not None
+    assert isinstance(manager.tree_frame, ttk.Frame)
+    assert manager.tree.master is manager.tree_frame
     
     # Test initial state
-    assert isinstance(manager.documents, dict)
+    assert isinstance(manager.documents, Mapping)
     assert manager.current_document is None
 
 def test_search_bar(manager):
@@ -60,6 +79,7 @@ def test_search_bar(manager):
     
     # Test search filtering
     manager.search_var.set("Test")
+    manager.flush_search()
     
     # Get visible items
     visible_items = manager.tree.get_children()
@@ -78,7 +98,7 @@ def test_document_operations(manager):
     assert len(manager.documents) == 1
     assert len(manager.tree.get_children()) == 1
     
-    doc_id = list(manager.documents.keys())[0]
+    doc_id = next(iter(manager.documents))
     doc = manager.documents[doc_id]
     assert doc['title'] == "Test Doc"
     assert doc['content'] == "Test content"
@@ -93,6 +113,31 @@ def test_document_operations(manager):
         manager.open_document()
         mock_info.assert_called_once()
 
+def test_add_documents(manager):
+    """Test bulk adding documents"""
+    initial_items = len(manager.tree.get_children())
+    manager.add_documents([("Bulk 1", "Content 1"), ("Bulk 2", "Content 2")])
+    
+    assert len(manager.tree.get_children()) == initial_items + 2
+    assert manager.tree.grid_info()['row'] == 0
+    last_id = manager.tree.get_children()[-1]
+    assert manager.tree.item(last_id, 'text') == "Bulk 2"
+    assert manager.documents[last_id]['content'] == "Content 2"
+
+def test_document_removal(manager):
+    """Test removing a document keeps the remaining ones searchable"""
+    manager.add_document("Keep Me", "Content 1")
+    first_id = list(manager.documents)[0]
+    del manager.documents[first_id]
+    
+    assert first_id not in manager.documents
+    assert not manager.tree.exists(first_id)
+    assert [doc['title'] for doc in manager.documents.values()] == ["Getting Started", "Keep Me"]
+    
+    manager.search_var.set("keep")
+    manager.flush_search()
+    assert [manager.tree.item(item)['text'] for item in manager.tree.get_children()] == ["Keep Me"]
+
 def test_error_handling(manager):
     """Test error handling"""
     # Test adding document with error
@@ -101,33 +146,154 @@ def test_error_handling(manager):
         manager.add_document("Test Doc", "Content")
         mock_error.assert_called_once()
 
-def test_document_filtering(manager):
+def test_document_filtering(populated_manager):
     """Test document filtering"""
-    # Add test documents
-    docs = [
-        ("Test 1", "Content 1"),
-        ("Test 2", "Content 2"),
-        ("Other 1", "Content 3"),
-        ("Other 2", "Content 4"),
-        ("Mixed Test", "Content 5")
-    ]
-    for title, content in docs:
-        manager.add_document(title, content)
-    
     # Test various search terms
     test_cases = [
         ("Test", 3),  # Should find 3 documents with "Test"
         ("Other", 2),  # Should find 2 documents with "Other"
         ("Mixed", 1),  # Should find 1 document with "Mixed"
         ("Nonexistent", 0),  # Should find no documents
-        ("", 5)  # Should show all documents
+        ("", len(populated_manager.documents))  # Should show all documents
     ]
     
     for search_term, expected_count in test_cases:
-        manager.search_var.set(search_term)
-        visible_items = manager.tree.get_children()
+        populated_manager.search_var.set(search_term)
+        populated_manager.flush_search()
+        visible_items = populated_manager.tree.get_children()
         assert len(visible_items) == expected_count
 
+def test_search_debounce(manager):
+    """Test rapid search edits coalesce into one filter pass"""
+    with patch.object(manager, 'filter_documents') as mock_filter:
+        for term in ("T", "Te", "Tes", "Test"):
+            manager.search_var.set(term)
+        mock_filter.assert_not_called()
+        
+        manager.flush_search()
+        mock_filter.assert_called_once()
+
+def test_filter_hides_rows_without_deleting(manager):
+    """Test filtering detaches rows and restores them in order"""
+    original = manager.tree.get_children()
+    manager.add_document("Hidden Doc", "Content")
+    hidden_id = manager.tree.get_children()[-1]
+    
+    manager.search_var.set("Welcome")
+    manager.flush_search()
+    assert hidden_id not in manager.tree.get_children()
+    assert manager.tree.exists(hidden_id)
+    
+    manager.clear_search()
+    assert manager.tree.get_children() == original + (hidden_id,)
+
+def test_empty_search_skips_title_matching(manager):
+    """Test clearing the search restores rows without scanning titles"""
+    manager.search_var.set("Welcome")
+    manager.flush_search()
+    assert len(manager.tree.get_children()) == 1
+    
+    manager._titles_cf = None  # Any title scan would now fail
+    manager.clear_search()
+    assert len(manager.tree.get_children()) == 2
+    assert not manager._detached
+
+def test_destroy_cancels_pending_filter(root):
+    """Test destroying the manager cancels a pending debounced filter"""
+    manager = DocumentManager(root)
+    manager.search_var.set("Welcome")
+    job = manager._filter_job
+    assert job is not None
+    
+    manager.destroy()
+    assert manager._filter_job is None
+    assert job not in root.tk.call('after', 'info')
+
+def test_repeated_search_skips_filter_pass(manager):
+    """Test re-running the same search leaves the tree untouched"""
+    manager.search_var.set("welcome")
+    manager.flush_search()
+    
+    with patch.object(manager.tree, 'detach') as mock_detach:
+        manager.search_var.set("WELCOME")
+        manager.flush_search()
+        mock_detach.assert_not_called()
+    assert len(manager.tree.get_children()) == 1
+
+def test_narrowing_search(manager):
+    """Test narrowing searches stay correct as documents are added"""
+    manager.add_document("Alpha", "Content 1")
+    manager.add_document("Alphabet", "Content 2")
+    
+    manager.search_var.set("alpha")
+    manager.flush_search()
+    assert len(manager.tree.get_children()) == 2
+    
+    manager.search_var.set("alphab")
+    manager.flush_search()
+    assert [manager.tree.item(item)['text'] for item in manager.tree.get_children()] == ["Alphabet"]
+    
+    # Extending a term with no matches returns without touching the tree
+    manager.search_var.set("alphaz")
+    manager.flush_search()
+    with patch.object(manager.tree, 'detach') as mock_detach:
+        manager.search_var.set("alphazz")
+        manager.flush_search()
+        mock_detach.assert_not_called()
+    assert manager.tree.get_children() == ()
+    
+    # A new document must be found even though the term keeps narrowing
+    manager.add_document("Alphabetical", "Content 3")
+    manager.search_var.set("alphabe")
+    manager.flush_search()
+    assert len(manager.tree.get_children()) == 2
+
+def test_search_is_case_insensitive(manager):
+    """Test search matches titles regardless of case"""
+    manager.add_document("STRASSE Notes", "Content")
+    
+    manager.search_var.set("straße")
+    manager.flush_search()
+    assert [manager.tree.item(item)['text'] for item in manager.tree.get_children()] == ["STRASSE Notes"]
+
+def test_bigram_index_follows_title_changes(manager):
+    """Test the title bigram index tracks renamed and removed documents"""
+    manager.add_document("Old Name", "Content")
+    doc_id = manager.tree.get_children()[-1]
+    manager.documents[doc_id] = {'title': "New Name", 'content': "Content"}
+    assert manager.tree.item(doc_id, 'text') == "New Name"
+    
+    assert doc_id not in manager._bigrams.get("ol", set())
+    assert manager._bigram_candidates("new") == [manager._id_to_idx[doc_id]]
+    
+    manager.search_var.set("new name")
+    manager.flush_search()
+    assert manager.tree.get_children() == (doc_id,)
+    
+    del manager.documents[doc_id]
+    assert manager._bigram_candidates("new") == []
+    assert not manager.tree.exists(doc_id)
+    
+    # Removing a hidden document also forgets that it was hidden
+    manager.add_document("Hidden", "Content")
+    hidden_id = manager.tree.get_children()[-1]
+    manager.search_var.set("welcome")
+    manager.flush_search()
+    assert hidden_id in manager._detached
+    del manager.documents[hidden_id]
+    assert hidden_id not in manager._detached
+    manager.clear_search()
+    assert hidden_id not in manager.documents
+
+def test_document_fields_are_read_only(manager):
+    """Test that editing a field of a fetched document raises instead of being lost"""
+    manager.add_document("Title", "Content")
+    doc_id = manager.tree.get_children()[-1]
+    
+    with pytest.raises(TypeError):
+        manager.documents[doc_id]['title'] = "Other"
+    assert manager.documents[doc_id]['title'] == "Title"
+
 def test_tree_view_interaction(manager):
     """Test tree view interactions"""
     # Add test document
@@ -156,66 +322,67 @@ def test_document_persistence(manager):
         manager.add_document(title, content)
     
     # Verify documents are stored
+    expected_titles = {title for title, _ in docs}
     assert len(manager.documents) == 3
-    assert all(doc['title'] in [d[0] for d in docs] 
-              for doc in manager.documents.values())
+    assert all(doc['title'] in expected_titles for doc in manager.documents.values())
     
     # Test document loading (currently uses dummy data)
     manager.documents.clear()
-    manager.tree.delete(*manager.tree.get_children())
+    assert manager.tree.get_children() == ()
     manager.load_documents()
     assert len(manager.documents) > 0
 
-def test_search_performance(manager):
+def test_search_performance(populated_manager):
     """Test search performance with many documents"""
-    # Add many documents
-    for i in range(100):
-        manager.add_document(f"Test Doc {i}", f"Content {i}")
-    
     # Measure search time
-    start_time = manager.tree.tk.call('clock', 'milliseconds')
-    manager.search_var.set("Test")
-    end_time = manager.tree.tk.call('clock', 'milliseconds')
+    start_time = time.perf_counter_ns()
+    populated_manager.search_var.set("Perf")
+    populated_manager.flush_search()
+    end_time = time.perf_counter_ns()
+    
+    assert len(populated_manager.tree.get_children()) == len(PERF_DOCS)
     
     # Verify search is reasonably fast
-    assert end_time - start_time < 100  # Should take less than 100ms
+    assert end_time - start_time < 100_000_000  # Should take less than 100ms
 
 def test_memory_management(manager):
     """Test memory management"""
     initial_items = len(manager.tree.get_children())
     
     # Add and remove documents multiple times
-    for i in range(100):
-        manager.add_document(f"Test {i}", f"Content {i}")
+    manager.add_documents((f"Test {i}", f"Content {i}") for i in range(100))
     
-    for item in manager.tree.get_children():
-        manager.tree.delete(item)
+    for doc_id in list(manager.documents)[initial_items:]:
+        del manager.documents[doc_id]
     
     # Verify cleanup
     assert len(manager.tree.get_children()) == initial_items
+    assert len(manager.documents) == initial_items
 
-def test_large_document_handling(manager):
+def test_large_document_handling(populated_manager):
     """Test handling of large documents"""
-    # Create a large document
-    large_content = "Test content\n" * 1000
-    manager.add_document("Large Doc", large_content)
-    
     # Test search performance with large content
-    start_time = manager.tree.tk.call('clock', 'milliseconds')
-    manager.search_var.set("Large")
-    end_time = manager.tree.tk.call('clock', 'milliseconds')
+    start_time = time.perf_counter_ns()
+    populated_manager.search_var.set("Large")
+    populated_manager.flush_search()
+    end_time = time.perf_counter_ns()
+    
+    assert len(populated_manager.tree.get_children()) == 1
     
     # Verify search remains responsive
-    assert end_time - start_time < 100  # Should take less than 100ms
+    assert end_time - start_time < 100_000_000  # Should take less than 100ms
 
 def test_concurrent_operations(manager):
     """Test concurrent operations"""
     # Simulate rapid document additions and searches
+    manager.add_documents((f"Doc {i}", f"Content {i}") for i in range(10))
     for i in range(10):
-        manager.add_document(f"Doc {i}", f"Content {i}")
         manager.search_var.set(str(i))
-        manager.tree.selection_set(manager.tree.get_children()[-1])
-        manager.on_select(None)
+    manager.flush_search()
+    
+    last_item = manager.tree.get_children()[-1]
+    manager.select_documents([last_item])
+    assert manager.tree.selection() == (last_item,)
     
     # Verify final state is consistent
     assert len(manager.documents) == 10
@@ -2,17 +2,19 @@
 Tests for the rich text editor component
 """
 
+import time
 import pytest
 import tkinter as tk
 from tkinter import ttk, font
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 import logging
 
-from ..ui.editor import RichTextEditor
+from ..ui.editor import RichTextEditor, _font_spec
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def root():
-    """Create root window"""
+    """Create root window shared by the module's tests"""
     root = tk.Tk()
     yield root
     root.destroy()
@@ -21,7 +23,11 @@ def root():
 def editor(root):
     """Create RichTextEditor instance"""
     editor = RichTextEditor(root)
-    return editor
+    yield editor
+    editor.destroy()
+    # Drop toolbar mocks tests attach to the shared root
+    for attr in ('font_family', 'font_size'):
+        vars(root).pop(attr, None)
 
 def test_initialization(editor):
     """Test editor initialization"""
@@ -36,13 +42,8 @@ def test_initialization(editor):
     assert isinstance(editor.text.cget('font'), str)
     
     # Test scrollbar setup
-    scrollbar = None
-    for child in editor.winfo_children():
-        if isinstance(child, ttk.Scrollbar):
-            scrollbar = child
-            break
-    assert scrollbar is not None
-    assert scrollbar.cget('orient') == 'vertical'
+    assert isinstance(editor.scrollbar, ttk.Scrollbar)
+    assert editor.scrollbar.cget('orient') == 'vertical'
     
     # Test initial font settings
     assert editor.current_font == {
@@ -87,12 +88,19 @@ def test_font_application(editor):
     assert editor.current_font['family'] == 'Times New Roman'
     assert editor.current_font['size'] == 14
     
-    # Check custom tag
-    custom_font = editor.text.tag_cget('custom', 'font')
+    # Check the style tag
+    custom_font = editor.text.tag_cget(editor._font_tag(), 'font')
     assert isinstance(custom_font, str)
     assert 'Times New Roman' in custom_font
     assert '14' in custom_font
 
+def test_font_spec_cache():
+    """Test font specs are built once per combination"""
+    _font_spec.cache_clear()
+    assert _font_spec('Times New Roman', 14, True, True) == '{Times New Roman} 14 bold italic'
+    _font_spec('Times New Roman', 14, True, True)
+    assert _font_spec.cache_info().hits == 1
+
 def test_bold_toggle(editor):
     """Test bold formatting toggle"""
     # Insert text and select it
@@ -105,8 +113,8 @@ def test_bold_toggle(editor):
     
     # Verify bold tag
     tags = editor.text.tag_names('1.0')
-    assert 'custom' in tags
-    custom_font = editor.text.tag_cget('custom', 'font')
+    assert editor._font_tag() in tags
+    custom_font = editor.text.tag_cget(editor._font_tag(), 'font')
     assert 'bold' in custom_font
     
     # Toggle bold off
@@ -125,8 +133,8 @@ def test_italic_toggle(editor):
     
     # Verify italic tag
     tags = editor.text.tag_names('1.0')
-    assert 'custom' in tags
-    custom_font = editor.text.tag_cget('custom', 'font')
+    assert editor._font_tag() in tags
+    custom_font = editor.text.tag_cget(editor._font_tag(), 'font')
     assert 'italic' in custom_font
     
     # Toggle italic off
@@ -163,25 +171,88 @@ def test_text_insertion(editor):
     editor.insert_text(" Bold text")
     assert editor.text.get('1.0', 'end-1c') == "Hello, world! Bold text"
     
-    # Verify formatting tags
-    tags = editor.text.tag_names('end-1c')
-    assert 'custom' in tags
+    # Verify formatting tags on the last inserted character
+    tags = editor.text.tag_names('end-2c')
+    assert editor._font_tag() in tags
+    assert editor._font_tag() not in editor.text.tag_names('1.0')
+
+def test_formatting_applies_to_inserted_text(editor):
+    """Test toggles without a selection format the next insertion"""
+    editor.toggle_bold()
+    editor.toggle_underline()
+    assert editor.text.tag_ranges(editor._font_tag()) == ()
+    
+    editor.insert_text("Styled")
+    tags = editor.text.tag_names('1.0')
+    assert editor._font_tag() in tags
+    assert 'underline' in tags
+
+def test_font_change_applies_to_inserted_text(editor):
+    """Test a family or size change without a selection styles new text"""
+    editor.master.font_family = MagicMock()
+    editor.master.font_size = MagicMock()
+    editor.master.font_family.get.return_value = 'Times New Roman'
+    editor.master.font_size.get.return_value = '14'
+    
+    editor.apply_font()
+    editor.insert_text("Styled")
+    tag = editor._font_tag()
+    assert tag in editor.text.tag_names('1.0')
+    assert 'Times New Roman' in editor.text.tag_cget(tag, 'font')
+
+def test_typed_characters_take_armed_styles(editor):
+    """Test keys typed after arming a style without a selection are styled"""
+    key = SimpleNamespace(char='a', state=0)
+    assert editor._on_key(key) is None  # Nothing armed: default binding types
+    
+    editor.toggle_bold()
+    assert editor._on_key(key) == 'break'
+    assert editor.text.get('1.0', 'end-1c') == 'a'
+    assert editor._font_tag() in editor.text.tag_names('1.0')
+    
+    # Shortcuts and non-printable keys are left to the default bindings
+    assert editor._on_key(SimpleNamespace(char='c', state=0x4)) is None
+    assert editor._on_key(SimpleNamespace(char='\r', state=0)) is None
+    assert editor._on_key(SimpleNamespace(char='', state=0)) is None
+
+def test_font_tags_reused_per_style(editor):
+    """Test each style combination gets one tag that is never reconfigured"""
+    editor.text.insert('1.0', 'Bold Italic')
+    editor.text.tag_add('sel', '1.0', '1.4')
+    editor.toggle_bold()
+    bold_tag = editor._font_tag()
+    
+    editor.text.tag_remove('sel', '1.0', 'end')
+    editor.text.tag_add('sel', '1.5', '1.11')
+    editor.toggle_bold()
+    editor.toggle_italic()
+    italic_tag = editor._font_tag()
+    
+    assert bold_tag != italic_tag
+    assert 'bold' in editor.text.tag_cget(bold_tag, 'font')
+    assert bold_tag in editor.text.tag_names('1.0')
+    assert italic_tag not in editor.text.tag_names('1.0')
+    
+    # Returning to a style reuses its tag
+    editor.toggle_italic()
+    editor.toggle_bold()
+    assert editor._font_tag() == bold_tag
+    assert len(editor._font_tags) == 3
 
-def test_new_document(editor):
+def test_new_document(editor, monkeypatch):
     """Test new document creation"""
     # Insert some text
     editor.text.insert('1.0', 'Existing content')
     
-    # Mock messagebox.askyesno to return True
-    with patch('tkinter.messagebox.askyesno', return_value=True):
-        editor.new_document()
-        assert editor.text.get('1.0', 'end-1c') == ""
+    # The stubbed confirmation answers yes
+    editor.new_document()
+    assert editor.text.get('1.0', 'end-1c') == ""
     
-    # Mock messagebox.askyesno to return False
+    # Make messagebox.askyesno return False
     editor.text.insert('1.0', 'Content to keep')
-    with patch('tkinter.messagebox.askyesno', return_value=False):
-        editor.new_document()
-        assert editor.text.get('1.0', 'end-1c') == "Content to keep"
+    monkeypatch.setattr('tkinter.messagebox.askyesno', lambda *a, **k: False)
+    editor.new_document()
+    assert editor.text.get('1.0', 'end-1c') == "Content to keep"
 
 def test_error_handling(editor):
     """Test error handling"""
@@ -199,6 +270,21 @@ def test_error_handling(editor):
         editor.insert_text("Test")
         mock_error.assert_called_once()
 
+def test_batch(editor):
+    """Test running several text commands in one script"""
+    editor.batch([
+        ('insert', 'end', "Hello"),
+        ('insert', 'end', ", world"),
+        ('tag', 'add', 'bold', '1.0', '1.5'),
+    ])
+    assert editor.text.get('1.0', 'end-1c') == "Hello, world"
+    assert 'bold' in editor.text.tag_names('1.0')
+    
+    # Tcl syntax in the text is inserted literally, not evaluated
+    editor.text.delete('1.0', 'end')
+    editor.batch([('insert', 'end', "[exit] {unbalanced $x; ")])
+    assert editor.text.get('1.0', 'end-1c') == "[exit] {unbalanced $x; "
+
 def test_undo_redo(editor):
     """Test undo/redo functionality"""
     # Insert some text
@@ -228,8 +314,8 @@ def test_multiple_selections(editor):
         editor.toggle_bold()
         
         # Verify both selections are formatted
-        assert 'custom' in editor.text.tag_names('1.0')
-        assert 'custom' in editor.text.tag_names('1.13')
+        assert editor._font_tag() in editor.text.tag_names('1.0')
+        assert editor._font_tag() in editor.text.tag_names('1.13')
     except tk.TclError:
         # Multiple selections not supported
         pass
@@ -238,24 +324,27 @@ def test_performance(editor):
     """Test editor performance with large text"""
     # Insert large amount of text
     large_text = "Test line\n" * 1000
-    start_time = editor.text.tk.call('clock', 'milliseconds')
+    start_time = time.perf_counter_ns()
     editor.insert_text(large_text)
-    end_time = editor.text.tk.call('clock', 'milliseconds')
+    end_time = time.perf_counter_ns()
     
     # Verify insertion time is reasonable
-    assert end_time - start_time < 1000  # Should take less than 1 second
+    assert end_time - start_time < 1_000_000_000  # Should take less than 1 second
 
 def test_memory_management(editor):
     """Test memory management with text operations"""
     initial_tags = len(editor.text.tag_names())
     
-    # Perform multiple formatting operations
+    # Perform multiple formatting operations, tagging and clearing the
+    # text in one Tcl script per iteration
     for _ in range(100):
-        editor.insert_text("Test")
         editor.toggle_bold()
         editor.toggle_italic()
         editor.toggle_underline()
-        editor.text.delete('1.0', 'end')
+        editor.batch([
+            ('insert', 'insert', "Test", editor._typing_tags()),
+            ('delete', '1.0', 'end'),
+        ])
     
     # Verify no tag leaks
     final_tags = len(editor.text.tag_names())
@@ -2,6 +2,7 @@
 Tests for Mumble Notes configuration
 """
 
+import io
 import pytest
 from pathlib import Path
 from typing import Dict, Any
@@ -14,56 +15,35 @@ def temp_config_dir(tmp_path) -> Path:
     return tmp_path / "config"
 
 @pytest.fixture
-def notes_config(temp_config_dir) -> NotesConfig:
-    """Create NotesConfig instance with temporary directory"""
+def notes_config(temp_config_dir, monkeypatch) -> NotesConfig:
+    """Create NotesConfig instance with temporary directory and in-memory file"""
     config = NotesConfig()
     config.handler.config_dir = temp_config_dir
     config.handler.config_file = temp_config_dir / "notes_config.json"
-    config.handler.save_config()
+    
+    # No test checks the on-disk format, so keep the config file in memory
+    buffer = io.StringIO()
+    
+    def write_file(data: str) -> None:
+        buffer.seek(0)
+        buffer.truncate()
+        buffer.write(data)
+        
+    monkeypatch.setattr(config.handler, '_read_file', lambda: buffer.getvalue() or None)
+    monkeypatch.setattr(config.handler, '_write_file', write_file)
     return config
 
 def test_default_values(notes_config):
     """Test default configuration values"""
-    # Window settings
-    window = notes_config.window_settings
-    assert window['width'] == DEFAULTS['window']['width']
-    assert window['height'] == DEFAULTS['window']['height']
-    assert window['position'] is None
-    assert window['maximized'] is False
-    
-    # Editor settings
-    editor = notes_config.editor_settings
-    assert editor['font_family'] == DEFAULTS['editor']['font_family']
-    assert editor['font_size'] == DEFAULTS['editor']['font_size']
-    assert editor['line_spacing'] == DEFAULTS['editor']['line_spacing']
-    assert editor['tab_size'] == DEFAULTS['editor']['tab_size']
-    assert editor['wrap_text'] == DEFAULTS['editor']['wrap_text']
-    assert editor['show_line_numbers'] == DEFAULTS['editor']['show_line_numbers']
-    assert editor['auto_save'] == DEFAULTS['editor']['auto_save']
-    assert editor['auto_save_interval'] == DEFAULTS['editor']['auto_save_interval']
-    
-    # Theme settings
-    theme = notes_config.theme_settings
-    assert theme['name'] == DEFAULTS['theme']['name']
-    assert theme['background_color'] == DEFAULTS['theme']['background_color']
-    assert theme['text_color'] == DEFAULTS['theme']['text_color']
-    assert theme['accent_color'] == DEFAULTS['theme']['accent_color']
-    assert theme['sidebar_width'] == DEFAULTS['theme']['sidebar_width']
-    
-    # Document settings
-    docs = notes_config.document_settings
-    assert docs['storage_path'] == DEFAULTS['documents']['storage_path']
-    assert docs['default_format'] == DEFAULTS['documents']['default_format']
-    assert docs['backup_enabled'] == DEFAULTS['documents']['backup_enabled']
-    assert docs['backup_count'] == DEFAULTS['documents']['backup_count']
-    assert docs['categories'] == DEFAULTS['documents']['categories']
+    assert notes_config.window_settings == DEFAULTS['window']
+    assert notes_config.editor_settings == DEFAULTS['editor']
+    assert notes_config.theme_settings == DEFAULTS['theme']
+    assert notes_config.document_settings == DEFAULTS['documents']
+    assert notes_config.speech_settings == DEFAULTS['speech']
     
-    # Speech settings
-    speech = notes_config.speech_settings
-    assert speech['language'] == DEFAULTS['speech']['language']
-    assert speech['ambient_duration'] == DEFAULTS['speech']['ambient_duration']
-    assert speech['auto_punctuate'] == DEFAULTS['speech']['auto_punctuate']
-    assert speech['capitalize_sentences'] == DEFAULTS['speech']['capitalize_sentences']
+    # Defaults are read-only
+    with pytest.raises(TypeError):
+        DEFAULTS['window'] = {}
 
 def test_update_window_settings(notes_config):
     """Test updating window settings"""
@@ -174,6 +154,64 @@ def test_add_remove_category(notes_config):
     # Remove nonexistent category
     notes_config.remove_category('Nonexistent')  # Should not raise error
 
+def test_category_edited_in_place(notes_config):
+    """Test category helpers see edits made directly to the categories list"""
+    notes_config.add_category('Work')  # already present
+    notes_config.document_settings['categories'][0] = 'Renamed'
+    
+    notes_config.add_category('Work')
+    assert notes_config.document_settings['categories'].count('Work') == 1
+    
+    notes_config.remove_category('Renamed')
+    assert 'Renamed' not in notes_config.document_settings['categories']
+
+def test_missing_section_does_not_share_defaults(notes_config):
+    """Test a section absent from the file is copied, not taken from DEFAULTS"""
+    del notes_config.handler.config['documents']
+    notes_config._sections.clear()
+    
+    notes_config.add_category('Test')
+    notes_config.update_settings({'documents': {'backup_count': 9}})
+    
+    assert 'Test' in notes_config.document_settings['categories']
+    assert 'Test' not in DEFAULTS['documents']['categories']
+    assert DEFAULTS['documents']['backup_count'] == 5
+
+def test_invalid_value_types(notes_config):
+    """Test updates with the wrong value type are rejected"""
+    with pytest.raises(ValueError):
+        notes_config.update_window_settings({'width': '1000'})
+    with pytest.raises(ValueError):
+        notes_config.update_editor_settings({'auto_save': 1})
+    with pytest.raises(ValueError):
+        notes_config.update_document_settings({'categories': 'Work'})
+    assert notes_config.window_settings['width'] == DEFAULTS['window']['width']
+    
+    # Whole numbers are accepted for float settings
+    notes_config.update_editor_settings({'line_spacing': 2})
+    assert notes_config.editor_settings['line_spacing'] == 2
+
+def test_update_settings(notes_config, monkeypatch):
+    """Test updating several sections saves the config once"""
+    writes = []
+    monkeypatch.setattr(notes_config.handler, '_write_file', writes.append)
+    
+    notes_config.update_settings({
+        'editor': {'font_size': 16},
+        'theme': {'name': 'alt'},
+    })
+    assert notes_config.editor_settings['font_size'] == 16
+    assert notes_config.theme_settings['name'] == 'alt'
+    assert len(writes) == 1
+    
+    # A bad value in any section leaves every section unchanged
+    with pytest.raises(ValueError):
+        notes_config.update_settings({
+            'editor': {'font_size': 20},
+            'speech': {'language': None},
+        })
+    assert notes_config.editor_settings['font_size'] == 16
+
 def test_save_window_position(notes_config):
     """Test saving window position"""
     notes_config.save_window_position(100, 200, 800, 600, False)
@@ -184,6 +222,25 @@ def test_save_window_position(notes_config):
     assert window['height'] == 600
     assert window['maximized'] is False
 
+def test_settings_persist_across_reload(notes_config):
+    """Test that saved settings are read back on reload"""
+    notes_config.update_editor_settings({'font_size': 16})
+    notes_config.handler.load_config()
+    assert notes_config.handler.get('editor')['font_size'] == 16
+
+def test_section_cache_refreshed_on_reset(notes_config):
+    """Test that settings sections are cached until a reset"""
+    editor = notes_config.editor_settings
+    assert notes_config.editor_settings is editor
+    
+    notes_config.update_editor_settings({'font_size': 14})
+    assert notes_config.editor_settings is editor
+    assert editor['font_size'] == 14
+    
+    notes_config.reset_to_defaults()
+    assert notes_config.editor_settings is notes_config.handler.get('editor')
+    assert notes_config.editor_settings['font_size'] == DEFAULTS['editor']['font_size']
+
 def test_documents_path(notes_config, temp_config_dir):
     """Test documents path resolution"""
     # Default path
@@ -2,41 +2,102 @@
 Tests for Mumble Notes settings dialog
 """
 
+import copy
 import pytest
 import tkinter as tk
 from tkinter import ttk
-from pathlib import Path
+from typing import Any, Dict
 from unittest.mock import MagicMock, patch
 
-from ..config.notes_config import NotesConfig
-from ..ui.settings_dialog import SettingsDialog
+from ..config.notes_config import NotesConfig, DEFAULTS
+from ..ui.settings_dialog import SettingsDialog, SETTING_FIELDS
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def root():
-    """Create root window"""
+    """Create a hidden root window shared by all tests"""
     root = tk.Tk()
+    root.withdraw()
     yield root
     root.destroy()
 
-@pytest.fixture
-def temp_config_dir(tmp_path) -> Path:
-    """Create temporary config directory"""
-    return tmp_path / "config"
+@pytest.fixture(scope="session")
+def default_config_data() -> Dict[str, Any]:
+    """Build the default configuration data once"""
+    return copy.deepcopy(dict(DEFAULTS))
 
-@pytest.fixture
-def notes_config(temp_config_dir) -> NotesConfig:
-    """Create NotesConfig instance with temporary directory"""
+def load_config_data(config: NotesConfig, config_data: Dict[str, Any]) -> None:
+    """Replace a NotesConfig's settings with a copy of in-memory data"""
+    config.handler.config = copy.deepcopy(config_data)
+    config._sections.clear()
+
+@pytest.fixture(scope="module")
+def notes_config(default_config_data) -> NotesConfig:
+    """Create NotesConfig instance backed by in-memory default data"""
     config = NotesConfig()
-    config.handler.config_dir = temp_config_dir
-    config.handler.config_file = temp_config_dir / "notes_config.json"
-    config.handler.save_config()
+    load_config_data(config, default_config_data)
+    
+    # The dialog tests only check in-memory settings; never write to disk
+    config.handler._write_file = lambda data: None
     return config
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dialog(root, notes_config):
-    """Create settings dialog"""
+    """Create one hidden settings dialog shared by the module's tests"""
     dialog = SettingsDialog(root, notes_config)
-    return dialog
+    dialog.withdraw()
+    
+    # Build every tab up front so each test can reach all widgets
+    for key in dialog._tab_builders:
+        dialog._build_tab(key)
+    yield dialog
+    if dialog.winfo_exists():
+        dialog.destroy()
+
+@pytest.fixture(autouse=True)
+def _reset_dialog(dialog, notes_config, default_config_data):
+    """Restore the default settings and reload them into the shared dialog"""
+    load_config_data(notes_config, default_config_data)
+    dialog._load_settings()
+
+# Widget attribute and expected type for every tab
+WIDGET_SPECS = [
+    # Editor tab
+    ("font_family", ttk.Combobox),
+    ("font_size", ttk.Spinbox),
+    ("font_size_var", tk.IntVar),
+    ("line_spacing", ttk.Spinbox),
+    ("line_spacing_var", tk.DoubleVar),
+    ("tab_size", ttk.Spinbox),
+    ("tab_size_var", tk.IntVar),
+    ("wrap_text", tk.BooleanVar),
+    ("show_line_numbers", tk.BooleanVar),
+    ("auto_save", tk.BooleanVar),
+    ("auto_save_interval", ttk.Spinbox),
+    ("auto_save_interval_var", tk.IntVar),
+    
+    # Theme tab
+    ("theme_name", ttk.Combobox),
+    ("bg_color", tk.StringVar),
+    ("text_color", tk.StringVar),
+    ("accent_color", tk.StringVar),
+    ("sidebar_width", ttk.Spinbox),
+    ("sidebar_width_var", tk.IntVar),
+    
+    # Documents tab
+    ("default_format", ttk.Combobox),
+    ("backup_enabled", tk.BooleanVar),
+    ("backup_count", ttk.Spinbox),
+    ("backup_count_var", tk.IntVar),
+    ("categories_list", tk.Listbox),
+    ("categories_var", tk.Variable),
+    
+    # Speech tab
+    ("language", ttk.Combobox),
+    ("ambient_duration", ttk.Spinbox),
+    ("ambient_duration_var", tk.DoubleVar),
+    ("auto_punctuate", tk.BooleanVar),
+    ("capitalize_sentences", tk.BooleanVar),
+]
 
 def test_dialog_initialization(dialog):
     """Test dialog initialization"""
@@ -44,104 +105,94 @@ def test_dialog_initialization(dialog):
     assert isinstance(dialog.notebook, ttk.Notebook)
     assert len(dialog.notebook.tabs()) == 4  # Editor, Theme, Documents, Speech
 
-def test_editor_tab_widgets(dialog):
-    """Test editor tab widgets"""
-    # Font settings
-    assert isinstance(dialog.font_family, ttk.Combobox)
-    assert isinstance(dialog.font_size, ttk.Spinbox)
-    assert isinstance(dialog.line_spacing, ttk.Spinbox)
-    assert isinstance(dialog.tab_size, ttk.Spinbox)
-    
-    # Checkboxes
-    assert isinstance(dialog.wrap_text, tk.BooleanVar)
-    assert isinstance(dialog.show_line_numbers, tk.BooleanVar)
-    assert isinstance(dialog.auto_save, tk.BooleanVar)
-    assert isinstance(dialog.auto_save_interval, ttk.Spinbox)
-
-def test_theme_tab_widgets(dialog):
-    """Test theme tab widgets"""
-    assert isinstance(dialog.theme_name, ttk.Combobox)
-    assert isinstance(dialog.bg_color, tk.StringVar)
-    assert isinstance(dialog.text_color, tk.StringVar)
-    assert isinstance(dialog.accent_color, tk.StringVar)
-    assert isinstance(dialog.sidebar_width, ttk.Spinbox)
-
-def test_documents_tab_widgets(dialog):
-    """Test documents tab widgets"""
-    assert isinstance(dialog.default_format, ttk.Combobox)
-    assert isinstance(dialog.backup_enabled, tk.BooleanVar)
-    assert isinstance(dialog.backup_count, ttk.Spinbox)
-    assert isinstance(dialog.categories_list, tk.Listbox)
-
-def test_speech_tab_widgets(dialog):
-    """Test speech tab widgets"""
-    assert isinstance(dialog.language, ttk.Combobox)
-    assert isinstance(dialog.ambient_duration, ttk.Spinbox)
-    assert isinstance(dialog.auto_punctuate, tk.BooleanVar)
-    assert isinstance(dialog.capitalize_sentences, tk.BooleanVar)
+def test_tabs_built_on_first_selection(root, notes_config):
+    """Test only the first tab is built until another tab is selected"""
+    dialog = SettingsDialog(root, notes_config)
+    try:
+        assert dialog._tab_loaded == {'editor'}
+        assert not hasattr(dialog, 'language')
+        
+        dialog.notebook.select(dialog.speech_tab)
+        dialog._on_tab_changed()
+        assert dialog._tab_loaded == {'editor', 'speech'}
+        assert dialog.language.get() == notes_config.speech_settings['language']
+    finally:
+        dialog.destroy()
+
+@pytest.mark.parametrize("attr,widget_type", WIDGET_SPECS)
+def test_tab_widgets(dialog, attr, widget_type):
+    """Test each tab widget exists with the expected type"""
+    assert isinstance(getattr(dialog, attr), widget_type)
+
+def test_setting_fields_match_defaults():
+    """Test every mapped field names a real setting in its section"""
+    for section, fields in SETTING_FIELDS.items():
+        for attr, name in fields:
+            assert name in DEFAULTS[section]
 
 def test_load_settings(dialog, notes_config):
     """Test loading settings into UI"""
     # Editor settings
     assert dialog.font_family.get() == notes_config.editor_settings['font_family']
-    assert int(dialog.font_size.get()) == notes_config.editor_settings['font_size']
-    assert float(dialog.line_spacing.get()) == notes_config.editor_settings['line_spacing']
-    assert int(dialog.tab_size.get()) == notes_config.editor_settings['tab_size']
+    assert dialog.font_size_var.get() == notes_config.editor_settings['font_size']
+    assert dialog.line_spacing_var.get() == notes_config.editor_settings['line_spacing']
+    assert dialog.tab_size_var.get() == notes_config.editor_settings['tab_size']
     assert dialog.wrap_text.get() == notes_config.editor_settings['wrap_text']
     assert dialog.show_line_numbers.get() == notes_config.editor_settings['show_line_numbers']
     assert dialog.auto_save.get() == notes_config.editor_settings['auto_save']
-    assert int(dialog.auto_save_interval.get()) == notes_config.editor_settings['auto_save_interval']
+    assert dialog.auto_save_interval_var.get() == notes_config.editor_settings['auto_save_interval']
     
     # Theme settings
     assert dialog.theme_name.get() == notes_config.theme_settings['name']
     assert dialog.bg_color.get() == notes_config.theme_settings['background_color']
     assert dialog.text_color.get() == notes_config.theme_settings['text_color']
     assert dialog.accent_color.get() == notes_config.theme_settings['accent_color']
-    assert int(dialog.sidebar_width.get()) == notes_config.theme_settings['sidebar_width']
+    assert dialog.sidebar_width_var.get() == notes_config.theme_settings['sidebar_width']
     
     # Document settings
     assert dialog.default_format.get() == notes_config.document_settings['default_format']
     assert dialog.backup_enabled.get() == notes_config.document_settings['backup_enabled']
-    assert int(dialog.backup_count.get()) == notes_config.document_settings['backup_count']
+    assert dialog.backup_count_var.get() == notes_config.document_settings['backup_count']
     categories = list(dialog.categories_list.get(0, tk.END))
     assert categories == notes_config.document_settings['categories']
     
     # Speech settings
     assert dialog.language.get() == notes_config.speech_settings['language']
-    assert float(dialog.ambient_duration.get()) == notes_config.speech_settings['ambient_duration']
+    assert dialog.ambient_duration_var.get() == notes_config.speech_settings['ambient_duration']
     assert dialog.auto_punctuate.get() == notes_config.speech_settings['auto_punctuate']
     assert dialog.capitalize_sentences.get() == notes_config.speech_settings['capitalize_sentences']
 
-def test_apply_settings(dialog, notes_config):
+def test_apply_settings(dialog, notes_config, monkeypatch):
     """Test applying settings from UI"""
     # Modify UI values
     dialog.font_family.set('Courier New')
-    dialog.font_size.set('14')
-    dialog.line_spacing.set('1.5')
-    dialog.tab_size.set('2')
+    dialog.font_size_var.set(14)
+    dialog.line_spacing_var.set(1.5)
+    dialog.tab_size_var.set(2)
     dialog.wrap_text.set(False)
     dialog.show_line_numbers.set(True)
     dialog.auto_save.set(False)
-    dialog.auto_save_interval.set('600')
+    dialog.auto_save_interval_var.set(600)
     
     dialog.theme_name.set('dark')
     dialog.bg_color.set('#000000')
     dialog.text_color.set('#FFFFFF')
     dialog.accent_color.set('#FF0000')
-    dialog.sidebar_width.set('300')
+    dialog.sidebar_width_var.set(300)
     
     dialog.default_format.set('md')
     dialog.backup_enabled.set(False)
-    dialog.backup_count.set('3')
+    dialog.backup_count_var.set(3)
     dialog.categories_list.delete(0, tk.END)
     dialog.categories_list.insert(tk.END, 'Test')
     
     dialog.language.set('en-GB')
-    dialog.ambient_duration.set('1.0')
+    dialog.ambient_duration_var.set(1.0)
     dialog.auto_punctuate.set(False)
     dialog.capitalize_sentences.set(False)
     
-    # Apply settings
+    # Apply settings, keeping the shared dialog open
+    monkeypatch.setattr(dialog, 'destroy', lambda: None)
     dialog._apply_settings()
     
     # Verify config values
@@ -174,6 +225,28 @@ def test_apply_settings(dialog, notes_config):
     assert speech['auto_punctuate'] is False
     assert speech['capitalize_sentences'] is False
 
+def test_apply_skips_unchanged_settings(dialog, notes_config, monkeypatch):
+    """Test applying without edits does not update the config"""
+    monkeypatch.setattr(dialog, 'destroy', lambda: None)
+    with patch.object(notes_config, 'update_settings') as mock_update:
+        dialog._apply_settings()
+        mock_update.assert_not_called()
+        
+        dialog.theme_name.set('alt')
+        dialog._apply_settings()
+        mock_update.assert_called_once()
+        assert list(mock_update.call_args[0][0]) == ['theme']
+
+def test_apply_rejects_non_numeric_input(dialog, notes_config):
+    """Test a non-numeric spinbox entry is reported by setting name"""
+    dialog.font_size.set('big')
+    
+    with patch('tkinter.messagebox.showerror') as mock_error:
+        dialog._apply_settings()
+        mock_error.assert_called_once()
+        assert "'font_size'" in mock_error.call_args[0][1]
+    assert notes_config.editor_settings['font_size'] == DEFAULTS['editor']['font_size']
+
 def test_reset_defaults(dialog, notes_config):
     """Test resetting settings to defaults"""
     # Modify settings
@@ -182,9 +255,8 @@ def test_reset_defaults(dialog, notes_config):
     dialog.default_format.set('md')
     dialog.language.set('en-GB')
     
-    # Mock messagebox.askyesno to return True
-    with patch('tkinter.messagebox.askyesno', return_value=True):
-        dialog._reset_defaults()
+    # Confirmation is answered yes by the stubbed dialogs
+    dialog._reset_defaults()
     
     # Verify UI values are reset
     assert dialog.font_family.get() == notes_config.editor_settings['font_family']
@@ -226,16 +298,15 @@ def test_remove_category(dialog):
     categories = list(dialog.categories_list.get(0, tk.END))
     assert "Test Category" not in categories
 
-def test_color_picker(dialog):
+def test_color_picker(dialog, monkeypatch):
     """Test color picker dialog"""
     color_var = tk.StringVar(value='#000000')
     
-    # Mock colorchooser.askcolor to return a color
-    with patch('tkinter.colorchooser.askcolor', return_value=('#FFFFFF', '#FFFFFF')):
-        dialog._pick_color(color_var)
-        assert color_var.get() == '#FFFFFF'
+    # The stubbed color chooser picks white
+    dialog._pick_color(color_var)
+    assert color_var.get() == '#FFFFFF'
     
-    # Mock colorchooser.askcolor to return None (dialog cancelled)
-    with patch('tkinter.colorchooser.askcolor', return_value=(None, None)):
-        dialog._pick_color(color_var)
-        assert color_var.get() == '#FFFFFF'  # Value should not change 
\ No newline at end of file
+    # Make askcolor return None (dialog cancelled)
+    monkeypatch.setattr('tkinter.colorchooser.askcolor', lambda *a, **k: (None, None))
+    dialog._pick_color(color_var)
+    assert color_var.get() == '#FFFFFF'  # Value should not change 
\ No newline at end of file
@@ -7,7 +7,43 @@ from tkinter import ttk, messagebox
 import os
 import json
 import logging
-from typing import Dict, List, Optional
+from collections import defaultdict
+from collections.abc import Mapping, MutableMapping
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+class DocumentView(MutableMapping):
+    """Dict-style view over DocumentManager's per-field document lists"""
+    
+    def __init__(self, manager: 'DocumentManager'):
+        self._manager = manager
+        
+    def __getitem__(self, doc_id: str) -> Mapping:
+        # Read-only: fields live in per-field lists, so edits to a copy would
+        # be lost. Assign a whole document to change it.
+        manager = self._manager
+        idx = manager._id_to_idx[doc_id]
+        return MappingProxyType({
+            'title': manager._titles[idx],
+            'content': manager._contents[idx],
+            'created': None,  # Will add timestamp
+            'modified': None  # Will add timestamp
+        })
+        
+    def __setitem__(self, doc_id: str, doc: dict) -> None:
+        self._manager._store_document(doc_id, doc['title'], doc.get('content', ''))
+        
+    def __delitem__(self, doc_id: str) -> None:
+        self._manager._remove_document(doc_id)
+        
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._manager._ids)
+        
+    def __len__(self) -> int:
+        return len(self._manager._ids)
+        
+    def clear(self) -> None:
+        self._manager._clear_documents()
 
 class DocumentManager(ttk.Frame):
     """Document manager with tree view for organizing notes"""
@@ -20,38 +56,62 @@ class DocumentManager(ttk.Frame):
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
         
+        # Pending debounced search filter, if any
+        self._filter_job: Optional[str] = None
+        
         # Create search bar
         self.create_search_bar()
         
         # Create tree view
         self.create_tree_view()
         
-        # Initialize document storage
-        self.documents: Dict[str, dict] = {}
+        # Initialize document storage: one list per field, aligned by index,
+        # so filtering scans a flat list of case-folded titles
+        self._ids: List[str] = []
+        self._titles: List[str] = []
+        self._titles_cf: List[str] = []
+        self._contents: List[str] = []
+        self._id_to_idx: Dict[str, int] = {}
+        self._documents = DocumentView(self)
+        # Number for the next new document's id; never reused after removals
+        self._next_id = 0
+        
+        # Ids of the documents whose case-folded title contains each bigram;
+        # a title can only contain a search term if it has all its bigrams
+        self._bigrams: Dict[str, Set[str]] = defaultdict(set)
         self.current_document: Optional[str] = None
         
+        # The previous search and its matching indices, so a narrowing
+        # search only rescans the last matches
+        self._last_search: Optional[str] = None
+        self._last_matches: List[int] = []
+        
+        # Tree items hidden by the current search; filtering toggles these
+        # with detach/reattach instead of rebuilding the tree
+        self._detached: Set[str] = set()
+        
         # Load documents
         self.load_documents()
         
     def create_search_bar(self):
         """Create the search bar"""
-        search_frame = ttk.Frame(self)
-        search_frame.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
+        self.search_frame = ttk.Frame(self)
+        self.search_frame.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
         
         # Search entry
         self.search_var = tk.StringVar()
-        self.search_var.trace('w', self.filter_documents)
+        self.search_var.trace_add('write', self._schedule_filter)
         
-        search_entry = ttk.Entry(
-            search_frame,
+        self.search_entry = ttk.Entry(
+            self.search_frame,
             textvariable=self.search_var,
             width=25
         )
-        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Clear button
         ttk.Button(
-            search_frame,
+            self.search_frame,
             text="×",
             width=3,
             command=self.clear_search
@@ -60,23 +120,26 @@ class DocumentManager(ttk.Frame):
     def create_tree_view(self):
         """Create the tree view for documents"""
         # Create frame for tree and scrollbar
-        tree_frame = ttk.Frame(self)
-        tree_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self.tree_frame = ttk.Frame(self)
+        self.tree_frame.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
         
         # Configure frame grid
-        tree_frame.grid_rowconfigure(0, weight=1)
-        tree_frame.grid_columnconfigure(0, weight=1)
+        self.tree_frame.grid_rowconfigure(0, weight=1)
+        self.tree_frame.grid_columnconfigure(0, weight=1)
         
-        # Create tree view
+        # Create tree view. Treeview only draws the rows inside its viewport,
+        # so attached rows that are scrolled out of view cost no drawing;
+        # detach is reserved for filtering, where get_children() must
+        # report exactly the matching documents.
         self.tree = ttk.Treeview(
-            tree_frame,
+            self.tree_frame,
             selectmode='browse',
             show='tree'
         )
         
         # Create scrollbar
         scrollbar = ttk.Scrollbar(
-            tree_frame,
+            self.tree_frame,
             orient=tk.VERTICAL,
             command=self.tree.yview
         )
@@ -92,34 +155,112 @@ class DocumentManager(ttk.Frame):
         self.tree.bind('<<TreeviewSelect>>', self.on_select)
         self.tree.bind('<Double-1>', self.on_double_click)
         
+    @property
+    def documents(self) -> DocumentView:
+        """Documents keyed by id, as title/content dicts"""
+        return self._documents
+        
+    def _new_document_id(self) -> str:
+        """Return an id no document has had yet"""
+        doc_id = f"doc_{self._next_id}"
+        self._next_id += 1
+        return doc_id
+        
+    def _store_document(self, doc_id: str, title: str, content: str):
+        """Add or replace a document's fields and its tree row"""
+        title_cf = title.casefold()
+        idx = self._id_to_idx.get(doc_id)
+        if idx is None:
+            self._id_to_idx[doc_id] = len(self._ids)
+            self._ids.append(doc_id)
+            self._titles.append(title)
+            self._titles_cf.append(title_cf)
+            self._contents.append(content)
+            self.tree.insert('', 'end', doc_id, text=title)
+        else:
+            self._unindex_title(doc_id, self._titles_cf[idx])
+            self._titles[idx] = title
+            self._titles_cf[idx] = title_cf
+            self._contents[idx] = content
+            self.tree.item(doc_id, text=title)
+        self._index_title(doc_id, title_cf)
+        self._last_search = None
+        
+    def _index_title(self, doc_id: str, title_cf: str):
+        """Record a document under each bigram of its case-folded title"""
+        for i in range(len(title_cf) - 1):
+            self._bigrams[title_cf[i:i + 2]].add(doc_id)
+            
+    def _unindex_title(self, doc_id: str, title_cf: str):
+        """Drop a document from the bigrams of its case-folded title"""
+        for i in range(len(title_cf) - 1):
+            bigram = title_cf[i:i + 2]
+            ids = self._bigrams.get(bigram)
+            if ids is not None:
+                ids.discard(doc_id)
+                if not ids:
+                    del self._bigrams[bigram]
+        
+    def _remove_document(self, doc_id: str):
+        """Remove a document's fields and tree row, shifting later indices down"""
+        idx = self._id_to_idx.pop(doc_id)
+        self._unindex_title(doc_id, self._titles_cf[idx])
+        for column in (self._ids, self._titles, self._titles_cf, self._contents):
+            del column[idx]
+        for i in range(idx, len(self._ids)):
+            self._id_to_idx[self._ids[i]] = i
+        self.tree.delete(doc_id)
+        self._detached.discard(doc_id)
+        if self.current_document == doc_id:
+            self.current_document = None
+        self._last_search = None
+        
+    def _clear_documents(self):
+        """Remove all documents' fields and tree rows"""
+        self.tree.delete(*self._ids)
+        for column in (self._ids, self._titles, self._titles_cf, self._contents):
+            column.clear()
+        self._id_to_idx.clear()
+        self._bigrams.clear()
+        self._detached.clear()
+        self.current_document = None
+        self._last_search = None
+        
     def load_documents(self):
         """Load documents from storage"""
         # This is a placeholder - will be implemented with actual storage
         self.logger.info("Loading documents (not implemented)")
         
         # Add some dummy documents for testing
-        self.add_document("Welcome", "Welcome to Mumble Notes!")
-        self.add_document("Getting Started", "Learn how to use Mumble Notes...")
+        self.add_documents([
+            ("Welcome", "Welcome to Mumble Notes!"),
+            ("Getting Started", "Learn how to use Mumble Notes..."),
+        ])
         
     def add_document(self, title: str, content: str = ""):
         """Add a new document"""
         try:
-            doc_id = f"doc_{len(self.documents)}"
-            self.documents[doc_id] = {
-                'title': title,
-                'content': content,
-                'created': None,  # Will add timestamp
-                'modified': None  # Will add timestamp
-            }
-            
-            # Add to tree view
-            self.tree.insert('', 'end', doc_id, text=title)
-            self.logger.info(f"Added document: {title}")
+            self._store_document(self._new_document_id(), title, content)
+            self.logger.info("Added document: %s", title)
             
         except Exception as e:
             self.logger.error(f"Error adding document: {e}")
             messagebox.showerror("Error", "Could not add document")
             
+    def add_documents(self, documents: Iterable[Tuple[str, str]]):
+        """Add several documents with the tree unmapped until all are inserted"""
+        start = len(self._ids)
+        self.tree.grid_remove()
+        try:
+            for title, content in documents:
+                self._store_document(self._new_document_id(), title, content)
+            self.logger.info("Added %d documents", len(self._ids) - start)
+        except Exception as e:
+            self.logger.error(f"Error adding documents: {e}")
+            messagebox.showerror("Error", "Could not add documents")
+        finally:
+            self.tree.grid()
+            
     def open_document(self):
         """Open the selected document"""
         selection = self.tree.selection()
@@ -131,23 +272,99 @@ class DocumentManager(ttk.Frame):
                 messagebox.showinfo("Open", f"Opening {doc['title']}...")
                 self.logger.info(f"Opening document: {doc['title']}")
                 
+    def _schedule_filter(self, *args):
+        """Coalesce rapid search edits into a single filter pass"""
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(100, self.filter_documents)
+        
+    def flush_search(self):
+        """Apply a pending search filter immediately"""
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+            self.filter_documents()
+            
+    def destroy(self):
+        """Cancel any pending search filter before destroying the widget"""
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+            self._filter_job = None
+        super().destroy()
+        
     def filter_documents(self, *args):
         """Filter documents based on search text"""
-        search_text = self.search_var.get().lower()
+        self._filter_job = None
+        search_text = self.search_var.get().casefold()
         
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Same term as the last pass (e.g. only the case changed): the tree
+        # already shows exactly these matches
+        if search_text == self._last_search:
+            return
             
-        # Add matching documents
-        for doc_id, doc in self.documents.items():
-            if search_text in doc['title'].lower():
-                self.tree.insert('', 'end', doc_id, text=doc['title'])
+        # An empty search shows everything; no need to test any titles
+        if not search_text:
+            self._last_search = None
+            if self._detached:
+                for idx, doc_id in enumerate(self._ids):
+                    if doc_id in self._detached:
+                        self.tree.reattach(doc_id, '', idx)
+                self._detached.clear()
+            return
+            
+        # Extending the previous term can only drop matches, never add them
+        if self._last_search is not None and search_text.startswith(self._last_search):
+            if not self._last_matches:
+                # Nothing matched the shorter term and every row is already hidden
+                self._last_search = search_text
+                return
+            candidates = self._last_matches
+        elif len(search_text) >= 2:
+            candidates = self._bigram_candidates(search_text)
+        else:
+            candidates = range(len(self._titles_cf))
+        # Titles match anywhere, not just by prefix ("test" finds "Mixed Test")
+        titles_cf = self._titles_cf
+        matches = [idx for idx in candidates if search_text in titles_cf[idx]]
+        self._last_search = search_text
+        self._last_matches = matches
+        
+        # Only touch rows whose visibility actually changes
+        match_set = set(matches)
+        index = 0
+        for idx, doc_id in enumerate(self._ids):
+            if idx in match_set:
+                if doc_id in self._detached:
+                    self.tree.reattach(doc_id, '', index)
+                    self._detached.discard(doc_id)
+                index += 1
+            elif doc_id not in self._detached:
+                self.tree.detach(doc_id)
+                self._detached.add(doc_id)
                 
+    def _bigram_candidates(self, search_text: str) -> List[int]:
+        """Indices of the documents whose titles contain every bigram of the term"""
+        bigrams = self._bigrams
+        id_sets = []
+        for i in range(len(search_text) - 1):
+            ids = bigrams.get(search_text[i:i + 2])
+            if not ids:
+                return []
+            id_sets.append(ids)
+        id_sets.sort(key=len)
+        doc_ids = id_sets[0].intersection(*id_sets[1:])
+        return sorted(self._id_to_idx[doc_id] for doc_id in doc_ids)
+        
     def clear_search(self):
         """Clear the search field"""
         self.search_var.set("")
+        self.flush_search()
         
+    def select_documents(self, doc_ids: List[str]):
+        """Select documents in one Tcl call and make the first one current"""
+        self.tree.selection_set(doc_ids)
+        if doc_ids:
+            self.current_document = doc_ids[0]
+            
     def on_select(self, event):
         """Handle tree item selection"""
         selection = self.tree.selection()
@@ -5,6 +5,24 @@ Rich text editor component for Mumble Notes
 import tkinter as tk
 from tkinter import ttk, font, messagebox
 import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+# (family, size, bold, italic) of the text widget's own font
+DEFAULT_STYLE = ('Arial', 12, False, False)
+
+# Tcl lambda running each argument list as a command, for Editor.batch
+BATCH_LAMBDA = ('commands', 'set result {}; foreach command $commands {set result [{*}$command]}; return $result')
+
+@lru_cache(maxsize=128)
+def _font_spec(family: str, size: int, bold: bool, italic: bool) -> str:
+    """Build the Tcl font spec for a font combination"""
+    spec = f"{{{family}}} {size}"
+    if bold:
+        spec += " bold"
+    if italic:
+        spec += " italic"
+    return spec
 
 class RichTextEditor(ttk.Frame):
     """Rich text editor with formatting capabilities"""
@@ -32,6 +50,9 @@ class RichTextEditor(ttk.Frame):
             'underline': False
         }
         
+        # One text tag per (family, size, bold, italic) style, configured once
+        self._font_tags: Dict[Tuple[str, int, bool, bool], str] = {}
+        
     def create_text_widget(self):
         """Create the main text widget and scrollbar"""
         # Create text widget
@@ -43,18 +64,21 @@ class RichTextEditor(ttk.Frame):
         )
         
         # Create scrollbar
-        scrollbar = ttk.Scrollbar(
+        self.scrollbar = ttk.Scrollbar(
             self,
             orient=tk.VERTICAL,
             command=self.text.yview
         )
         
         # Configure text widget scrolling
-        self.text.configure(yscrollcommand=scrollbar.set)
+        self.text.configure(yscrollcommand=self.scrollbar.set)
         
         # Grid widgets
         self.text.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        
+        # Carry styles armed without a selection onto typed characters
+        self.text.bind('<KeyPress>', self._on_key)
         
     def setup_tags(self):
         """Set up text formatting tags"""
@@ -74,37 +98,55 @@ class RichTextEditor(ttk.Frame):
             self.current_font['family'] = family
             self.current_font['size'] = size
             
-            # Create font string
-            font_str = (family, size)
-            if self.current_font['bold']:
-                font_str += ('bold',)
-            if self.current_font['italic']:
-                font_str += ('italic',)
-                
-            # Apply to selection or insert point
-            if self.text.tag_ranges(tk.SEL):
-                self.text.tag_add('custom', tk.SEL_FIRST, tk.SEL_LAST)
-            else:
-                self.text.tag_add('custom', tk.INSERT)
-                
-            # Configure the custom tag with new font
-            self.text.tag_configure('custom', font=font_str)
-            
-            self.logger.debug(f"Applied font: {font_str}")
+            self._apply_custom_font()
             
         except Exception as e:
             self.logger.error(f"Error applying font: {e}")
             messagebox.showerror("Error", "Could not apply font formatting")
             
+    def _style_key(self) -> Tuple[str, int, bool, bool]:
+        """Get the (family, size, bold, italic) key of the current font"""
+        return (
+            self.current_font['family'],
+            self.current_font['size'],
+            self.current_font['bold'],
+            self.current_font['italic']
+        )
+        
+    def _font_tag(self) -> str:
+        """Get the text tag for the current font style, creating it once"""
+        key = self._style_key()
+        tag = self._font_tags.get(key)
+        if tag is None:
+            tag = f'font_{len(self._font_tags)}'
+            self.text.tag_configure(tag, font=_font_spec(*key))
+            self._font_tags[key] = tag
+        return tag
+        
+    def _apply_custom_font(self):
+        """Tag the selection with the current font"""
+        # Without a selection the font is applied by insert_text instead
+        if not self.text.tag_ranges(tk.SEL):
+            return
+            
+        # Swap the selection's style tag; existing tags are never reconfigured
+        tag = self._font_tag()
+        for other in self._font_tags.values():
+            if other != tag:
+                self.text.tag_remove(other, tk.SEL_FIRST, tk.SEL_LAST)
+        self.text.tag_add(tag, tk.SEL_FIRST, tk.SEL_LAST)
+        
+        self.logger.debug("Applied font tag: %s", tag)
+        
     def toggle_bold(self):
         """Toggle bold formatting"""
         self.current_font['bold'] = not self.current_font['bold']
-        self.apply_font()
+        self._apply_custom_font()
         
     def toggle_italic(self):
         """Toggle italic formatting"""
         self.current_font['italic'] = not self.current_font['italic']
-        self.apply_font()
+        self._apply_custom_font()
         
     def toggle_underline(self):
         """Toggle underline formatting"""
@@ -116,14 +158,57 @@ class RichTextEditor(ttk.Frame):
             else:
                 self.text.tag_remove('underline', start, end)
                 
+    def _typing_tags(self) -> Tuple[str, ...]:
+        """Get the tags that carry the current formatting onto new text"""
+        tags: Tuple[str, ...] = ()
+        # Any change from the widget's own font, including family or size
+        if self._style_key() != DEFAULT_STYLE:
+            tags += (self._font_tag(),)
+        if self.current_font['underline']:
+            tags += ('underline',)
+        return tags
+        
+    def _on_key(self, event):
+        """Type a character with the armed styles, if any are armed"""
+        tags = self._typing_tags()
+        # Plain typing, shortcuts and editing keys keep the default bindings
+        char = event.char
+        if not tags or not char or not char.isprintable() or event.state & 0x4:
+            return None
+        if self.text.tag_ranges(tk.SEL):
+            self.text.delete(tk.SEL_FIRST, tk.SEL_LAST)
+        self.text.insert(tk.INSERT, char, tags)
+        self.text.see(tk.INSERT)
+        return 'break'
+        
     def insert_text(self, text: str):
         """Insert text at current cursor position"""
         try:
-            self.text.insert(tk.INSERT, text)
-            self.logger.debug(f"Inserted text at cursor: {text[:50]}...")
+            # Tag the new text as part of the insert call itself
+            self.text.insert(tk.INSERT, text, self._typing_tags())
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Inserted text at cursor: %.50s...", text)
         except Exception as e:
             self.logger.error(f"Error inserting text: {e}")
             
+    def batch(self, commands: List[Sequence[Any]]) -> Any:
+        """
+        Run several text widget subcommands in a single Tcl call
+        
+        Args:
+            commands: Subcommands as argument sequences, e.g.
+                ('insert', 'end', text, tags). They are passed to Tcl as
+                lists, never parsed as script, so text needs no quoting.
+        
+        Returns:
+            The result of the last subcommand
+        """
+        path = str(self.text)
+        return self.text.tk.call(
+            'apply', BATCH_LAMBDA,
+            tuple((path, *command) for command in commands)
+        )
+        
     def new_document(self):
         """Create a new document"""
         if messagebox.askyesno("New Document", "Clear current document?"):
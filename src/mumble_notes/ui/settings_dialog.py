@@ -4,13 +4,57 @@ Settings dialog for Mumble Notes
 
 import tkinter as tk
 from tkinter import ttk, colorchooser, messagebox
-from typing import Dict, Any, Callable
+from functools import partial
+from typing import Dict, Any, Callable, Set, Tuple
 import logging
 
 from ..config.notes_config import NotesConfig
 
 logger = logging.getLogger('mumble.notes.settings')
 
+# Initial dialog size in pixels
+DIALOG_WIDTH = 600
+DIALOG_HEIGHT = 500
+
+# Combobox choices, shared by every dialog
+FONT_FAMILIES = ('Arial', 'Times New Roman', 'Courier New')
+THEMES = ('clam', 'alt', 'default', 'classic')
+DOCUMENT_FORMATS = ('rtf', 'txt', 'md')
+LANGUAGES = ('en-US', 'en-GB', 'es-ES', 'fr-FR', 'de-DE')
+
+# Widget or variable attribute holding each setting, by config section.
+# The categories list is held in a list variable and is handled separately.
+SETTING_FIELDS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    'editor': (
+        ('font_family', 'font_family'),
+        ('font_size_var', 'font_size'),
+        ('line_spacing_var', 'line_spacing'),
+        ('tab_size_var', 'tab_size'),
+        ('wrap_text', 'wrap_text'),
+        ('show_line_numbers', 'show_line_numbers'),
+        ('auto_save', 'auto_save'),
+        ('auto_save_interval_var', 'auto_save_interval'),
+    ),
+    'theme': (
+        ('theme_name', 'name'),
+        ('bg_color', 'background_color'),
+        ('text_color', 'text_color'),
+        ('accent_color', 'accent_color'),
+        ('sidebar_width_var', 'sidebar_width'),
+    ),
+    'documents': (
+        ('default_format', 'default_format'),
+        ('backup_enabled', 'backup_enabled'),
+        ('backup_count_var', 'backup_count'),
+    ),
+    'speech': (
+        ('language', 'language'),
+        ('ambient_duration_var', 'ambient_duration'),
+        ('auto_punctuate', 'auto_punctuate'),
+        ('capitalize_sentences', 'capitalize_sentences'),
+    ),
+}
+
 class SettingsDialog(tk.Toplevel):
     """Settings dialog with tabbed interface"""
     
@@ -21,24 +65,22 @@ class SettingsDialog(tk.Toplevel):
         self.config = config
         
         self.title("Mumble Notes Settings")
-        self.geometry("600x500")
+        self.geometry(f"{DIALOG_WIDTH}x{DIALOG_HEIGHT}")
         self.resizable(True, True)
         
         # Make dialog modal
         self.transient(parent)
         self.grab_set()
         
-        # Initialize UI
+        # Initialize UI; other tabs are built when first selected
         self._create_widgets()
-        self._load_settings()
+        self._build_tab('editor')
         
-        # Center dialog
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f'{width}x{height}+{x}+{y}')
+        # Center dialog. The size is set above, so only the position is
+        # needed and no layout pass has to run first.
+        x = (self.winfo_screenwidth() - DIALOG_WIDTH) // 2
+        y = (self.winfo_screenheight() - DIALOG_HEIGHT) // 2
+        self.geometry(f'+{x}+{y}')
         
     def _create_widgets(self) -> None:
         """Create dialog widgets"""
@@ -46,11 +88,11 @@ class SettingsDialog(tk.Toplevel):
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(expand=True, fill='both', padx=5, pady=5)
         
-        # Create tabs
-        self.editor_tab = self._create_editor_tab()
-        self.theme_tab = self._create_theme_tab()
-        self.documents_tab = self._create_documents_tab()
-        self.speech_tab = self._create_speech_tab()
+        # Create empty tab frames; each is filled in on first selection
+        self.editor_tab = ttk.Frame(self.notebook)
+        self.theme_tab = ttk.Frame(self.notebook)
+        self.documents_tab = ttk.Frame(self.notebook)
+        self.speech_tab = ttk.Frame(self.notebook)
         
         # Add tabs to notebook
         self.notebook.add(self.editor_tab, text="Editor")
@@ -58,6 +100,23 @@ class SettingsDialog(tk.Toplevel):
         self.notebook.add(self.documents_tab, text="Documents")
         self.notebook.add(self.speech_tab, text="Speech")
         
+        # Per-tab builders, keyed by config section
+        self._tab_builders: Dict[str, Callable[[ttk.Frame], None]] = {
+            'editor': self._create_editor_tab,
+            'theme': self._create_theme_tab,
+            'documents': self._create_documents_tab,
+            'speech': self._create_speech_tab,
+        }
+        self._tab_frames: Dict[str, ttk.Frame] = {
+            'editor': self.editor_tab,
+            'theme': self.theme_tab,
+            'documents': self.documents_tab,
+            'speech': self.speech_tab,
+        }
+        self._tab_keys = {str(frame): key for key, frame in self._tab_frames.items()}
+        self._tab_loaded: Set[str] = set()
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        
         # Create bottom buttons
         button_frame = ttk.Frame(self)
         button_frame.pack(fill='x', padx=5, pady=5)
@@ -66,30 +125,32 @@ class SettingsDialog(tk.Toplevel):
         ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side='right', padx=5)
         ttk.Button(button_frame, text="Reset to Defaults", command=self._reset_defaults).pack(side='left', padx=5)
         
-    def _create_editor_tab(self) -> ttk.Frame:
-        """Create editor settings tab"""
-        tab = ttk.Frame(self.notebook)
+    def _create_editor_tab(self, tab: ttk.Frame) -> None:
+        """Create editor settings tab widgets"""
         tab.columnconfigure(1, weight=1)
         
         # Font settings
         row = 0
         ttk.Label(tab, text="Font Family:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.font_family = ttk.Combobox(tab, values=['Arial', 'Times New Roman', 'Courier New'])
+        self.font_family = ttk.Combobox(tab, values=FONT_FAMILIES)
         self.font_family.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
         
         row += 1
         ttk.Label(tab, text="Font Size:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.font_size = ttk.Spinbox(tab, from_=8, to=72)
+        self.font_size_var = tk.IntVar()
+        self.font_size = ttk.Spinbox(tab, from_=8, to=72, textvariable=self.font_size_var)
         self.font_size.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
         
         row += 1
         ttk.Label(tab, text="Line Spacing:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.line_spacing = ttk.Spinbox(tab, from_=1.0, to=3.0, increment=0.1)
+        self.line_spacing_var = tk.DoubleVar()
+        self.line_spacing = ttk.Spinbox(tab, from_=1.0, to=3.0, increment=0.1, textvariable=self.line_spacing_var)
         self.line_spacing.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
         
         row += 1
         ttk.Label(tab, text="Tab Size:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.tab_size = ttk.Spinbox(tab, from_=2, to=8)
+        self.tab_size_var = tk.IntVar()
+        self.tab_size = ttk.Spinbox(tab, from_=2, to=8, textvariable=self.tab_size_var)
         self.tab_size.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
         
         # Checkboxes
@@ -107,61 +168,52 @@ class SettingsDialog(tk.Toplevel):
         
         row += 1
         ttk.Label(tab, text="Auto Save Interval (seconds):").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.auto_save_interval = ttk.Spinbox(tab, from_=30, to=3600)
+        self.auto_save_interval_var = tk.IntVar()
+        self.auto_save_interval = ttk.Spinbox(tab, from_=30, to=3600, textvariable=self.auto_save_interval_var)
         self.auto_save_interval.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
         
-        return tab
-        
-    def _create_theme_tab(self) -> ttk.Frame:
-        """Create theme settings tab"""
-        tab = ttk.Frame(self.notebook)
+    def _create_theme_tab(self, tab: ttk.Frame) -> None:
+        """Create theme settings tab widgets"""
         tab.columnconfigure(1, weight=1)
         
         row = 0
         ttk.Label(tab, text="Theme:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.theme_name = ttk.Combobox(tab, values=['clam', 'alt', 'default', 'classic'])
+        self.theme_name = ttk.Combobox(tab, values=THEMES)
         self.theme_name.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
         
         # Color pickers
         row += 1
-        ttk.Label(tab, text="Background Color:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.bg_color_frame = ttk.Frame(tab)
-        self.bg_color_frame.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
-        self.bg_color = tk.StringVar()
-        ttk.Entry(self.bg_color_frame, textvariable=self.bg_color).pack(side='left', expand=True, fill='x')
-        ttk.Button(self.bg_color_frame, text="Pick", command=lambda: self._pick_color(self.bg_color)).pack(side='right', padx=5)
+        self.bg_color_frame, self.bg_color = self._create_color_row(tab, row, "Background Color:")
         
         row += 1
-        ttk.Label(tab, text="Text Color:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.text_color_frame = ttk.Frame(tab)
-        self.text_color_frame.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
-        self.text_color = tk.StringVar()
-        ttk.Entry(self.text_color_frame, textvariable=self.text_color).pack(side='left', expand=True, fill='x')
-        ttk.Button(self.text_color_frame, text="Pick", command=lambda: self._pick_color(self.text_color)).pack(side='right', padx=5)
+        self.text_color_frame, self.text_color = self._create_color_row(tab, row, "Text Color:")
         
         row += 1
-        ttk.Label(tab, text="Accent Color:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.accent_color_frame = ttk.Frame(tab)
-        self.accent_color_frame.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
-        self.accent_color = tk.StringVar()
-        ttk.Entry(self.accent_color_frame, textvariable=self.accent_color).pack(side='left', expand=True, fill='x')
-        ttk.Button(self.accent_color_frame, text="Pick", command=lambda: self._pick_color(self.accent_color)).pack(side='right', padx=5)
+        self.accent_color_frame, self.accent_color = self._create_color_row(tab, row, "Accent Color:")
         
         row += 1
         ttk.Label(tab, text="Sidebar Width:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.sidebar_width = ttk.Spinbox(tab, from_=150, to=500)
+        self.sidebar_width_var = tk.IntVar()
+        self.sidebar_width = ttk.Spinbox(tab, from_=150, to=500, textvariable=self.sidebar_width_var)
         self.sidebar_width.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
         
-        return tab
-        
-    def _create_documents_tab(self) -> ttk.Frame:
-        """Create documents settings tab"""
-        tab = ttk.Frame(self.notebook)
+    def _create_color_row(self, tab: ttk.Frame, row: int, label: str) -> Tuple[ttk.Frame, tk.StringVar]:
+        """Create a labelled color entry with a picker button"""
+        ttk.Label(tab, text=label).grid(row=row, column=0, sticky='w', padx=5, pady=5)
+        frame = ttk.Frame(tab)
+        frame.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
+        color_var = tk.StringVar()
+        ttk.Entry(frame, textvariable=color_var).pack(side='left', expand=True, fill='x')
+        ttk.Button(frame, text="Pick", command=partial(self._pick_color, color_var)).pack(side='right', padx=5)
+        return frame, color_var
+        
+    def _create_documents_tab(self, tab: ttk.Frame) -> None:
+        """Create documents settings tab widgets"""
         tab.columnconfigure(1, weight=1)
         
         row = 0
         ttk.Label(tab, text="Default Format:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.default_format = ttk.Combobox(tab, values=['rtf', 'txt', 'md'])
+        self.default_format = ttk.Combobox(tab, values=DOCUMENT_FORMATS)
         self.default_format.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
         
         row += 1
@@ -170,7 +222,8 @@ class SettingsDialog(tk.Toplevel):
         
         row += 1
         ttk.Label(tab, text="Backup Count:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.backup_count = ttk.Spinbox(tab, from_=1, to=10)
+        self.backup_count_var = tk.IntVar()
+        self.backup_count = ttk.Spinbox(tab, from_=1, to=10, textvariable=self.backup_count_var)
         self.backup_count.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
         
         # Categories
@@ -181,7 +234,10 @@ class SettingsDialog(tk.Toplevel):
         categories_frame.grid(row=row, column=1, sticky='nsew', padx=5, pady=5)
         categories_frame.columnconfigure(0, weight=1)
         
-        self.categories_list = tk.Listbox(categories_frame, height=5)
+        # The Listbox mirrors this variable, so loading and reading the
+        # categories is a single variable access
+        self.categories_var = tk.Variable()
+        self.categories_list = tk.Listbox(categories_frame, height=5, listvariable=self.categories_var)
         self.categories_list.grid(row=0, column=0, sticky='nsew')
         
         scrollbar = ttk.Scrollbar(categories_frame, orient='vertical', command=self.categories_list.yview)
@@ -194,21 +250,19 @@ class SettingsDialog(tk.Toplevel):
         ttk.Button(buttons_frame, text="Add", command=self._add_category).pack(side='left', padx=5)
         ttk.Button(buttons_frame, text="Remove", command=self._remove_category).pack(side='left', padx=5)
         
-        return tab
-        
-    def _create_speech_tab(self) -> ttk.Frame:
-        """Create speech settings tab"""
-        tab = ttk.Frame(self.notebook)
+    def _create_speech_tab(self, tab: ttk.Frame) -> None:
+        """Create speech settings tab widgets"""
         tab.columnconfigure(1, weight=1)
         
         row = 0
         ttk.Label(tab, text="Language:").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.language = ttk.Combobox(tab, values=['en-US', 'en-GB', 'es-ES', 'fr-FR', 'de-DE'])
+        self.language = ttk.Combobox(tab, values=LANGUAGES)
         self.language.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
         
         row += 1
         ttk.Label(tab, text="Ambient Duration (seconds):").grid(row=row, column=0, sticky='w', padx=5, pady=5)
-        self.ambient_duration = ttk.Spinbox(tab, from_=0.1, to=2.0, increment=0.1)
+        self.ambient_duration_var = tk.DoubleVar()
+        self.ambient_duration = ttk.Spinbox(tab, from_=0.1, to=2.0, increment=0.1, textvariable=self.ambient_duration_var)
         self.ambient_duration.grid(row=row, column=1, sticky='ew', padx=5, pady=5)
         
         row += 1
@@ -219,85 +273,62 @@ class SettingsDialog(tk.Toplevel):
         self.capitalize_sentences = tk.BooleanVar()
         ttk.Checkbutton(tab, text="Capitalize Sentences", variable=self.capitalize_sentences).grid(row=row, column=0, columnspan=2, sticky='w', padx=5, pady=5)
         
-        return tab
+    def _on_tab_changed(self, event=None) -> None:
+        """Build the newly selected tab if it has not been built yet"""
+        self._build_tab(self._tab_keys[self.notebook.select()])
+        
+    def _build_tab(self, key: str) -> None:
+        """Create a tab's widgets and load its settings, once"""
+        if key in self._tab_loaded:
+            return
+        self._tab_builders[key](self._tab_frames[key])
+        self._load_tab(key)
+        self._tab_loaded.add(key)
         
     def _load_settings(self) -> None:
-        """Load current settings into UI"""
-        # Editor settings
-        editor = self.config.editor_settings
-        self.font_family.set(editor['font_family'])
-        self.font_size.set(editor['font_size'])
-        self.line_spacing.set(editor['line_spacing'])
-        self.tab_size.set(editor['tab_size'])
-        self.wrap_text.set(editor['wrap_text'])
-        self.show_line_numbers.set(editor['show_line_numbers'])
-        self.auto_save.set(editor['auto_save'])
-        self.auto_save_interval.set(editor['auto_save_interval'])
-        
-        # Theme settings
-        theme = self.config.theme_settings
-        self.theme_name.set(theme['name'])
-        self.bg_color.set(theme['background_color'])
-        self.text_color.set(theme['text_color'])
-        self.accent_color.set(theme['accent_color'])
-        self.sidebar_width.set(theme['sidebar_width'])
-        
-        # Document settings
-        docs = self.config.document_settings
-        self.default_format.set(docs['default_format'])
-        self.backup_enabled.set(docs['backup_enabled'])
-        self.backup_count.set(docs['backup_count'])
-        
-        self.categories_list.delete(0, tk.END)
-        for category in docs['categories']:
-            self.categories_list.insert(tk.END, category)
+        """Load current settings into the tabs built so far"""
+        for key in self._tab_builders:
+            if key in self._tab_loaded:
+                self._load_tab(key)
+                
+    def _load_tab(self, key: str) -> None:
+        """Load one config section into its tab's widgets"""
+        settings = self.config.get_settings(key)
+        for attr, name in SETTING_FIELDS[key]:
+            getattr(self, attr).set(settings[name])
+            
+        if key == 'documents':
+            self.categories_var.set(tuple(settings['categories']))
             
-        # Speech settings
-        speech = self.config.speech_settings
-        self.language.set(speech['language'])
-        self.ambient_duration.set(speech['ambient_duration'])
-        self.auto_punctuate.set(speech['auto_punctuate'])
-        self.capitalize_sentences.set(speech['capitalize_sentences'])
+    def _read_tab(self, key: str) -> Dict[str, Any]:
+        """Read one tab's widgets as updates for its config section"""
+        updates = {}
+        for attr, name in SETTING_FIELDS[key]:
+            try:
+                updates[name] = getattr(self, attr).get()
+            except tk.TclError as e:
+                # Typed variables reject text that is not a number; name the field
+                raise ValueError(f"Invalid {key} setting {name!r}: {e}") from e
+        if key == 'documents':
+            updates['categories'] = list(self.tk.splitlist(self.categories_var.get()))
+        return updates
         
     def _apply_settings(self) -> None:
-        """Apply settings from UI to config"""
+        """Apply settings from the tabs built so far to config"""
         try:
-            # Editor settings
-            self.config.update_editor_settings({
-                'font_family': self.font_family.get(),
-                'font_size': int(self.font_size.get()),
-                'line_spacing': float(self.line_spacing.get()),
-                'tab_size': int(self.tab_size.get()),
-                'wrap_text': self.wrap_text.get(),
-                'show_line_numbers': self.show_line_numbers.get(),
-                'auto_save': self.auto_save.get(),
-                'auto_save_interval': int(self.auto_save_interval.get())
-            })
-            
-            # Theme settings
-            self.config.update_theme_settings({
-                'name': self.theme_name.get(),
-                'background_color': self.bg_color.get(),
-                'text_color': self.text_color.get(),
-                'accent_color': self.accent_color.get(),
-                'sidebar_width': int(self.sidebar_width.get())
-            })
-            
-            # Document settings
-            self.config.update_document_settings({
-                'default_format': self.default_format.get(),
-                'backup_enabled': self.backup_enabled.get(),
-                'backup_count': int(self.backup_count.get()),
-                'categories': list(self.categories_list.get(0, tk.END))
-            })
-            
-            # Speech settings
-            self.config.update_speech_settings({
-                'language': self.language.get(),
-                'ambient_duration': float(self.ambient_duration.get()),
-                'auto_punctuate': self.auto_punctuate.get(),
-                'capitalize_sentences': self.capitalize_sentences.get()
-            })
+            # Tabs never opened still hold the config's values; skip them,
+            # along with built tabs whose values were not changed
+            changed = {}
+            for key in self._tab_builders:
+                if key in self._tab_loaded:
+                    updates = self._read_tab(key)
+                    settings = self.config.get_settings(key)
+                    if any(settings.get(name) != value for name, value in updates.items()):
+                        changed[key] = updates
+                        
+            # The changed tabs are saved together in one config write
+            if changed:
+                self.config.update_settings(changed)
             
             logger.info("Settings applied successfully")
             self.destroy()
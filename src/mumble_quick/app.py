@@ -4,53 +4,63 @@ Main application module for Mumble Quick
 
 import os
 import sys
-import keyboard
-import pyperclip
-import pyautogui
-from threading import Thread
+from threading import Event, Thread
 import logging
 import traceback
+from typing import Any, Callable, Optional
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from shared.adaptive_speech import create_adaptive_speech_recognizer
 from shared.logging import setup_logging
+from .config.quick_config import QuickConfig
+from .text_output import WELCOME_MESSAGE, HotkeyDebouncer, TextInserter, register_keyboard_hotkey
 from .ui.pill_bar import WaveformBar
 
+
 class MumbleQuick:
     """Main application class for Mumble Quick"""
     
-    def __init__(self):
-        """Initialize the application"""
+    def __init__(self, recognizer_factory: Callable[[], Any] = create_adaptive_speech_recognizer,
+                 config: Optional[QuickConfig] = None):
+        """
+        Initialize the application
+        
+        Args:
+            recognizer_factory: Callable that creates the speech recognizer
+            config: Settings to use; loaded from the config file if omitted
+        """
         try:
             self.logger = setup_logging('quick')
             self.logger.info("Initializing Mumble Quick...")
             
-            self.recognizer = create_adaptive_speech_recognizer()
-            self.logger.info("Adaptive speech recognizer initialized")
+            self.config = config if config is not None else QuickConfig()
+            
+            self.recognizer = recognizer_factory()
+            self.logger.info("Speech recognizer initialized")
             
             self.ui = WaveformBar()
             self.ui.withdraw()  # Hide window initially
             self.logger.info("UI initialized and hidden")
             
-            self.recognition_thread = None
+            self.text_output = TextInserter(self.ui.after, self.logger)
             
-            # Set up hotkey - using a more specific combination
-            try:
-                # Try primary hotkey first (just Ctrl+Alt instead of Ctrl+Alt+M)
-                keyboard.add_hotkey('ctrl+alt', self.on_hotkey_pressed, suppress=True)
-                self.logger.info("Primary hotkey (Ctrl+Alt) registered successfully")
-            except Exception as primary_error:
-                self.logger.warning(f"Failed to register primary hotkey: {primary_error}")
-                try:
-                    # Fallback to secondary hotkey (Ctrl+Shift)
-                    keyboard.add_hotkey('ctrl+shift', self.on_hotkey_pressed, suppress=True)
-                    self.logger.info("Secondary hotkey (Ctrl+Shift) registered successfully")
-                except Exception as secondary_error:
-                    self.logger.error(f"Failed to register secondary hotkey: {secondary_error}")
-                    self.logger.error(traceback.format_exc())
-                    raise
+            # One long-lived worker starts recognition sessions on request
+            self._listen_requested = Event()
+            self.recognition_thread = Thread(
+                target=self._recognition_worker,
+                name="recognition-worker",
+                daemon=True
+            )
+            self.recognition_thread.start()
+            
+            # Tells hotkey presses apart from autorepeat
+            self._hotkey_debouncer = HotkeyDebouncer()
+            
+            # Set up the configured hotkey, falling back to Ctrl+Shift
+            self.hotkey_name = register_keyboard_hotkey(
+                self.config.hotkey_trigger, self.on_hotkey_pressed, self.logger)
                 
         except Exception as e:
             self.logger.error(f"Initialization failed: {e}")
@@ -59,6 +69,10 @@ class MumbleQuick:
     
     def on_hotkey_pressed(self):
         """Handle hotkey press - schedule UI update in main thread"""
+        # Holding the keys repeats the event; only act after a quiet gap
+        if not self._hotkey_debouncer.is_new_press():
+            return
+            
         try:
             self.logger.info("Hotkey pressed! Scheduling toggle_listening...")
             # Schedule the toggle_listening call in the main UI thread
@@ -79,26 +93,33 @@ class MumbleQuick:
             self.logger.error(f"Error in toggle_listening: {e}")
             self.logger.error(traceback.format_exc())
             
+    def _recognition_worker(self):
+        """Start a recognition session each time one is requested"""
+        while True:
+            self._listen_requested.wait()
+            try:
+                self.recognizer.start_listening(self.on_transcription)
+            except Exception as e:
+                self.logger.error(f"Error in recognition worker: {e}")
+                self.logger.error(traceback.format_exc())
+            finally:
+                self._listen_requested.clear()
+            
     def start_listening(self):
         """Start speech recognition"""
         try:
             self.logger.info("Starting listening...")
-            if self.recognition_thread and self.recognition_thread.is_alive():
-                self.logger.info("Recognition thread already running")
+            if self._listen_requested.is_set():
+                self.logger.info("Recognition already requested")
                 return
                 
             # Show UI
             self.ui.show()  # This now includes deiconify and other visibility settings
             self.logger.info("UI shown")
             
-            # Start recognition in a separate thread
-            self.recognition_thread = Thread(
-                target=self.recognizer.start_listening,
-                args=(self.on_transcription,),
-                daemon=True
-            )
-            self.recognition_thread.start()
-            self.logger.info("Recognition thread started")
+            # Wake the recognition worker
+            self._listen_requested.set()
+            self.logger.info("Recognition requested")
             
         except Exception as e:
             self.logger.error(f"Error in start_listening: {e}")
@@ -128,22 +149,14 @@ class MumbleQuick:
     
     def insert_text(self, text: str):
         """Insert text at current cursor position"""
-        try:
-            # Type the text at current cursor position
-            pyperclip.copy(text)
-            pyautogui.hotkey('ctrl', 'v')
-            self.logger.info("Text inserted successfully")
-        except Exception as e:
-            self.logger.error(f"Error inserting text: {e}")
-            self.logger.error(traceback.format_exc())
+        self.text_output.insert_text(text)
             
     def run(self):
         """Run the application"""
         try:
             self.logger.info("Starting Mumble Quick application")
-            print("Mumble Quick is running.")
-            print("Press Ctrl+Alt (or Ctrl+Shift) to start/stop speech recognition.")
-            print("Check the logs directory for detailed information.")
+            sys.stdout.write(WELCOME_MESSAGE.format(
+                app="Mumble Quick", hotkey=self.hotkey_name))
             
             # Check UI status periodically
             self.check_ui_status()
@@ -157,12 +170,16 @@ class MumbleQuick:
         finally:
             self.logger.info("Shutting down Mumble Quick")
             self.stop_listening()
+            self.config.close()
     
     def check_ui_status(self):
         """Periodically check UI status for debugging"""
+        # Only poll while debug logging is on; otherwise never reschedule
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         try:
             # This method helps us debug UI state
-            self.logger.debug(f"UI state check - is_listening: {getattr(self.ui, 'is_listening', 'unknown')}")
+            self.logger.debug("UI state check - is_listening: %s", getattr(self.ui, 'is_listening', 'unknown'))
             # Schedule next check
             self.ui.after(5000, self.check_ui_status)  # Check every 5 seconds
         except Exception as e:
@@ -5,88 +5,172 @@ Modern Qt-based replacement for the Tkinter implementation
 
 import os
 import sys
-import keyboard
-import pyperclip
-import pyautogui
-from threading import Thread
 import logging
-import traceback
+from typing import Any, Callable, Optional
 
 from PyQt5.QtWidgets import QApplication, QWidget
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QObject
+from PyQt5.QtCore import (
+    Qt, QTimer, QThread, QMetaObject, QAbstractNativeEventFilter, pyqtSignal, pyqtSlot, QObject
+)
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from shared.adaptive_speech import create_adaptive_speech_recognizer
 from shared.logging import setup_logging
+from .config.quick_config import QuickConfig
+from .text_output import (
+    WELCOME_MESSAGE, HotkeyDebouncer, TextInserter, hotkey_label, register_keyboard_hotkey
+)
 from .ui.pill_bar_qt5 import WaveformBar
 
 
+# Id of the hotkey registered with Windows
+NATIVE_HOTKEY_ID = 1
+
+
+class NativeHotkeyFilter(QAbstractNativeEventFilter):
+    """Calls back when Windows delivers a registered hotkey's WM_HOTKEY"""
+    
+    def __init__(self, hotkey_id: int, callback: Callable[[], None]):
+        super().__init__()
+        self.hotkey_id = hotkey_id
+        self.callback = callback
+        
+    def nativeEventFilter(self, event_type, message):
+        if event_type == b"windows_generic_MSG":
+            from .win_clipboard import hotkey_id
+            if hotkey_id(int(message)) == self.hotkey_id:
+                self.callback()
+                return True, 0
+        return False, 0
+
+
+class RecognitionWorker(QObject):
+    """Starts recognition sessions on its own QThread"""
+    
+    # Emitted with each transcription, from the recognizer's audio thread
+    transcribed = pyqtSignal(str)
+    # Emitted once a session has been started (or failed to start)
+    finished = pyqtSignal()
+    
+    def __init__(self, recognizer: Any, logger: logging.Logger):
+        super().__init__()
+        self.recognizer = recognizer
+        self.logger = logger
+        
+    @pyqtSlot()
+    def run(self):
+        """Start listening, reporting transcriptions through a signal"""
+        try:
+            self.recognizer.start_listening(self.transcribed.emit)
+        except Exception:
+            self.logger.exception("Error in recognition worker")
+        finally:
+            self.finished.emit()
+
+
 class MumbleQuickQt(QObject):
     """Main application class for Mumble Quick using PyQt5"""
     
     # Signal for transcription received
     transcription_received = pyqtSignal(str)
     
-    def __init__(self):
-        """Initialize the application"""
+    def __init__(self, recognizer_factory: Callable[[], Any] = create_adaptive_speech_recognizer,
+                 config: Optional[QuickConfig] = None):
+        """
+        Initialize the application
+        
+        Args:
+            recognizer_factory: Callable that creates the speech recognizer
+            config: Settings to use; loaded from the config file if omitted
+        """
         super().__init__()
         try:
             self.logger = setup_logging('quick')
             self.logger.info("Initializing Mumble Quick (PyQt5)...")
             
+            self.config = config if config is not None else QuickConfig()
+            
             # Initialize Qt Application if not exists
             self.app = QApplication.instance()
             if self.app is None:
                 self.app = QApplication(sys.argv)
                 self.app.setQuitOnLastWindowClosed(False)  # Keep app running when UI hidden
             
-            self.recognizer = create_adaptive_speech_recognizer()
-            self.logger.info("Adaptive speech recognizer initialized")
+            self.recognizer = recognizer_factory()
+            self.logger.info("Speech recognizer initialized")
             
             self.ui = WaveformBar()
             self.ui.close_requested.connect(self.stop_listening)
             self.ui.hide()  # Hide window initially
             self.logger.info("PyQt5 UI initialized and hidden")
             
+            self.text_output = TextInserter(QTimer.singleShot, self.logger)
+            
             # Connect transcription signal
-            self.transcription_received.connect(self.insert_text)
-            
-            self.recognition_thread = None
-            
-            # Set up hotkey - using a more specific combination
-            try:
-                # Try primary hotkey first (just Ctrl+Alt instead of Ctrl+Alt+M)
-                keyboard.add_hotkey('ctrl+alt', self.on_hotkey_pressed, suppress=True)
-                self.logger.info("Primary hotkey (Ctrl+Alt) registered successfully")
-            except Exception as primary_error:
-                self.logger.warning(f"Failed to register primary hotkey: {primary_error}")
-                try:
-                    # Fallback to secondary hotkey (Ctrl+Shift)
-                    keyboard.add_hotkey('ctrl+shift', self.on_hotkey_pressed, suppress=True)
-                    self.logger.info("Secondary hotkey (Ctrl+Shift) registered successfully")
-                except Exception as secondary_error:
-                    self.logger.error(f"Failed to register secondary hotkey: {secondary_error}")
-                    self.logger.error(traceback.format_exc())
-                    raise
+            self.transcription_received.connect(self.insert_text, Qt.QueuedConnection)
+            
+            # One long-lived worker starts recognition sessions on request,
+            # keeping the recognizer's startup off the GUI thread
+            self._start_pending = False
+            self.recognition_thread = QThread()
+            self._worker = RecognitionWorker(self.recognizer, self.logger)
+            self._worker.moveToThread(self.recognition_thread)
+            self._worker.transcribed.connect(self.on_transcription, Qt.QueuedConnection)
+            self._worker.finished.connect(self._on_worker_finished, Qt.QueuedConnection)
+            self.recognition_thread.start()
+            
+            # Tells hotkey presses apart from autorepeat
+            self._hotkey_debouncer = HotkeyDebouncer()
+            
+            # Set up the configured hotkey, preferring one Windows filters
+            # for us over a keyboard hook that runs Python on every keystroke
+            self.hotkey_trigger = self.config.hotkey_trigger
+            self._hotkey_filter = None
+            if not (sys.platform == "win32" and self._register_native_hotkey()):
+                self.hotkey_name = register_keyboard_hotkey(
+                    self.hotkey_trigger, self.on_hotkey_pressed, self.logger)
                 
-        except Exception as e:
-            self.logger.error(f"Initialization failed: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Initialization failed")
             raise
     
+    def _register_native_hotkey(self) -> bool:
+        """Register the hotkey with Windows, returning whether it worked"""
+        from .win_clipboard import parse_hotkey, register_hotkey
+        native = parse_hotkey(self.hotkey_trigger)
+        if native is None:
+            # RegisterHotKey cannot take modifier-only hotkeys such as Ctrl+Alt
+            self.logger.info(
+                f"Hotkey {hotkey_label(self.hotkey_trigger)} has no non-modifier key; "
+                "using the keyboard hook instead of a native hotkey")
+            return False
+        try:
+            register_hotkey(NATIVE_HOTKEY_ID, *native)
+        except OSError as e:
+            self.logger.warning(f"Failed to register native hotkey: {e}")
+            return False
+        self._hotkey_filter = NativeHotkeyFilter(NATIVE_HOTKEY_ID, self.on_hotkey_pressed)
+        self.app.installNativeEventFilter(self._hotkey_filter)
+        self.hotkey_name = hotkey_label(self.hotkey_trigger)
+        self.logger.info(f"Native hotkey ({self.hotkey_name}) registered successfully")
+        return True
+        
     def on_hotkey_pressed(self):
         """Handle hotkey press - toggle listening state"""
+        # Holding the keys repeats the event; only act after a quiet gap
+        if not self._hotkey_debouncer.is_new_press():
+            return
+            
         try:
             self.logger.info("Hotkey pressed! Toggling listening...")
             
             # Use QTimer to ensure we're in the main Qt thread
             QTimer.singleShot(0, self.toggle_listening)
             
-        except Exception as e:
-            self.logger.error(f"Error in on_hotkey_pressed: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error in on_hotkey_pressed")
             
     def toggle_listening(self):
         """Toggle speech recognition on/off"""
@@ -96,35 +180,33 @@ class MumbleQuickQt(QObject):
                 self.start_listening()
             else:
                 self.stop_listening()
-        except Exception as e:
-            self.logger.error(f"Error in toggle_listening: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error in toggle_listening")
             
     def start_listening(self):
         """Start speech recognition"""
         try:
             self.logger.info("Starting listening...")
-            if self.recognition_thread and self.recognition_thread.is_alive():
-                self.logger.info("Recognition thread already running")
+            if self._start_pending:
+                self.logger.info("Recognition already requested")
                 return
                 
             # Show UI
             self.ui.show()
             self.logger.info("UI shown")
             
-            # Start recognition in a separate thread
-            self.recognition_thread = Thread(
-                target=self.recognizer.start_listening,
-                args=(self.on_transcription,),
-                daemon=True
-            )
-            self.recognition_thread.start()
-            self.logger.info("Recognition thread started")
+            # Run the worker's start on its own thread
+            self._start_pending = True
+            QMetaObject.invokeMethod(self._worker, 'run', Qt.QueuedConnection)
+            self.logger.info("Recognition requested")
             
-        except Exception as e:
-            self.logger.error(f"Error in start_listening: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error in start_listening")
             
+    def _on_worker_finished(self):
+        """Allow the next start once the worker has started a session"""
+        self._start_pending = False
+        
     def stop_listening(self):
         """Stop speech recognition"""
         try:
@@ -132,44 +214,39 @@ class MumbleQuickQt(QObject):
             self.recognizer.stop_listening()
             self.ui.hide()
             self.logger.info("Listening stopped")
-        except Exception as e:
-            self.logger.error(f"Error in stop_listening: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error in stop_listening")
             
     def on_transcription(self, text: str):
-        """Handle transcribed text - emit signal to main thread"""
-        try:
-            if text:
-                self.logger.info(f"Received transcription: {text}")
-                # Emit signal to be handled in main Qt thread
-                self.transcription_received.emit(text)
-        except Exception as e:
-            self.logger.error(f"Error in on_transcription: {e}")
-            self.logger.error(traceback.format_exc())
+        """Handle transcribed text - insert it on the main thread"""
+        # No try/except: insert_text handles its own errors, and this runs
+        # for every transcription
+        if not text:
+            return
+        self.logger.info("Received transcription: %s", text)
+        if QThread.currentThread() is self.thread():
+            # Already on the main thread, no event to queue
+            self.insert_text(text)
+        else:
+            # Emit signal to be handled in main Qt thread
+            self.transcription_received.emit(text)
     
     def insert_text(self, text: str):
         """Insert text at current cursor position"""
-        try:
-            # Type the text at current cursor position
-            pyperclip.copy(text)
-            pyautogui.hotkey('ctrl', 'v')
-            self.logger.info("Text inserted successfully")
-        except Exception as e:
-            self.logger.error(f"Error inserting text: {e}")
-            self.logger.error(traceback.format_exc())
+        self.text_output.insert_text(text)
             
     def run(self):
         """Run the application"""
         try:
             self.logger.info("Starting Mumble Quick (PyQt5) application")
-            print("Mumble Quick (PyQt5) is running.")
-            print("Press Ctrl+Alt (or Ctrl+Shift) to start/stop speech recognition.")
-            print("Check the logs directory for detailed information.")
+            sys.stdout.write(WELCOME_MESSAGE.format(
+                app="Mumble Quick (PyQt5)", hotkey=self.hotkey_name))
             
-            # Set up periodic status check
-            self.status_timer = QTimer()
-            self.status_timer.timeout.connect(self.check_status)
-            self.status_timer.start(5000)  # Check every 5 seconds
+            # Set up periodic status check, only useful with debug logging on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.status_timer = QTimer()
+                self.status_timer.timeout.connect(self.check_status)
+                self.status_timer.start(5000)  # Check every 5 seconds
             
             # Run the Qt event loop
             return self.app.exec_()
@@ -177,19 +254,26 @@ class MumbleQuickQt(QObject):
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt")
             return 0
-        except Exception as e:
-            self.logger.error(f"Error in main loop: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error in main loop")
             return 1
         finally:
             self.logger.info("Shutting down Mumble Quick (PyQt5)")
             self.stop_listening()
+            self.recognition_thread.quit()
+            self.recognition_thread.wait()
+            if self._hotkey_filter is not None:
+                from .win_clipboard import unregister_hotkey
+                unregister_hotkey(NATIVE_HOTKEY_ID)
+            self.config.close()
     
     def check_status(self):
         """Periodically check status for debugging"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         try:
             # This method helps us debug UI state
-            self.logger.debug(f"Status check - is_listening: {self.recognizer.is_listening}")
+            self.logger.debug("Status check - is_listening: %s", self.recognizer.is_listening)
         except Exception as e:
             self.logger.error(f"Error in check_status: {e}")
 
@@ -3,16 +3,21 @@ Configuration module for Mumble Quick
 """
 
 import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping, Optional, Tuple
 
 from shared.config import ConfigHandler
 
-# Default configuration
-DEFAULTS: Dict[str, Any] = {
+# Default configuration (read-only so the sections cannot be swapped out)
+DEFAULTS: Mapping[str, Any] = MappingProxyType({
     # Hotkey settings
     'hotkey': {
-        'trigger': 'ctrl+alt',
+        # Needs a non-modifier key for Windows to register it natively
+        'trigger': 'ctrl+alt+space',
         'stop': 'esc',
     },
     
@@ -52,8 +57,52 @@ DEFAULTS: Dict[str, Any] = {
         'save_position': True,
         'last_position': None,  # Will be updated with actual position
     }
+})
+
+_HEX_COLOR = re.compile(r'#[0-9A-Fa-f]{6}')
+_LANGUAGE_CODE = re.compile(r'[a-z]{2,3}-[A-Z]{2}')
+
+def _positive(value: Any) -> bool:
+    return value > 0
+
+def _non_negative(value: Any) -> bool:
+    return value >= 0
+
+def _fraction(value: Any) -> bool:
+    return 0 <= value <= 1
+
+def _hex_color(value: Any) -> bool:
+    return isinstance(value, str) and _HEX_COLOR.fullmatch(value) is not None
+
+def _language_code(value: Any) -> bool:
+    return isinstance(value, str) and _LANGUAGE_CODE.fullmatch(value) is not None
+
+def _optional_positive(value: Any) -> bool:
+    return value is None or value > 0
+
+# Check and description for each constrained setting. Updates are only
+# checked for the keys they contain.
+SETTING_CHECKS: Dict[str, Dict[str, Tuple[Callable[[Any], bool], str]]] = {
+    'ui': {
+        'bar_width': (_positive, "a positive number"),
+        'bar_height': (_positive, "a positive number"),
+        'background_color': (_hex_color, "a #RRGGBB color"),
+        'foreground_color': (_hex_color, "a #RRGGBB color"),
+        'font_color': (_hex_color, "a #RRGGBB color"),
+        'opacity': (_fraction, "a number between 0 and 1"),
+        'animation_speed': (_positive, "a positive number"),
+    },
+    'speech': {
+        'language': (_language_code, "a language code like 'en-US'"),
+        'ambient_duration': (_non_negative, "a non-negative number"),
+        'phrase_timeout': (_optional_positive, "a positive number or None"),
+        'auto_stop_timeout': (_positive, "a positive number"),
+    },
 }
 
+# Window moves closer together than this are written to disk once
+POSITION_SAVE_DELAY_S = 0.5
+
 class QuickConfig:
     """Configuration manager for Mumble Quick"""
     
@@ -62,68 +111,141 @@ class QuickConfig:
         config_dir = Path(__file__).parent
         self.handler = ConfigHandler('quick', config_dir, DEFAULTS)
         
+        # Section dicts fetched from the handler, invalidated on reset
+        self._sections: Dict[str, Dict[str, Any]] = {}
+        
+        # Single background writer, so saving never blocks the UI thread
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix='quick-config-io')
+        
+        # Pending write of the last saved window position
+        self._position_timer: Optional[threading.Timer] = None
+        
+    def _section(self, name: str) -> Dict[str, Any]:
+        """Get a settings section, fetching it from the handler once"""
+        section = self._sections.get(name)
+        if section is None:
+            section = self.handler.config.get(name)
+            if section is None:
+                # Missing from the file: add a copy of the defaults, marked
+                # unsaved so the next save writes it
+                section = self.handler.patch(name, {}, save=False)
+            self._sections[name] = section
+        return section
+        
+    def _check_values(self, name: str, updates: Dict[str, Any]) -> None:
+        """Raise ValueError if any update fails its setting's check"""
+        checks = SETTING_CHECKS.get(name, {})
+        for key, value in updates.items():
+            check = checks.get(key)
+            if check is None:
+                continue
+            is_valid, expected = check
+            try:
+                if is_valid(value):
+                    continue
+            except TypeError:
+                pass
+            raise ValueError(f"Invalid {name} setting {key!r}: expected {expected}, got {value!r}")
+            
+    def _update_section(self, name: str, updates: Dict[str, Any]) -> None:
+        """Update a settings section in place and persist it"""
+        self._check_values(name, updates)
+        self._sections[name] = self.handler.patch(name, updates)
+        
+    def update_settings(self, updates: Dict[str, Dict[str, Any]]) -> Future:
+        """
+        Update several settings sections and persist them in the background
+        
+        The cached sections change immediately; the returned future
+        completes once the configuration has been written.
+        """
+        # Check every section first so a bad value changes nothing
+        for name, section_updates in updates.items():
+            self._check_values(name, section_updates)
+        # Changed under the handler's lock, which the writer also holds
+        # while serializing, so it never sees a section mid-update
+        for name, section_updates in updates.items():
+            self._sections[name] = self.handler.patch(name, section_updates, save=False)
+        return self._io.submit(self._save)
+        
+    def _save(self) -> None:
+        """Write the configuration, raising OSError if that failed"""
+        if not self.handler.save_config():
+            raise OSError(f"Could not save {self.handler.config_file}")
+        
     @property
     def hotkey_trigger(self) -> str:
         """Get hotkey trigger combination"""
-        return self.handler.get('hotkey')['trigger']
+        return self._section('hotkey')['trigger']
         
     @hotkey_trigger.setter
     def hotkey_trigger(self, value: str) -> None:
         """Set hotkey trigger combination"""
-        current = self.handler.get('hotkey')
-        current['trigger'] = value
-        self.handler.set('hotkey', current)
+        self._update_section('hotkey', {'trigger': value})
         
     @property
     def ui_settings(self) -> Dict[str, Any]:
         """Get UI settings"""
-        return self.handler.get('ui')
+        return self._section('ui')
         
     def update_ui_settings(self, updates: Dict[str, Any]) -> None:
         """Update UI settings"""
-        current = self.ui_settings
-        current.update(updates)
-        self.handler.set('ui', current)
+        self._update_section('ui', updates)
         
     @property
     def speech_settings(self) -> Dict[str, Any]:
         """Get speech recognition settings"""
-        return self.handler.get('speech')
+        return self._section('speech')
         
     def update_speech_settings(self, updates: Dict[str, Any]) -> None:
         """Update speech recognition settings"""
-        current = self.speech_settings
-        current.update(updates)
-        self.handler.set('speech', current)
+        self._update_section('speech', updates)
         
     @property
     def tray_settings(self) -> Dict[str, Any]:
         """Get system tray settings"""
-        return self.handler.get('tray')
+        return self._section('tray')
         
     def update_tray_settings(self, updates: Dict[str, Any]) -> None:
         """Update system tray settings"""
-        current = self.tray_settings
-        current.update(updates)
-        self.handler.set('tray', current)
+        self._update_section('tray', updates)
         
     @property
     def behavior_settings(self) -> Dict[str, Any]:
         """Get behavior settings"""
-        return self.handler.get('behavior')
+        return self._section('behavior')
         
     def update_behavior_settings(self, updates: Dict[str, Any]) -> None:
         """Update behavior settings"""
-        current = self.behavior_settings
-        current.update(updates)
-        self.handler.set('behavior', current)
+        self._update_section('behavior', updates)
         
     def save_window_position(self, x: int, y: int) -> None:
-        """Save window position"""
-        current = self.behavior_settings
-        current['last_position'] = {'x': x, 'y': y}
-        self.handler.set('behavior', current)
+        """Save window position, writing it out once the window settles"""
+        self._sections['behavior'] = self.handler.patch(
+            'behavior', {'last_position': {'x': x, 'y': y}}, save=False)
+        if self._position_timer is not None:
+            self._position_timer.cancel()
+        self._position_timer = threading.Timer(POSITION_SAVE_DELAY_S, self._flush_position)
+        self._position_timer.start()
+        
+    def _flush_position(self) -> None:
+        """Persist the behavior section holding the last window position"""
+        self._position_timer = None
+        self.handler.save_config()
+        
+    def close(self) -> None:
+        """Write any pending window position and stop the background writer"""
+        timer, self._position_timer = self._position_timer, None
+        if timer is not None:
+            timer.cancel()
+            self.handler.save_config()
+        # Waits for settings saves already submitted
+        self._io.shutdown(wait=True)
         
     def reset_to_defaults(self) -> None:
         """Reset all settings to defaults"""
-        self.handler.reset() 
\ No newline at end of file
+        if self._position_timer is not None:
+            self._position_timer.cancel()
+            self._position_timer = None
+        self.handler.reset()
+        self._sections.clear() 
@@ -0,0 +1,69 @@
+"""
+Shared fixtures for Mumble Quick tests
+"""
+
+import contextlib
+import copy
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from ..config.quick_config import QuickConfig
+
+@pytest.fixture(scope="session")
+def root():
+    """Create a hidden root window shared by all tests"""
+    root = tk.Tk()
+    root.withdraw()
+    yield root
+    # Tests may already have torn the interpreter down
+    with contextlib.suppress(tk.TclError):
+        root.destroy()
+
+@pytest.fixture
+def clean_root(root):
+    """Yield the shared root, destroying any windows a test leaves on it"""
+    # Session windows such as the dialog prototype outlive each test
+    existing = set(root.winfo_children())
+    yield root
+    for child in root.winfo_children():
+        if child not in existing:
+            child.destroy()
+    root.update_idletasks()
+
+@pytest.fixture(scope="session")
+def _quick_config_template(tmp_path_factory) -> QuickConfig:
+    """Build one QuickConfig for the session, saved to a session directory"""
+    config_dir = tmp_path_factory.mktemp("config")
+    config = QuickConfig()
+    config.handler.config_dir = config_dir
+    config.handler.config_file = config_dir / "quick_config.json"
+    config.handler.dirty = True
+    config.handler.save_config()
+    yield config
+    config.close()
+
+@pytest.fixture
+def temp_config_dir(tmp_path) -> Path:
+    """Create temporary config directory"""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    return config_dir
+
+@pytest.fixture
+def quick_config(_quick_config_template, temp_config_dir) -> QuickConfig:
+    """Copy the template QuickConfig, saving to a temporary directory"""
+    config = copy.copy(_quick_config_template)
+    config.handler = copy.copy(config.handler)
+    config.handler.config = copy.deepcopy(config.handler.config)
+    config.handler.config_dir = temp_config_dir
+    config.handler.config_file = temp_config_dir / "quick_config.json"
+    config._sections = {}
+    # Own writer and timer, so closing one copy leaves the template usable
+    config._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix='quick-config-io')
+    config._position_timer = None
+    yield config
+    # Don't let a debounced position write or a save outlive the test
+    config.close()
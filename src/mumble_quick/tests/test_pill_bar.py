@@ -6,6 +6,7 @@ import pytest
 import tkinter as tk
 from unittest.mock import MagicMock, patch
 import time
+import random
 import logging
 
 from ..ui.pill_bar import WaveformBar
@@ -15,6 +16,9 @@ def bar():
     """Create WaveformBar instance"""
     with patch('tkinter.Tk.mainloop'):  # Prevent mainloop from blocking tests
         bar = WaveformBar()
+        # The bar starts withdrawn; map it so animation frames actually run
+        bar.deiconify()
+        bar.update()
         yield bar
         bar.destroy()
 
@@ -88,11 +92,10 @@ def test_dragging(bar):
     assert bar.winfo_x() > initial_x
     assert bar.winfo_y() > initial_y
 
-@patch('random.uniform')
-def test_waveform_animation(mock_random, bar):
+def test_waveform_animation(bar):
     """Test waveform animation"""
-    # Mock random values for predictable animation
-    mock_random.return_value = 1.0
+    # Seed the random source for predictable animation
+    bar._rng = random.Random(0)
     
     # Start animation
     bar.start_animation()
@@ -115,10 +118,25 @@ def test_waveform_animation(mock_random, bar):
     assert not bar.is_listening
     assert bar.animation_id is None
 
+def test_animation_lapses_while_hidden(bar):
+    """Test the frame loop stops while withdrawn and resumes when mapped"""
+    bar.withdraw()
+    bar.update()
+    bar.start_animation()
+    assert bar.is_listening
+    assert bar.animation_id is None
+    
+    bar.deiconify()
+    bar.update()
+    assert bar.animation_id is not None
+    
+    bar.stop_animation()
+
 def test_show_hide(bar):
     """Test show/hide functionality"""
     # Test show
     bar.show()
+    bar.update()
     assert bar.winfo_viewable()
     assert bar.is_listening
     
@@ -138,37 +156,39 @@ def test_show_hide(bar):
 
 def test_animation_smoothness(bar):
     """Test animation smoothness and transitions"""
-    # Start with zero points
-    bar.points = [0] * 20
+    # Start with zero points and a seeded random source
+    bar.points = [0.0] * 20
+    bar._rng = random.Random(0)
+    bar.start_animation()
     
-    # Mock random to return increasing values
-    values = list(range(20))
-    with patch('random.uniform', side_effect=lambda min, max: values.pop(0)):
-        bar.start_animation()
-        
-        # Run a few animation frames
-        for _ in range(3):
-            bar.update()
-            time.sleep(0.05)
+    # Run a few animation frames
+    for _ in range(3):
+        bar.update()
+        time.sleep(0.05)
+    
+    # Check that points have moved and been smoothly interpolated
+    assert len(bar.points) == 20
+    assert any(point != 0 for point in bar.points)
+    for point in bar.points:
+        assert -5 <= point <= 5  # Points should be within range
         
-        # Check that points have been smoothly interpolated
-        for point in bar.points:
-            assert 0 <= point <= 5  # Points should be within range
-            
-        # Verify smooth transitions
-        differences = [abs(bar.points[i] - bar.points[i-1]) 
-                      for i in range(1, len(bar.points))]
-        avg_difference = sum(differences) / len(differences)
-        assert avg_difference < 2.0  # Transitions should be smooth
+    # Verify smooth transitions
+    differences = [abs(bar.points[i] - bar.points[i-1]) 
+                  for i in range(1, len(bar.points))]
+    avg_difference = sum(differences) / len(differences)
+    assert avg_difference < 2.0  # Transitions should be smooth
 
 def test_error_handling(bar):
     """Test error handling in animations"""
     # Test animation with invalid points
     bar.points = None  # Invalid points
     
-    # Should not raise exception
+    # Should not raise exception, and the failing frame stops the loop
     bar.start_animation()
     bar.update()
+    assert bar.is_listening
+    assert bar.animation_id is None
+    bar.stop_animation()
     
     # Test with invalid canvas
     bar.canvas.destroy()
@@ -186,6 +206,7 @@ def test_memory_management(bar):
         bar.start_animation()
         bar.update()
         bar.stop_animation()
+    assert any(point != 0 for point in bar.points)  # Frames were drawn
     
     # Verify no widget leaks
     final_widgets = len(bar.winfo_children())
@@ -206,6 +227,7 @@ def test_performance(bar):
         bar.update()
         frame_times.append(time.perf_counter() - start)
     bar.stop_animation()
+    assert any(point != 0 for point in bar.points)  # Frames were drawn
     
     # Average frame time should be reasonable
     avg_frame_time = sum(frame_times) / len(frame_times)
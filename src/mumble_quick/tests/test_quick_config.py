@@ -8,20 +8,6 @@ from typing import Dict, Any
 
 from ..config.quick_config import QuickConfig, DEFAULTS
 
-@pytest.fixture
-def temp_config_dir(tmp_path) -> Path:
-    """Create temporary config directory"""
-    return tmp_path / "config"
-
-@pytest.fixture
-def quick_config(temp_config_dir) -> QuickConfig:
-    """Create QuickConfig instance with temporary directory"""
-    config = QuickConfig()
-    config.handler.config_dir = temp_config_dir
-    config.handler.config_file = temp_config_dir / "quick_config.json"
-    config.handler.save_config()
-    return config
-
 def test_default_values(quick_config):
     """Test default configuration values"""
     # Hotkey settings
@@ -61,6 +47,10 @@ def test_default_values(quick_config):
     assert behavior['capitalize_sentences'] == DEFAULTS['behavior']['capitalize_sentences']
     assert behavior['save_position'] == DEFAULTS['behavior']['save_position']
     assert behavior['last_position'] == DEFAULTS['behavior']['last_position']
+    
+    # Defaults are read-only
+    with pytest.raises(TypeError):
+        DEFAULTS['ui'] = {}
 
 def test_hotkey_trigger(quick_config):
     """Test hotkey trigger property"""
@@ -144,6 +134,39 @@ def test_update_behavior_settings(quick_config):
     assert behavior['save_position'] is False
     assert behavior['last_position'] == {'x': 100, 'y': 100}
 
+def test_update_settings(quick_config, monkeypatch):
+    """Test updating several sections saves the config once, in the background"""
+    writes = []
+    monkeypatch.setattr(quick_config.handler, '_write_file', writes.append)
+    
+    saved = quick_config.update_settings({
+        'ui': {'bar_width': 150},
+        'tray': {'start_minimized': True},
+    })
+    assert quick_config.ui_settings['bar_width'] == 150
+    assert quick_config.tray_settings['start_minimized'] is True
+    
+    saved.result()
+    assert len(writes) == 1
+    assert quick_config.handler.get('ui')['bar_width'] == 150
+    
+    # A bad value in any section leaves every section unchanged
+    with pytest.raises(ValueError):
+        quick_config.update_settings({
+            'ui': {'bar_width': 200},
+            'speech': {'language': 'english'},
+        })
+    assert quick_config.ui_settings['bar_width'] == 150
+    
+    # A failed write fails the returned future
+    def failing_write(data):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(quick_config.handler, '_write_file', failing_write)
+    saved = quick_config.update_settings({'ui': {'bar_width': 160}})
+    with pytest.raises(OSError):
+        saved.result()
+
 def test_save_window_position(quick_config):
     """Test saving window position"""
     quick_config.save_window_position(100, 200)
@@ -151,6 +174,72 @@ def test_save_window_position(quick_config):
     behavior = quick_config.behavior_settings
     assert behavior['last_position'] == {'x': 100, 'y': 200}
 
+def test_window_position_writes_debounced(quick_config, monkeypatch):
+    """Test that a burst of window moves is written to disk once"""
+    monkeypatch.setattr('mumble_quick.config.quick_config.POSITION_SAVE_DELAY_S', 0.05)
+    writes = []
+    monkeypatch.setattr(quick_config.handler, '_write_file', writes.append)
+    
+    for x in range(10):
+        quick_config.save_window_position(x, 200)
+    timer = quick_config._position_timer
+    assert quick_config.behavior_settings['last_position'] == {'x': 9, 'y': 200}
+    assert writes == []
+    
+    timer.join()
+    assert len(writes) == 1
+    assert '"x": 9' in writes[0]
+
+def test_close_writes_pending_position(quick_config, monkeypatch):
+    """Test that closing writes a debounced position at once and stops the writer"""
+    monkeypatch.setattr('mumble_quick.config.quick_config.POSITION_SAVE_DELAY_S', 60)
+    writes = []
+    monkeypatch.setattr(quick_config.handler, '_write_file', writes.append)
+    
+    quick_config.save_window_position(30, 40)
+    quick_config.close()
+    
+    assert quick_config._position_timer is None
+    assert len(writes) == 1
+    assert '"x": 30' in writes[0]
+    with pytest.raises(RuntimeError):
+        quick_config.update_settings({'ui': {'bar_width': 150}})
+
+def test_section_cache_refreshed_on_reset(quick_config):
+    """Test that settings sections are cached until a reset"""
+    ui = quick_config.ui_settings
+    assert quick_config.ui_settings is ui
+    
+    quick_config.update_ui_settings({'bar_width': 150})
+    assert quick_config.ui_settings is ui
+    assert ui['bar_width'] == 150
+    
+    quick_config.reset_to_defaults()
+    assert quick_config.ui_settings is quick_config.handler.get('ui')
+    assert quick_config.ui_settings['bar_width'] == DEFAULTS['ui']['bar_width']
+
+def test_missing_section_does_not_share_defaults(quick_config):
+    """Test a section absent from the file is copied, not taken from DEFAULTS"""
+    del quick_config.handler.config['behavior']
+    
+    quick_config.update_settings({'behavior': {'auto_paste': False}}).result()
+    quick_config.save_window_position(100, 100)
+    quick_config._position_timer.cancel()
+    
+    assert quick_config.behavior_settings['auto_paste'] is False
+    assert DEFAULTS['behavior']['auto_paste'] is True
+    assert DEFAULTS['behavior']['last_position'] is None
+
+def test_missing_section_is_saved(quick_config):
+    """Test a section added because it was missing is written on the next save"""
+    del quick_config.handler.config['tray']
+    quick_config.handler.save_config(force=True)
+    
+    assert quick_config.tray_settings == DEFAULTS['tray']
+    assert quick_config.handler.dirty
+    quick_config.handler.save_config()
+    assert '"tray"' in quick_config.handler.config_file.read_text(encoding='utf-8')
+
 def test_reset_to_defaults(quick_config):
     """Test resetting all settings to defaults"""
     # Modify settings
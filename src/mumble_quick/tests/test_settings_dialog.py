@@ -11,32 +11,20 @@ from unittest.mock import MagicMock, patch
 from ..config.quick_config import QuickConfig
 from ..ui.settings_dialog import SettingsDialog
 
-@pytest.fixture
-def root():
-    """Create root window"""
-    root = tk.Tk()
-    yield root
-    root.destroy()
-
-@pytest.fixture
-def temp_config_dir(tmp_path) -> Path:
-    """Create temporary config directory"""
-    return tmp_path / "config"
+@pytest.fixture(scope="session")
+def _dialog_prototype(root, _quick_config_template):
+    """Build one settings dialog shared by the read-only tests"""
+    return SettingsDialog(root, _quick_config_template)
 
 @pytest.fixture
-def quick_config(temp_config_dir) -> QuickConfig:
-    """Create QuickConfig instance with temporary directory"""
-    config = QuickConfig()
-    config.handler.config_dir = temp_config_dir
-    config.handler.config_file = temp_config_dir / "quick_config.json"
-    config.handler.save_config()
-    return config
+def dialog(clean_root, _dialog_prototype):
+    """Return the shared settings dialog; tests must not modify it"""
+    return _dialog_prototype
 
 @pytest.fixture
-def dialog(root, quick_config):
-    """Create settings dialog"""
-    dialog = SettingsDialog(root, quick_config)
-    return dialog
+def mutable_dialog(clean_root, quick_config):
+    """Create a fresh settings dialog on the shared root"""
+    return SettingsDialog(clean_root, quick_config)
 
 def test_dialog_initialization(dialog):
     """Test dialog initialization"""
@@ -44,42 +32,38 @@ def test_dialog_initialization(dialog):
     assert isinstance(dialog.notebook, ttk.Notebook)
     assert len(dialog.notebook.tabs()) == 5  # Hotkeys, UI, Speech, System Tray, Behavior
 
-def test_hotkey_tab_widgets(dialog):
-    """Test hotkey tab widgets"""
-    assert isinstance(dialog.hotkey_trigger, ttk.Entry)
-    assert isinstance(dialog.hotkey_stop, ttk.Entry)
-
-def test_ui_tab_widgets(dialog):
-    """Test UI tab widgets"""
-    assert isinstance(dialog.bar_width, ttk.Spinbox)
-    assert isinstance(dialog.bar_height, ttk.Spinbox)
-    assert isinstance(dialog.bg_color, tk.StringVar)
-    assert isinstance(dialog.fg_color, tk.StringVar)
-    assert isinstance(dialog.font_color, tk.StringVar)
-    assert isinstance(dialog.opacity, ttk.Scale)
-    assert isinstance(dialog.animation_speed, ttk.Scale)
-    assert isinstance(dialog.show_close_button, tk.BooleanVar)
-
-def test_speech_tab_widgets(dialog):
-    """Test speech tab widgets"""
-    assert isinstance(dialog.language, ttk.Combobox)
-    assert isinstance(dialog.ambient_duration, ttk.Spinbox)
-    assert isinstance(dialog.phrase_timeout, ttk.Spinbox)
-    assert isinstance(dialog.auto_stop, tk.BooleanVar)
-    assert isinstance(dialog.auto_stop_timeout, ttk.Spinbox)
-
-def test_tray_tab_widgets(dialog):
-    """Test system tray tab widgets"""
-    assert isinstance(dialog.show_notifications, tk.BooleanVar)
-    assert isinstance(dialog.minimize_to_tray, tk.BooleanVar)
-    assert isinstance(dialog.start_minimized, tk.BooleanVar)
-
-def test_behavior_tab_widgets(dialog):
-    """Test behavior tab widgets"""
-    assert isinstance(dialog.auto_paste, tk.BooleanVar)
-    assert isinstance(dialog.add_trailing_space, tk.BooleanVar)
-    assert isinstance(dialog.capitalize_sentences, tk.BooleanVar)
-    assert isinstance(dialog.save_position, tk.BooleanVar)
+@pytest.mark.parametrize("attr,expected_type", [
+    # Hotkey tab
+    ('hotkey_trigger', ttk.Entry),
+    ('hotkey_stop', ttk.Entry),
+    # UI tab
+    ('bar_width', ttk.Spinbox),
+    ('bar_height', ttk.Spinbox),
+    ('bg_color', tk.StringVar),
+    ('fg_color', tk.StringVar),
+    ('font_color', tk.StringVar),
+    ('opacity', ttk.Scale),
+    ('animation_speed', ttk.Scale),
+    ('show_close_button', tk.BooleanVar),
+    # Speech tab
+    ('language', ttk.Combobox),
+    ('ambient_duration', ttk.Spinbox),
+    ('phrase_timeout', ttk.Spinbox),
+    ('auto_stop', tk.BooleanVar),
+    ('auto_stop_timeout', ttk.Spinbox),
+    # System tray tab
+    ('show_notifications', tk.BooleanVar),
+    ('minimize_to_tray', tk.BooleanVar),
+    ('start_minimized', tk.BooleanVar),
+    # Behavior tab
+    ('auto_paste', tk.BooleanVar),
+    ('add_trailing_space', tk.BooleanVar),
+    ('capitalize_sentences', tk.BooleanVar),
+    ('save_position', tk.BooleanVar),
+])
+def test_tab_widgets(dialog, attr, expected_type):
+    """Test tab widget types"""
+    assert isinstance(getattr(dialog, attr), expected_type)
 
 def test_load_settings(dialog, quick_config):
     """Test loading settings into UI"""
@@ -120,40 +104,40 @@ def test_load_settings(dialog, quick_config):
     assert dialog.capitalize_sentences.get() == behavior['capitalize_sentences']
     assert dialog.save_position.get() == behavior['save_position']
 
-def test_apply_settings(dialog, quick_config):
+def test_apply_settings(mutable_dialog, quick_config):
     """Test applying settings from UI"""
     # Modify UI values
-    dialog.hotkey_trigger.delete(0, tk.END)
-    dialog.hotkey_trigger.insert(0, 'ctrl+shift')
-    dialog.hotkey_stop.delete(0, tk.END)
-    dialog.hotkey_stop.insert(0, 'alt')
-    
-    dialog.bar_width.set('150')
-    dialog.bar_height.set('30')
-    dialog.bg_color.set('#333333')
-    dialog.fg_color.set('#00FF00')
-    dialog.font_color.set('#CCCCCC')
-    dialog.opacity.set(0.8)
-    dialog.animation_speed.set(0.5)
-    dialog.show_close_button.set(False)
-    
-    dialog.language.set('en-GB')
-    dialog.ambient_duration.set('1.0')
-    dialog.phrase_timeout.set('5.0')
-    dialog.auto_stop.set(False)
-    dialog.auto_stop_timeout.set('3.0')
-    
-    dialog.show_notifications.set(False)
-    dialog.minimize_to_tray.set(False)
-    dialog.start_minimized.set(True)
-    
-    dialog.auto_paste.set(False)
-    dialog.add_trailing_space.set(False)
-    dialog.capitalize_sentences.set(False)
-    dialog.save_position.set(False)
+    mutable_dialog.hotkey_trigger.delete(0, tk.END)
+    mutable_dialog.hotkey_trigger.insert(0, 'ctrl+shift')
+    mutable_dialog.hotkey_stop.delete(0, tk.END)
+    mutable_dialog.hotkey_stop.insert(0, 'alt')
+    
+    mutable_dialog.bar_width.set('150')
+    mutable_dialog.bar_height.set('30')
+    mutable_dialog.bg_color.set('#333333')
+    mutable_dialog.fg_color.set('#00FF00')
+    mutable_dialog.font_color.set('#CCCCCC')
+    mutable_dialog.opacity.set(0.8)
+    mutable_dialog.animation_speed.set(0.5)
+    mutable_dialog.show_close_button.set(False)
+    
+    mutable_dialog.language.set('en-GB')
+    mutable_dialog.ambient_duration.set('1.0')
+    mutable_dialog.phrase_timeout.set('5.0')
+    mutable_dialog.auto_stop.set(False)
+    mutable_dialog.auto_stop_timeout.set('3.0')
+    
+    mutable_dialog.show_notifications.set(False)
+    mutable_dialog.minimize_to_tray.set(False)
+    mutable_dialog.start_minimized.set(True)
+    
+    mutable_dialog.auto_paste.set(False)
+    mutable_dialog.add_trailing_space.set(False)
+    mutable_dialog.capitalize_sentences.set(False)
+    mutable_dialog.save_position.set(False)
     
     # Apply settings
-    dialog._apply_settings()
+    mutable_dialog._apply_settings()
     
     # Verify config values
     hotkey = quick_config.handler.get('hotkey')
@@ -188,27 +172,27 @@ def test_apply_settings(dialog, quick_config):
     assert behavior['capitalize_sentences'] is False
     assert behavior['save_position'] is False
 
-def test_reset_defaults(dialog, quick_config):
+def test_reset_defaults(mutable_dialog, quick_config):
     """Test resetting settings to defaults"""
     # Modify settings
-    dialog.hotkey_trigger.delete(0, tk.END)
-    dialog.hotkey_trigger.insert(0, 'ctrl+shift')
-    dialog.bar_width.set('150')
-    dialog.language.set('en-GB')
-    dialog.show_notifications.set(False)
-    dialog.auto_paste.set(False)
+    mutable_dialog.hotkey_trigger.delete(0, tk.END)
+    mutable_dialog.hotkey_trigger.insert(0, 'ctrl+shift')
+    mutable_dialog.bar_width.set('150')
+    mutable_dialog.language.set('en-GB')
+    mutable_dialog.show_notifications.set(False)
+    mutable_dialog.auto_paste.set(False)
     
     # Mock messagebox.askyesno to return True
     with patch('tkinter.messagebox.askyesno', return_value=True):
-        dialog._reset_defaults()
+        mutable_dialog._reset_defaults()
     
     # Verify UI values are reset
     hotkey = quick_config.handler.get('hotkey')
-    assert dialog.hotkey_trigger.get() == hotkey['trigger']
-    assert int(dialog.bar_width.get()) == quick_config.ui_settings['bar_width']
-    assert dialog.language.get() == quick_config.speech_settings['language']
-    assert dialog.show_notifications.get() == quick_config.tray_settings['show_notifications']
-    assert dialog.auto_paste.get() == quick_config.behavior_settings['auto_paste']
+    assert mutable_dialog.hotkey_trigger.get() == hotkey['trigger']
+    assert int(mutable_dialog.bar_width.get()) == quick_config.ui_settings['bar_width']
+    assert mutable_dialog.language.get() == quick_config.speech_settings['language']
+    assert mutable_dialog.show_notifications.get() == quick_config.tray_settings['show_notifications']
+    assert mutable_dialog.auto_paste.get() == quick_config.behavior_settings['auto_paste']
 
 def test_color_picker(dialog):
     """Test color picker dialog"""
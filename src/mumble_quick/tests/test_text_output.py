@@ -0,0 +1,136 @@
+"""
+Tests for the text output helpers shared by the Mumble Quick apps
+"""
+
+import logging
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+from .. import text_output
+from ..config.quick_config import DEFAULTS
+from ..text_output import (
+    HotkeyDebouncer, TextInserter, TYPE_TEXT_MAX_CHARS, hotkey_label, register_keyboard_hotkey
+)
+
+@pytest.fixture
+def inserter(monkeypatch):
+    """Create an inserter whose scheduled callbacks are only recorded"""
+    inserter = TextInserter(MagicMock(), logging.getLogger('mumble.quick.test'))
+    monkeypatch.setattr(inserter, '_type_text', MagicMock())
+    monkeypatch.setattr(inserter, '_paste_text', MagicMock())
+    return inserter
+
+def test_hotkey_debouncer(monkeypatch):
+    """Test that events in quick succession count as one press"""
+    now = [10 * text_output.HOTKEY_DEBOUNCE_NS]
+    monkeypatch.setattr(text_output.time, 'monotonic_ns', lambda: now[0])
+    debouncer = HotkeyDebouncer()
+
+    assert debouncer.is_new_press()
+    now[0] += text_output.HOTKEY_DEBOUNCE_NS // 2
+    assert not debouncer.is_new_press()
+    # Autorepeat keeps extending the quiet gap
+    now[0] += text_output.HOTKEY_DEBOUNCE_NS // 2
+    assert not debouncer.is_new_press()
+    now[0] += text_output.HOTKEY_DEBOUNCE_NS
+    assert debouncer.is_new_press()
+
+def test_hotkey_label():
+    """Test that hotkeys are shown with capitalized key names"""
+    assert hotkey_label('ctrl+alt+space') == "Ctrl+Alt+Space"
+    assert hotkey_label(' ctrl + shift ') == "Ctrl+Shift"
+
+def test_default_hotkey_has_non_modifier_key():
+    """Test that the default hotkey can be registered natively on Windows"""
+    keys = DEFAULTS['hotkey']['trigger'].split('+')
+    assert set(keys) - {'ctrl', 'alt', 'shift', 'win'}
+
+def test_register_keyboard_hotkey(monkeypatch):
+    """Test that the configured hotkey is registered, with Ctrl+Shift as fallback"""
+    registered = []
+
+    def add_hotkey(hotkey, callback, suppress):
+        if hotkey == 'bad+key':
+            raise ValueError(hotkey)
+        registered.append(hotkey)
+
+    monkeypatch.setitem(sys.modules, 'keyboard', types.SimpleNamespace(add_hotkey=add_hotkey))
+    logger = logging.getLogger('mumble.quick.test')
+
+    assert register_keyboard_hotkey('ctrl+alt+space', print, logger) == "Ctrl+Alt+Space"
+    assert register_keyboard_hotkey('bad+key', print, logger) == "Ctrl+Shift"
+    assert registered == ['ctrl+alt+space', 'ctrl+shift']
+
+def test_short_text_is_typed(inserter):
+    """Test that short text is typed without touching the clipboard"""
+    inserter.insert_text("hello")
+    inserter._type_text.assert_called_once_with("hello")
+    inserter._paste_text.assert_not_called()
+
+def test_long_text_is_pasted(inserter):
+    """Test that long text goes through the clipboard"""
+    text = "x" * (TYPE_TEXT_MAX_CHARS + 1)
+    inserter.insert_text(text)
+    inserter._type_text.assert_not_called()
+    inserter._paste_text.assert_called_once_with(text)
+
+def test_failed_typing_falls_back_to_paste(inserter):
+    """Test that text is pasted when typing it fails"""
+    inserter._type_text.side_effect = OSError("SendInput failed")
+    inserter.insert_text("hello")
+    inserter._paste_text.assert_called_once_with("hello")
+
+def test_insert_errors_are_logged(inserter, caplog):
+    """Test that a failed paste is logged rather than raised"""
+    inserter._type_text.side_effect = OSError("SendInput failed")
+    inserter._paste_text.side_effect = OSError("clipboard busy")
+    with caplog.at_level(logging.ERROR):
+        inserter.insert_text("hello")
+    assert "Error inserting text" in caplog.text
+
+@pytest.fixture
+def clipboard(monkeypatch):
+    """Replace pyperclip with a mock, as on platforms other than Windows"""
+    clipboard = MagicMock()
+    monkeypatch.setattr(text_output.sys, 'platform', 'linux')
+    monkeypatch.setitem(sys.modules, 'pyperclip', clipboard)
+    return clipboard
+
+def test_paste_restores_clipboard(clipboard):
+    """Test that the previous clipboard text is restored after a delay"""
+    inserter = TextInserter(MagicMock(), logging.getLogger('mumble.quick.test'))
+    inserter._send_paste = MagicMock()
+    clipboard.paste.return_value = "previous"
+
+    inserter._paste_text("dictated")
+    clipboard.copy.assert_called_once_with("dictated")
+    delay, restore = inserter.schedule.call_args.args
+    assert delay == text_output.CLIPBOARD_RESTORE_MS
+
+    restore()
+    clipboard.copy.assert_called_with("previous")
+
+def test_paste_skips_restoring_empty_clipboard(clipboard):
+    """Test that non-text clipboard contents are not overwritten with ''"""
+    inserter = TextInserter(MagicMock(), logging.getLogger('mumble.quick.test'))
+    inserter._send_paste = MagicMock()
+    clipboard.paste.return_value = ""
+
+    inserter._paste_text("dictated")
+    inserter.schedule.assert_not_called()
+
+def test_failed_clipboard_restore_is_logged(clipboard, caplog):
+    """Test that the scheduled restore logs errors instead of raising"""
+    inserter = TextInserter(MagicMock(), logging.getLogger('mumble.quick.test'))
+    inserter._send_paste = MagicMock()
+    clipboard.paste.return_value = "previous"
+    inserter._paste_text("dictated")
+    _, restore = inserter.schedule.call_args.args
+
+    clipboard.copy.side_effect = OSError("clipboard busy")
+    with caplog.at_level(logging.ERROR):
+        restore()
+    assert "Error restoring clipboard" in caplog.text
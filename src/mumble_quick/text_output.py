@@ -0,0 +1,160 @@
+"""
+Text output and hotkey helpers shared by the Tk and PyQt5 Mumble Quick apps
+
+Nothing here depends on the UI toolkit; the apps pass in how to schedule a
+delayed callback on their UI thread (Tk's after or QTimer.singleShot).
+"""
+
+import logging
+import sys
+import time
+from typing import Any, Callable
+
+# Hotkey events closer together than this are key autorepeat, not new presses
+HOTKEY_DEBOUNCE_NS = 250_000_000
+
+# Longer transcriptions are pasted through the clipboard instead of typed
+TYPE_TEXT_MAX_CHARS = 200
+
+# Delay before restoring the clipboard contents replaced by a paste
+CLIPBOARD_RESTORE_MS = 100
+
+# Startup banner, written to stdout in one call when an app runs
+WELCOME_MESSAGE = (
+    "{app} is running.\n"
+    "Press {hotkey} to start/stop speech recognition.\n"
+    "Check the logs directory for detailed information.\n"
+)
+
+# Runs a callback on the UI thread after a delay in milliseconds
+Scheduler = Callable[[int, Callable[[], None]], Any]
+
+
+def hotkey_label(hotkey: str) -> str:
+    """Format a keyboard library hotkey such as 'ctrl+alt+space' as 'Ctrl+Alt+Space'"""
+    return "+".join(part.strip().capitalize() for part in hotkey.split("+"))
+
+
+def register_keyboard_hotkey(hotkey: str, callback: Callable[[], None],
+                             logger: logging.Logger) -> str:
+    """
+    Register a hotkey through the keyboard library's hook
+
+    Falls back to Ctrl+Shift if the hotkey cannot be registered.
+
+    Returns:
+        The display name of the hotkey that was registered
+    """
+    # Loaded only when needed; the hook runs Python on every keystroke
+    import keyboard
+    try:
+        keyboard.add_hotkey(hotkey, callback, suppress=True)
+        name = hotkey_label(hotkey)
+        logger.info(f"Primary hotkey ({name}) registered successfully")
+        return name
+    except Exception as primary_error:
+        logger.warning(f"Failed to register primary hotkey: {primary_error}")
+        try:
+            keyboard.add_hotkey('ctrl+shift', callback, suppress=True)
+            logger.info("Secondary hotkey (Ctrl+Shift) registered successfully")
+            return "Ctrl+Shift"
+        except Exception as secondary_error:
+            # The caller logs the traceback when it catches this
+            logger.error(f"Failed to register secondary hotkey: {secondary_error}")
+            raise
+
+
+class HotkeyDebouncer:
+    """Tells new hotkey presses apart from the autorepeat of a held hotkey"""
+
+    def __init__(self):
+        # Time of the last hotkey event
+        self._last_ns = 0
+
+    def is_new_press(self) -> bool:
+        """Record a hotkey event, returning False if it followed the last too closely"""
+        now = time.monotonic_ns()
+        last, self._last_ns = self._last_ns, now
+        return now - last >= HOTKEY_DEBOUNCE_NS
+
+
+class TextInserter:
+    """Types or pastes transcribed text into the focused window"""
+
+    def __init__(self, schedule: Scheduler, logger: logging.Logger):
+        """
+        Initialize the inserter
+
+        Args:
+            schedule: Runs a callback on the UI thread after a delay in ms
+            logger: Logger for insertion results and errors
+        """
+        self.schedule = schedule
+        self.logger = logger
+
+    def insert_text(self, text: str):
+        """Insert text at current cursor position"""
+        try:
+            if len(text) <= TYPE_TEXT_MAX_CHARS:
+                try:
+                    # Type short text directly, leaving the clipboard alone
+                    self._type_text(text)
+                    self.logger.info("Text inserted successfully")
+                    return
+                except Exception as e:
+                    self.logger.warning(f"Typing failed, falling back to paste: {e}")
+            self._paste_text(text)
+            self.logger.info("Text inserted successfully")
+        except Exception:
+            self.logger.exception("Error inserting text")
+
+    def _type_text(self, text: str):
+        """Type text into the focused window"""
+        if sys.platform == "win32":
+            # The whole string goes out in one SendInput call
+            from .win_clipboard import type_text
+            type_text(text)
+        else:
+            import keyboard
+            keyboard.write(text, delay=0)
+
+    def _paste_text(self, text: str):
+        """Paste text through the clipboard, then restore its previous contents"""
+        # Imported on first paste; short transcriptions are typed and never
+        # need the clipboard
+        if sys.platform == "win32":
+            # Straight to user32, skipping pyperclip's and pyautogui's layers
+            from .win_clipboard import get_text as paste, set_text as copy, send_paste
+        else:
+            import pyperclip
+            paste, copy, send_paste = pyperclip.paste, pyperclip.copy, self._send_paste
+
+        previous = paste()
+        copy(text)
+        send_paste()
+        # An empty result may mean the clipboard held an image or files,
+        # which writing back "" would destroy
+        if previous:
+            # Give the target app time to read the clipboard before restoring it
+            self.schedule(CLIPBOARD_RESTORE_MS, lambda: self._restore_clipboard(copy, previous))
+
+    def _restore_clipboard(self, copy: Callable[[str], None], previous: str):
+        """Put back the clipboard text replaced by a paste"""
+        # Runs from a UI timer, where an uncaught error would abort the Qt
+        # app or bypass the logger under Tk
+        try:
+            copy(previous)
+        except Exception:
+            self.logger.exception("Error restoring clipboard")
+
+    def _send_paste(self):
+        """Press Ctrl+V through the keyboard library"""
+        import keyboard
+        try:
+            keyboard.send('ctrl+v')
+        except Exception as e:
+            # Fall back to pyautogui, skipping its PAUSE sleep after the hotkey.
+            # It probes the display on import, so only load it when needed.
+            self.logger.warning(f"Native paste failed, falling back to pyautogui: {e}")
+            import pyautogui
+            pyautogui.hotkey('ctrl', 'v', _pause=False)
@@ -5,9 +5,30 @@ Animated pill-shaped bar UI for Mumble Quick
 import tkinter as tk
 import math
 import random
-from typing import List, Optional
+import time
+from functools import lru_cache
+from typing import List, Optional, Tuple
 import logging
-import traceback
+
+# Nominal frame interval of the waveform animation
+FRAME_INTERVAL_MS = 50
+
+# Easing time constant: a 50 ms frame moves points 30% toward their target
+EASE_TAU_S = -(FRAME_INTERVAL_MS / 1000) / math.log(0.7)
+
+@lru_cache(maxsize=8)
+def _pill_points(width: int, height: int, radius: int) -> Tuple[int, ...]:
+    """Build the smoothed polygon outline of a pill of the given size"""
+    return (
+        radius, 0,  # Top left
+        width - radius, 0,  # Top right
+        width, radius,  # Right top
+        width, height - radius,  # Right bottom
+        width - radius, height,  # Bottom right
+        radius, height,  # Bottom left
+        0, height - radius,  # Left bottom
+        0, radius  # Left top
+    )
 
 class WaveformBar(tk.Tk):
     """A pill-shaped bar with animated waveform visualization"""
@@ -28,6 +49,12 @@ class WaveformBar(tk.Tk):
             self.height = 20
             self.geometry(f'{self.width}x{self.height}')
             
+            # Where show() places the bar: centered horizontally, a little
+            # above the bottom of the screen. The screen size is read once.
+            self._show_x = max(0, (self.winfo_screenwidth() - self.width) // 2)
+            self._show_y = max(0, self.winfo_screenheight() - 150)
+            self._show_geometry = f'{self.width}x{self.height}+{self._show_x}+{self._show_y}'
+            
             # IMPROVED: Force window to be visible initially (hidden later)
             self.withdraw()  # Start hidden, will be shown on demand
             
@@ -42,9 +69,31 @@ class WaveformBar(tk.Tk):
             self.canvas.pack(fill=tk.BOTH, expand=True)
             
             # Initialize waveform variables
-            self.points: List[float] = [0] * 20  # Points for the waveform
+            self.points: List[float] = [0.0] * 20  # Points for the waveform
             self.is_listening = False
             self.animation_id: Optional[str] = None
+            self.waveform_id: Optional[int] = None
+            
+            # Precompute the x-grid and center line once; only y changes per frame
+            x_step = self.width / (len(self.points) - 1)
+            self._xs: List[float] = [i * x_step for i in range(len(self.points))]
+            self._center_y = self.height / 2
+            
+            # Flat x0, y0, x1, y1, ... buffer reused by every frame; x slots never change
+            self._coords: List[float] = [c for x in self._xs for c in (x, self._center_y)]
+            
+            # Random source for the waveform targets
+            self._rng = random.Random()
+            
+            # When the last frame was drawn, so late frames ease further
+            self._last_frame: Optional[float] = None
+            
+            # Track on-screen state from window events so frames can skip drawing
+            # without querying winfo_viewable() every tick
+            self._visible = False
+            self.bind('<Map>', self._on_map)
+            self.bind('<Unmap>', self._on_unmap)
+            self.bind('<Visibility>', self._on_visibility)
             
             # Round the window corners for pill shape
             self._create_pill_shape()
@@ -57,39 +106,23 @@ class WaveformBar(tk.Tk):
             
             self.logger.info("WaveformBar initialized successfully")
             
-        except Exception as e:
-            self.logger.error(f"Error initializing WaveformBar: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error initializing WaveformBar")
             raise
             
     def _create_pill_shape(self):
         """Create the pill shape using a rounded rectangle"""
         try:
-            def _create_rounded_rect():
-                radius = 10
-                points = [
-                    radius, 0,  # Top left
-                    self.width - radius, 0,  # Top right
-                    self.width, radius,  # Right top
-                    self.width, self.height - radius,  # Right bottom
-                    self.width - radius, self.height,  # Bottom right
-                    radius, self.height,  # Bottom left
-                    0, self.height - radius,  # Left bottom
-                    0, radius  # Left top
-                ]
-                return points
-                
             # Create mask
             self.mask = self.canvas.create_polygon(
-                _create_rounded_rect(),
+                _pill_points(self.width, self.height, 10),
                 smooth=True,
                 fill='#2C2C2C',
                 outline='#3C3C3C'
             )
             self.logger.info("Pill shape created")
-        except Exception as e:
-            self.logger.error(f"Error creating pill shape: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error creating pill shape")
             
     def _add_close_button(self):
         """Add a subtle close button"""
@@ -119,66 +152,62 @@ class WaveformBar(tk.Tk):
         
     def _enable_drag(self):
         """Enable window dragging"""
+        # Pointer position within the bar when the drag started
+        self._drag_dx = 0
+        self._drag_dy = 0
         self.bind('<Button-1>', self._on_drag_start)
         self.bind('<B1-Motion>', self._on_drag_motion)
         
     def _on_drag_start(self, event):
         """Store initial position for dragging"""
-        self._drag_data = {'x': event.x, 'y': event.y}
+        self._drag_dx = event.x
+        self._drag_dy = event.y
         
     def _on_drag_motion(self, event):
         """Handle window dragging"""
-        if hasattr(self, '_drag_data'):
-            dx = event.x - self._drag_data['x']
-            dy = event.y - self._drag_data['y']
-            self.geometry(f'+{self.winfo_x() + dx}+{self.winfo_y() + dy}')
-            
-    def show(self):
-        """Show the bar with animation - IMPROVED VERSION"""
-        try:
-            self.logger.info("Showing WaveformBar - Starting show process")
-            
-            # IMPROVED: Get screen dimensions more reliably
-            self.update_idletasks()  # Ensure window is ready
-            screen_width = self.winfo_screenwidth()
-            screen_height = self.winfo_screenheight()
+        x = self.winfo_x() + event.x - self._drag_dx
+        y = self.winfo_y() + event.y - self._drag_dy
+        self.geometry(f'+{x}+{y}')
             
-            # IMPROVED: Calculate position with better bounds checking
-            x = max(0, (screen_width - self.width) // 2)
-            y = max(0, screen_height - 150)  # Higher up for better visibility
+    def _on_map(self, event):
+        """Mark the bar visible when the toplevel is mapped"""
+        if event.widget is self:
+            self._visible = True
+            self._resume_animation()
             
-            self.logger.info(f"Screen size: {screen_width}x{screen_height}")
-            self.logger.info(f"Calculated position: ({x}, {y})")
+    def _on_unmap(self, event):
+        """Mark the bar hidden when the toplevel is withdrawn or iconified"""
+        if event.widget is self:
+            self._visible = False
             
-            # IMPROVED: Set geometry first, then show
-            self.geometry(f'{self.width}x{self.height}+{x}+{y}')
+    def _on_visibility(self, event):
+        """Track whether the bar is fully covered by other windows"""
+        if event.widget is self:
+            self._visible = event.state != 'VisibilityFullyObscured'
+            self._resume_animation()
             
-            # IMPROVED: Force window to be visible with multiple methods
-            self.deiconify()  # Make window visible
-            self.update()     # Process pending events
-            self.lift()       # Bring to front
-            self.focus_force()  # Force focus (may help with visibility)
-            self.attributes('-topmost', True)  # Ensure it stays on top
+    def _resume_animation(self):
+        """Restart a frame loop that lapsed while the bar was not visible"""
+        if self.is_listening and self._visible and self.animation_id is None:
+            self._animate_waveform()
             
-            # IMPROVED: Additional visibility checks
-            if self.winfo_viewable():
-                self.logger.info("Window is viewable")
-            else:
-                self.logger.warning("Window is NOT viewable - forcing visibility")
-                self.tkraise()  # Alternative method to bring to front
+    def show(self):
+        """Show the bar and start the animation"""
+        try:
+            # Position before mapping; Tk draws the window when it next idles,
+            # and focus stays with the window the text will be typed into
+            self.geometry(self._show_geometry)
+            self.deiconify()
+            self.lift()
+            self.attributes('-topmost', True)
             
             # Start animation
             self.start_animation()
             
-            # IMPROVED: Log final position for debugging
-            actual_x = self.winfo_x()
-            actual_y = self.winfo_y()
-            self.logger.info(f"WaveformBar shown at actual position ({actual_x}, {actual_y})")
-            self.logger.info(f"Window dimensions: {self.winfo_width()}x{self.winfo_height()}")
+            self.logger.info("WaveformBar shown at (%d, %d)", self._show_x, self._show_y)
             
-        except Exception as e:
-            self.logger.error(f"Error showing WaveformBar: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error showing WaveformBar")
             
     def hide(self):
         """Hide the bar and stop animation"""
@@ -187,9 +216,8 @@ class WaveformBar(tk.Tk):
             self.stop_animation()
             self.withdraw()
             self.logger.info("WaveformBar hidden")
-        except Exception as e:
-            self.logger.error(f"Error hiding WaveformBar: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error hiding WaveformBar")
             
     def start_animation(self):
         """Start the waveform animation"""
@@ -197,10 +225,11 @@ class WaveformBar(tk.Tk):
             if not self.is_listening:
                 self.is_listening = True
                 self.logger.info("Starting waveform animation")
-                self._animate_waveform()
-        except Exception as e:
-            self.logger.error(f"Error starting animation: {e}")
-            self.logger.error(traceback.format_exc())
+                # Only kick the frame loop if it is not already scheduled
+                if self.animation_id is None:
+                    self._animate_waveform()
+        except Exception:
+            self.logger.exception("Error starting animation")
             
     def stop_animation(self):
         """Stop the waveform animation"""
@@ -209,50 +238,57 @@ class WaveformBar(tk.Tk):
             if self.animation_id:
                 self.after_cancel(self.animation_id)
                 self.animation_id = None
+            self._last_frame = None
             self.logger.info("Stopped waveform animation")
-        except Exception as e:
-            self.logger.error(f"Error stopping animation: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error stopping animation")
             
     def _animate_waveform(self):
         """Animate the waveform"""
         try:
-            if not self.is_listening:
+            if not (self.is_listening and self._visible):
+                # Let the loop lapse so no timers fire while idle or off
+                # screen; mapping the bar again resumes it
+                self.animation_id = None
+                self._last_frame = None
                 return
                 
-            # Update points with smooth transitions
-            for i in range(len(self.points)):
-                target = random.uniform(-5, 5)
-                self.points[i] += (target - self.points[i]) * 0.3
+            # Scale the easing by the time since the last frame, so a late
+            # frame catches up instead of the animation slowing down
+            now = time.monotonic()
+            if self._last_frame is None:
+                alpha = 0.3
+            else:
+                alpha = 1.0 - math.exp(-(now - self._last_frame) / EASE_TAU_S)
+            self._last_frame = now
                 
-            # Clear previous waveform
-            self.canvas.delete('waveform')
-            
-            # Draw new waveform
-            x_step = self.width / (len(self.points) - 1)
-            coords = []
-            
-            # Create smooth curve through points
-            for i in range(len(self.points)):
-                x = i * x_step
-                y = (self.height / 2) + self.points[i]  # Center line
-                coords.extend([x, y])
+            # Ease every point toward a random target in [-5, 5)
+            rand = self._rng.random
+            self.points = [p + alpha * (10.0 * rand() - 5.0 - p) for p in self.points]
                 
-            if len(coords) >= 4:
-                self.canvas.create_line(
-                    coords,
+            # Refresh only the y slots of the coordinate buffer
+            center_y = self._center_y
+            self._coords[1::2] = [center_y + p for p in self.points]
+            
+            if self.waveform_id is None:
+                # Create the line item once, then move it on later frames
+                self.waveform_id = self.canvas.create_line(
+                    self._coords,
                     fill='#4CAF50',
                     width=2,
                     smooth=True,
                     tags='waveform'
                 )
+            else:
+                self.canvas.coords(self.waveform_id, self._coords)
                 
             # Schedule next animation frame
-            self.animation_id = self.after(50, self._animate_waveform)
+            self.animation_id = self.after(FRAME_INTERVAL_MS, self._animate_waveform)
             
-        except Exception as e:
-            self.logger.error(f"Error in waveform animation: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            # The loop stops here rather than logging the error every frame
+            self.animation_id = None
+            self.logger.exception("Error in waveform animation")
 
 
 # Test the waveform bar if run directly
@@ -73,6 +73,10 @@ class EnhancedWaveformBar(tk.Tk):
             self.animation_id: Optional[str] = None
             self.animation_speed = 40  # Faster animation (lower = faster)
             
+            # Main and glow line items, created on the first frame and moved
+            # with coords() afterwards
+            self.waveform_ids: List[int] = []
+            
             # Enhanced visual elements
             self._create_modern_pill_shape()
             self._add_modern_close_button()
@@ -339,9 +343,6 @@ class EnhancedWaveformBar(tk.Tk):
                 # Smoother interpolation
                 self.points[i] += (target - self.points[i]) * 0.25
             
-            # Clear previous waveform
-            self.canvas.delete('waveform')
-            
             # Draw enhanced waveform with gradient-like effect
             self._draw_enhanced_waveform()
             
@@ -365,28 +366,36 @@ class EnhancedWaveformBar(tk.Tk):
                 y = center_y + self.points[i]
                 coords.extend([x, y])
             
-            if len(coords) >= 4:
-                # Main waveform line
-                self.canvas.create_line(
+            if len(coords) < 4:
+                return
+                
+            if self.waveform_ids:
+                # Move the existing lines instead of recreating them
+                for item in self.waveform_ids:
+                    self.canvas.coords(item, coords)
+                return
+                
+            # Main waveform line
+            self.waveform_ids.append(self.canvas.create_line(
+                coords,
+                fill=self.colors['waveform'],
+                width=3,
+                smooth=True,
+                tags='waveform',
+                capstyle=tk.ROUND
+            ))
+            
+            # Add glow effect with multiple lighter lines
+            for width, alpha in [(5, 0.3), (7, 0.15)]:
+                glow_color = self._blend_color(self.colors['waveform'], self.colors['bg'], alpha)
+                self.waveform_ids.append(self.canvas.create_line(
                     coords,
-                    fill=self.colors['waveform'],
-                    width=3,
+                    fill=glow_color,
+                    width=width,
                     smooth=True,
                     tags='waveform',
                     capstyle=tk.ROUND
-                )
-                
-                # Add glow effect with multiple lighter lines
-                for width, alpha in [(5, 0.3), (7, 0.15)]:
-                    glow_color = self._blend_color(self.colors['waveform'], self.colors['bg'], alpha)
-                    self.canvas.create_line(
-                        coords,
-                        fill=glow_color,
-                        width=width,
-                        smooth=True,
-                        tags='waveform',
-                        capstyle=tk.ROUND
-                    )
+                ))
             
         except Exception as e:
             self.logger.error(f"Error drawing enhanced waveform: {e}")
@@ -8,13 +8,16 @@ import math
 import random
 from typing import List, Optional
 import logging
-import traceback
 
 from PyQt5.QtWidgets import (QApplication, QWidget, QLabel, QPushButton, 
                              QVBoxLayout, QHBoxLayout, QFrame)
 from PyQt5.QtCore import Qt, QTimer, QPoint, QPropertyAnimation, QEasingCurve, pyqtSignal
 from PyQt5.QtGui import QPainter, QPen, QColor, QPainterPath, QBrush, QFont, QPolygon
 
+# Where the hidden bar waits, mapped but transparent and off every screen,
+# so it cannot catch clicks meant for windows underneath
+HIDDEN_POSITION = QPoint(-10000, -10000)
+
 
 class WaveformBar(QWidget):
     """A pill-shaped bar with animated waveform visualization using PyQt5"""
@@ -38,6 +41,17 @@ class WaveformBar(QWidget):
             self.is_listening = False
             self.animation_timer: Optional[QTimer] = None
             
+            # Precompute the x-grid and center line once; only y changes per frame
+            x_step = self.width() / (len(self.points) - 1)
+            self._xs: List[int] = [int(i * x_step) for i in range(len(self.points))]
+            self._center_y = self.height() / 2
+            
+            # Flat x0, y0, x1, y1, ... polyline buffer; x slots never change
+            self._coords: List[int] = [c for x in self._xs for c in (x, int(self._center_y))]
+            
+            # Random source for the waveform targets
+            self._rng = random.Random()
+            
             # Colors
             self.bg_color = QColor(44, 44, 44)  # #2C2C2C
             self.border_color = QColor(60, 60, 60)  # #3C3C3C
@@ -51,11 +65,14 @@ class WaveformBar(QWidget):
             # Drag variables
             self._drag_start_position = None
             
+            # The window is mapped on the first show and then only made
+            # transparent, avoiding a window manager round trip per toggle
+            self._mapped = False
+            
             self.logger.info("PyQt5 WaveformBar initialized successfully")
             
-        except Exception as e:
-            self.logger.error(f"Error initializing PyQt5 WaveformBar: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error initializing PyQt5 WaveformBar")
             raise
     
     def paintEvent(self, event):
@@ -85,30 +102,19 @@ class WaveformBar(QWidget):
             # Draw close button
             self._draw_close_button(painter)
             
-        except Exception as e:
-            self.logger.error(f"Error in paintEvent: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error in paintEvent")
     
     def _draw_waveform(self, painter):
         """Draw the animated waveform"""
         try:
             painter.setPen(QPen(self.waveform_color, 2))
             
-            # Create smooth curve through points
-            x_step = 120.0 / (len(self.points) - 1)
-            
-            # Draw line segments for waveform
-            for i in range(len(self.points) - 1):
-                x1 = i * x_step
-                y1 = 10 + self.points[i]  # Center line at 10 (half of 20px height)
-                x2 = (i + 1) * x_step
-                y2 = 10 + self.points[i + 1]
+            # Draw every segment in one call from the prepared buffer
+            painter.drawPolyline(QPolygon(self._coords))
                 
-                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
-                
-        except Exception as e:
-            self.logger.error(f"Error drawing waveform: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error drawing waveform")
     
     def _draw_close_button(self, painter):
         """Draw the close button"""
@@ -122,9 +128,8 @@ class WaveformBar(QWidget):
             painter.setFont(QFont("Arial", 8))
             painter.drawText(x, y, size, size, Qt.AlignCenter, "×")
             
-        except Exception as e:
-            self.logger.error(f"Error drawing close button: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error drawing close button")
     
     def mousePressEvent(self, event):
         """Handle mouse press for dragging and close button"""
@@ -144,9 +149,8 @@ class WaveformBar(QWidget):
                 # Start dragging
                 self._drag_start_position = event.globalPos() - self.pos()
                 
-        except Exception as e:
-            self.logger.error(f"Error in mousePressEvent: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error in mousePressEvent")
     
     def mouseMoveEvent(self, event):
         """Handle mouse move for dragging"""
@@ -155,9 +159,8 @@ class WaveformBar(QWidget):
                 self._drag_start_position is not None):
                 self.move(event.globalPos() - self._drag_start_position)
                 
-        except Exception as e:
-            self.logger.error(f"Error in mouseMoveEvent: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error in mouseMoveEvent")
     
     def mouseReleaseEvent(self, event):
         """Handle mouse release"""
@@ -179,28 +182,31 @@ class WaveformBar(QWidget):
             y = screen_height - 100  # 100 pixels from bottom
             
             self.move(x, y)
-            super().show()
+            if not self._mapped:
+                super().show()
+                self._mapped = True
+            self.setWindowOpacity(1.0)
             self.raise_()
             self.activateWindow()
             
             self.start_animation()
-            self.logger.info(f"PyQt5 WaveformBar shown at position ({x}, {y})")
+            self.logger.info("PyQt5 WaveformBar shown at position (%d, %d)", x, y)
             
-        except Exception as e:
-            self.logger.error(f"Error showing PyQt5 WaveformBar: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error showing PyQt5 WaveformBar")
     
     def hide(self):
         """Hide the bar and stop animation"""
         try:
             self.logger.info("Hiding PyQt5 WaveformBar")
             self.stop_animation()
-            super().hide()
+            # Stay mapped; just turn transparent and park off screen
+            self.setWindowOpacity(0.0)
+            self.move(HIDDEN_POSITION)
             self.logger.info("PyQt5 WaveformBar hidden")
             
-        except Exception as e:
-            self.logger.error(f"Error hiding PyQt5 WaveformBar: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error hiding PyQt5 WaveformBar")
     
     def start_animation(self):
         """Start the waveform animation"""
@@ -210,9 +216,8 @@ class WaveformBar(QWidget):
                 self.logger.info("Starting waveform animation")
                 self.animation_timer.start(50)  # 50ms interval for smooth animation
                 
-        except Exception as e:
-            self.logger.error(f"Error starting animation: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error starting animation")
     
     def stop_animation(self):
         """Stop the waveform animation"""
@@ -222,9 +227,8 @@ class WaveformBar(QWidget):
                 self.animation_timer.stop()
             self.logger.info("Stopped waveform animation")
             
-        except Exception as e:
-            self.logger.error(f"Error stopping animation: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error stopping animation")
     
     def _animate_waveform(self):
         """Animate the waveform points"""
@@ -232,17 +236,20 @@ class WaveformBar(QWidget):
             if not self.is_listening:
                 return
             
-            # Update points with smooth transitions
-            for i in range(len(self.points)):
-                target = random.uniform(-5.0, 5.0)
-                self.points[i] += (target - self.points[i]) * 0.3
+            # Ease every point 30% of the way toward a random target in
+            # [-5, 5): points = 0.7 * points + 0.3 * target
+            rand = self._rng.random
+            self.points = [0.7 * p + 3.0 * rand() - 1.5 for p in self.points]
+            
+            # Refresh only the y slots of the polyline buffer
+            center_y = self._center_y
+            self._coords[1::2] = [int(center_y + p) for p in self.points]
             
             # Trigger repaint
             self.update()
             
-        except Exception as e:
-            self.logger.error(f"Error in waveform animation: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error in waveform animation")
     
     def closeEvent(self, event):
         """Handle window close event"""
@@ -250,9 +257,8 @@ class WaveformBar(QWidget):
             self.stop_animation()
             event.accept()
             
-        except Exception as e:
-            self.logger.error(f"Error in closeEvent: {e}")
-            self.logger.error(traceback.format_exc())
+        except Exception:
+            self.logger.exception("Error in closeEvent")
             event.accept()
 
 
@@ -6,11 +6,20 @@ import tkinter as tk
 from tkinter import ttk, colorchooser, messagebox
 from typing import Dict, Any, Callable
 import logging
+from concurrent.futures import Future
 
 from ..config.quick_config import QuickConfig
 
 logger = logging.getLogger('mumble.quick.settings')
 
+def _log_save_result(saved: Future) -> None:
+    """Log whether settings applied from the dialog were written"""
+    error = saved.exception()
+    if error is not None:
+        logger.error("Failed to save settings: %s", error)
+    else:
+        logger.info("Settings applied successfully")
+
 class SettingsDialog(tk.Toplevel):
     """Settings dialog with tabbed interface"""
     
@@ -256,51 +265,45 @@ class SettingsDialog(tk.Toplevel):
     def _apply_settings(self) -> None:
         """Apply settings from UI to config"""
         try:
-            # Hotkey settings
-            self.config.handler.set('hotkey', {
-                'trigger': self.hotkey_trigger.get(),
-                'stop': self.hotkey_stop.get()
-            })
-            
-            # UI settings
-            self.config.update_ui_settings({
-                'bar_width': int(self.bar_width.get()),
-                'bar_height': int(self.bar_height.get()),
-                'background_color': self.bg_color.get(),
-                'foreground_color': self.fg_color.get(),
-                'font_color': self.font_color.get(),
-                'opacity': float(self.opacity.get()),
-                'animation_speed': float(self.animation_speed.get()),
-                'show_close_button': self.show_close_button.get()
-            })
-            
-            # Speech settings
+            # All sections are saved together, off the UI thread
             phrase_timeout = self.phrase_timeout.get()
-            self.config.update_speech_settings({
-                'language': self.language.get(),
-                'ambient_duration': float(self.ambient_duration.get()),
-                'phrase_timeout': float(phrase_timeout) if phrase_timeout else None,
-                'auto_stop': self.auto_stop.get(),
-                'auto_stop_timeout': float(self.auto_stop_timeout.get())
-            })
-            
-            # Tray settings
-            self.config.update_tray_settings({
-                'show_notifications': self.show_notifications.get(),
-                'minimize_to_tray': self.minimize_to_tray.get(),
-                'start_minimized': self.start_minimized.get()
-            })
-            
-            # Behavior settings
-            self.config.update_behavior_settings({
-                'auto_paste': self.auto_paste.get(),
-                'add_trailing_space': self.add_trailing_space.get(),
-                'capitalize_sentences': self.capitalize_sentences.get(),
-                'save_position': self.save_position.get(),
-                'last_position': self.config.behavior_settings['last_position']
+            saved = self.config.update_settings({
+                'hotkey': {
+                    'trigger': self.hotkey_trigger.get(),
+                    'stop': self.hotkey_stop.get()
+                },
+                'ui': {
+                    'bar_width': int(self.bar_width.get()),
+                    'bar_height': int(self.bar_height.get()),
+                    'background_color': self.bg_color.get(),
+                    'foreground_color': self.fg_color.get(),
+                    'font_color': self.font_color.get(),
+                    'opacity': float(self.opacity.get()),
+                    'animation_speed': float(self.animation_speed.get()),
+                    'show_close_button': self.show_close_button.get()
+                },
+                'speech': {
+                    'language': self.language.get(),
+                    'ambient_duration': float(self.ambient_duration.get()),
+                    'phrase_timeout': float(phrase_timeout) if phrase_timeout else None,
+                    'auto_stop': self.auto_stop.get(),
+                    'auto_stop_timeout': float(self.auto_stop_timeout.get())
+                },
+                'tray': {
+                    'show_notifications': self.show_notifications.get(),
+                    'minimize_to_tray': self.minimize_to_tray.get(),
+                    'start_minimized': self.start_minimized.get()
+                },
+                'behavior': {
+                    'auto_paste': self.auto_paste.get(),
+                    'add_trailing_space': self.add_trailing_space.get(),
+                    'capitalize_sentences': self.capitalize_sentences.get(),
+                    'save_position': self.save_position.get()
+                }
             })
             
-            logger.info("Settings applied successfully")
+            # The dialog may be gone by the time the write finishes
+            saved.add_done_callback(_log_save_result)
             self.destroy()
             
         except Exception as e:
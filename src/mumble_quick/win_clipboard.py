@@ -0,0 +1,277 @@
+"""
+Native Windows clipboard and keyboard helpers for Mumble Quick
+
+Talks to user32/kernel32 through ctypes so a paste is a handful of API
+calls instead of pyperclip's and pyautogui's layered fallbacks, and typed
+text goes out in one SendInput call. Only import this module on Windows.
+"""
+
+import ctypes
+import time
+from ctypes import wintypes
+from functools import lru_cache
+from typing import Optional, Tuple
+
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+MAPVK_VK_TO_VSC = 0
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_NOREPEAT = 0x4000
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+VK_CONTROL = 0x11
+VK_F1 = 0x70
+VK_RETURN = 0x0D
+VK_SPACE = 0x20
+VK_V = 0x56
+WM_HOTKEY = 0x0312
+
+# Another process may hold the clipboard open for a moment
+OPEN_CLIPBOARD_ATTEMPTS = 10
+OPEN_CLIPBOARD_RETRY_S = 0.01
+
+ULONG_PTR = wintypes.WPARAM
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = (
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    )
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = (
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    )
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = (
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    )
+
+
+class _INPUTUNION(ctypes.Union):
+    # Mouse input is the largest member and sets the size SendInput expects
+    _fields_ = (
+        ("mi", MOUSEINPUT),
+        ("ki", KEYBDINPUT),
+        ("hi", HARDWAREINPUT),
+    )
+
+
+class INPUT(ctypes.Structure):
+    _fields_ = (
+        ("type", wintypes.DWORD),
+        ("u", _INPUTUNION),
+    )
+
+
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+user32.OpenClipboard.argtypes = (wintypes.HWND,)
+user32.OpenClipboard.restype = wintypes.BOOL
+user32.CloseClipboard.argtypes = ()
+user32.CloseClipboard.restype = wintypes.BOOL
+user32.EmptyClipboard.argtypes = ()
+user32.EmptyClipboard.restype = wintypes.BOOL
+user32.GetClipboardData.argtypes = (wintypes.UINT,)
+user32.GetClipboardData.restype = wintypes.HANDLE
+user32.SetClipboardData.argtypes = (wintypes.UINT, wintypes.HANDLE)
+user32.SetClipboardData.restype = wintypes.HANDLE
+user32.MapVirtualKeyW.argtypes = (wintypes.UINT, wintypes.UINT)
+user32.MapVirtualKeyW.restype = wintypes.UINT
+user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int)
+user32.SendInput.restype = wintypes.UINT
+user32.RegisterHotKey.argtypes = (wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT)
+user32.RegisterHotKey.restype = wintypes.BOOL
+user32.UnregisterHotKey.argtypes = (wintypes.HWND, ctypes.c_int)
+user32.UnregisterHotKey.restype = wintypes.BOOL
+
+kernel32.GlobalAlloc.argtypes = (wintypes.UINT, ctypes.c_size_t)
+kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+kernel32.GlobalLock.argtypes = (wintypes.HGLOBAL,)
+kernel32.GlobalLock.restype = wintypes.LPVOID
+kernel32.GlobalUnlock.argtypes = (wintypes.HGLOBAL,)
+kernel32.GlobalUnlock.restype = wintypes.BOOL
+kernel32.GlobalFree.argtypes = (wintypes.HGLOBAL,)
+kernel32.GlobalFree.restype = wintypes.HGLOBAL
+
+
+def _key_input(vk: int, flags: int = 0) -> INPUT:
+    """Build a keyboard INPUT for a virtual key"""
+    scan = user32.MapVirtualKeyW(vk, MAPVK_VK_TO_VSC)
+    return INPUT(INPUT_KEYBOARD, _INPUTUNION(ki=KEYBDINPUT(vk, scan, flags, 0, 0)))
+
+
+# Ctrl down, V down, V up, Ctrl up - built once and sent in one call
+PASTE_INPUTS = (INPUT * 4)(
+    _key_input(VK_CONTROL),
+    _key_input(VK_V),
+    _key_input(VK_V, KEYEVENTF_KEYUP),
+    _key_input(VK_CONTROL, KEYEVENTF_KEYUP),
+)
+
+
+@lru_cache(maxsize=None)
+def _unit_inputs(unit: int) -> tuple:
+    """Build the key down/up INPUTs that type one UTF-16 code unit"""
+    # Unicode input is not seen as Enter by most apps, so newlines use the key
+    if unit == ord("\n"):
+        return _key_input(VK_RETURN), _key_input(VK_RETURN, KEYEVENTF_KEYUP)
+    return (
+        INPUT(INPUT_KEYBOARD, _INPUTUNION(ki=KEYBDINPUT(0, unit, KEYEVENTF_UNICODE, 0, 0))),
+        INPUT(INPUT_KEYBOARD, _INPUTUNION(
+            ki=KEYBDINPUT(0, unit, KEYEVENTF_UNICODE | KEYEVENTF_KEYUP, 0, 0))),
+    )
+
+
+def _open_clipboard():
+    """Open the clipboard, retrying while another process holds it"""
+    for _ in range(OPEN_CLIPBOARD_ATTEMPTS):
+        if user32.OpenClipboard(None):
+            return
+        time.sleep(OPEN_CLIPBOARD_RETRY_S)
+    raise ctypes.WinError(ctypes.get_last_error())
+
+
+def get_text() -> str:
+    """Return the clipboard's text, or an empty string if it holds none"""
+    _open_clipboard()
+    try:
+        handle = user32.GetClipboardData(CF_UNICODETEXT)
+        if not handle:
+            return ""
+        pointer = kernel32.GlobalLock(handle)
+        if not pointer:
+            return ""
+        try:
+            return ctypes.wstring_at(pointer)
+        finally:
+            kernel32.GlobalUnlock(handle)
+    finally:
+        user32.CloseClipboard()
+
+
+def set_text(text: str):
+    """Replace the clipboard contents with text"""
+    data = ctypes.create_unicode_buffer(text)
+    size = ctypes.sizeof(data)
+    handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, size)
+    if not handle:
+        raise ctypes.WinError(ctypes.get_last_error())
+    pointer = kernel32.GlobalLock(handle)
+    if not pointer:
+        kernel32.GlobalFree(handle)
+        raise ctypes.WinError(ctypes.get_last_error())
+    ctypes.memmove(pointer, data, size)
+    kernel32.GlobalUnlock(handle)
+
+    try:
+        _open_clipboard()
+    except OSError:
+        kernel32.GlobalFree(handle)
+        raise
+    try:
+        user32.EmptyClipboard()
+        # On success the clipboard owns the memory
+        if not user32.SetClipboardData(CF_UNICODETEXT, handle):
+            error = ctypes.get_last_error()
+            kernel32.GlobalFree(handle)
+            raise ctypes.WinError(error)
+    finally:
+        user32.CloseClipboard()
+
+
+def send_paste():
+    """Press Ctrl+V in the focused window with a single SendInput call"""
+    count = len(PASTE_INPUTS)
+    if user32.SendInput(count, PASTE_INPUTS, ctypes.sizeof(INPUT)) != count:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+def type_text(text: str):
+    """Type text into the focused window with a single SendInput call"""
+    # Characters outside the BMP are sent as their two surrogate code units
+    units = memoryview(text.encode("utf-16-le")).cast("H")
+    inputs = (INPUT * (2 * len(units)))()
+    for i, unit in enumerate(units):
+        inputs[2 * i], inputs[2 * i + 1] = _unit_inputs(unit)
+    count = len(inputs)
+    if count and user32.SendInput(count, inputs, ctypes.sizeof(INPUT)) != count:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+# Modifier names as the keyboard library writes them in hotkey strings
+HOTKEY_MODIFIERS = {
+    "ctrl": MOD_CONTROL,
+    "control": MOD_CONTROL,
+    "alt": MOD_ALT,
+    "shift": MOD_SHIFT,
+    "win": MOD_WIN,
+    "windows": MOD_WIN,
+}
+
+
+def parse_hotkey(hotkey: str) -> Optional[Tuple[int, int]]:
+    """
+    Split a hotkey such as 'ctrl+alt+m' into RegisterHotKey modifiers and key
+
+    Returns None unless the hotkey has exactly one letter, digit, space or
+    function key besides its modifiers, since RegisterHotKey cannot
+    register modifier-only hotkeys such as 'ctrl+alt'.
+    """
+    modifiers = 0
+    keys = []
+    for part in hotkey.lower().split("+"):
+        part = part.strip()
+        if part in HOTKEY_MODIFIERS:
+            modifiers |= HOTKEY_MODIFIERS[part]
+        else:
+            keys.append(part)
+    if len(keys) != 1:
+        return None
+    key = keys[0]
+    if len(key) == 1 and key.isascii() and key.isalnum():
+        return modifiers, ord(key.upper())
+    if key == "space":
+        return modifiers, VK_SPACE
+    if key[:1] == "f" and key[1:].isdigit() and 1 <= int(key[1:]) <= 24:
+        return modifiers, VK_F1 + int(key[1:]) - 1
+    return None
+
+
+def register_hotkey(hotkey_id: int, modifiers: int, vk: int):
+    """Register a system-wide hotkey posted to this thread as WM_HOTKEY"""
+    # Held keys do not repeat the message
+    if not user32.RegisterHotKey(None, hotkey_id, modifiers | MOD_NOREPEAT, vk):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+def unregister_hotkey(hotkey_id: int):
+    """Release a hotkey registered by this thread"""
+    user32.UnregisterHotKey(None, hotkey_id)
+
+
+def hotkey_id(msg_address: int) -> Optional[int]:
+    """Return the hotkey id if the MSG at an address is WM_HOTKEY, else None"""
+    msg = wintypes.MSG.from_address(msg_address)
+    if msg.message != WM_HOTKEY:
+        return None
+    return msg.wParam
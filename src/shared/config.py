@@ -5,9 +5,26 @@ Shared configuration handler for Mumble applications
 import os
 import json
 import logging
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    def _dumps(data: Any) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    _loads = orjson.loads
+else:
+    # Same two-space layout as orjson so the file looks the same either way
+    def _dumps(data: Any) -> str:
+        return json.dumps(data, indent=2)
+    _loads = json.loads
+
 class ConfigHandler:
     """Configuration handler with validation and persistence"""
     
@@ -24,8 +41,21 @@ class ConfigHandler:
         self.app_name = app_name
         self.config_dir = Path(config_dir)
         self.defaults = defaults
+        
+        # Defaults serialized once; each reset parses a fresh copy that
+        # shares no nested dicts or lists with the defaults
+        self._defaults_json = _dumps(dict(defaults))
         self.config_file = self.config_dir / f"{app_name}_config.json"
         self.config: Dict[str, Any] = {}
+        self._last_saved: Optional[Tuple[Path, str]] = None
+        
+        # True when values changed through set/patch/update/reset since the last save
+        self.dirty = False
+        
+        # Saves may come from a background writer as well as the caller's
+        # thread, so changes and saves of the config dict hold this lock.
+        # It is reentrant because the setters save while holding it.
+        self._save_lock = threading.RLock()
         
         # Create config directory if it doesn't exist
         self.config_dir.mkdir(parents=True, exist_ok=True)
@@ -36,29 +66,78 @@ class ConfigHandler:
     def load_config(self) -> None:
         """Load configuration from file or create with defaults"""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    self.config = json.load(f)
+            data = self._read_file()
+            if data is not None:
+                self.config = _loads(data)
+                self._last_saved = (self.config_file, _dumps(self.config))
+                self.dirty = False
                 self.logger.info(f"Loaded configuration from {self.config_file}")
             else:
-                self.config = self.defaults.copy()
+                self.config = self._fresh_defaults()
+                self.dirty = True
                 self.save_config()
                 self.logger.info("Created new configuration with defaults")
                 
         except Exception as e:
             self.logger.error(f"Error loading configuration: {e}")
-            self.config = self.defaults.copy()
+            self.config = self._fresh_defaults()
             
-    def save_config(self) -> None:
-        """Save current configuration to file"""
-        try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
-            self.logger.info(f"Saved configuration to {self.config_file}")
+    def save_config(self, force: bool = False) -> bool:
+        """
+        Save current configuration to file if it changed
+        
+        Only set, patch, update and reset mark the configuration changed.
+        After editing the config dict directly, pass force=True.
+        
+        Args:
+            force: Write the file even if no change was recorded
             
-        except Exception as e:
-            self.logger.error(f"Error saving configuration: {e}")
+        Returns:
+            False if writing the file failed, True otherwise
+        """
+        with self._save_lock:
+            if not (self.dirty or force):
+                return True
+                
+            # Cleared before serializing so a change made meanwhile marks
+            # the config dirty again instead of being dropped
+            self.dirty = False
+            try:
+                data = _dumps(self.config)
+                if not force and self._last_saved == (self.config_file, data):
+                    return True
+                    
+                self._write_file(data)
+                self._last_saved = (self.config_file, data)
+                self.logger.info(f"Saved configuration to {self.config_file}")
+                return True
+                
+            except Exception as e:
+                self.dirty = True
+                self.logger.error(f"Error saving configuration: {e}")
+                return False
+            
+    def _fresh_defaults(self) -> Dict[str, Any]:
+        """Build an independent copy of the defaults from their snapshot"""
+        return _loads(self._defaults_json)
+        
+    def _read_file(self) -> Optional[str]:
+        """Read the raw configuration file, or None if it does not exist"""
+        if not self.config_file.exists():
+            return None
+        with open(self.config_file, 'r', encoding='utf-8') as f:
+            return f.read()
             
+    def _write_file(self, data: str) -> None:
+        """Write the raw configuration file"""
+        # Write a sibling temp file and swap it in so an interrupted
+        # write never leaves a truncated config behind
+        tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+        # orjson leaves non-ASCII text unescaped, so never use the locale codepage
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_file, self.config_file)
+        
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value
@@ -70,7 +149,10 @@ class ConfigHandler:
         Returns:
             Configuration value or default
         """
-        return self.config.get(key, default or self.defaults.get(key))
+        # Only fall back to defaults on a miss; hits are a single dict lookup
+        if key in self.config:
+            return self.config[key]
+        return default or self.defaults.get(key)
         
     def set(self, key: str, value: Any) -> None:
         """
@@ -80,8 +162,34 @@ class ConfigHandler:
             key: Configuration key
             value: Value to set
         """
-        self.config[key] = value
-        self.save_config()
+        with self._save_lock:
+            self.config[key] = value
+            self.dirty = True
+            self.save_config()
+        
+    def patch(self, key: str, updates: Dict[str, Any], save: bool = True) -> Dict[str, Any]:
+        """
+        Update fields of a dict section in place and save
+        
+        Args:
+            key: Configuration key of the section
+            updates: Fields to change
+            save: Whether to save now; otherwise the config is left dirty
+                for a later save_config()
+            
+        Returns:
+            The updated section
+        """
+        with self._save_lock:
+            section = self.config.get(key)
+            if section is None:
+                # Start from a copy so the defaults are never edited
+                section = self.config[key] = self._fresh_defaults().get(key, {})
+            section.update(updates)
+            self.dirty = True
+            if save:
+                self.save_config()
+        return section
         
     def update(self, updates: Dict[str, Any]) -> None:
         """
@@ -90,11 +198,15 @@ class ConfigHandler:
         Args:
             updates: Dictionary of updates
         """
-        self.config.update(updates)
-        self.save_config()
+        with self._save_lock:
+            self.config.update(updates)
+            self.dirty = True
+            self.save_config()
         
     def reset(self) -> None:
         """Reset configuration to defaults"""
-        self.config = self.defaults.copy()
-        self.save_config()
+        with self._save_lock:
+            self.config = self._fresh_defaults()
+            self.dirty = True
+            self.save_config()
         self.logger.info("Reset configuration to defaults") 
\ No newline at end of file
@@ -35,6 +35,8 @@ class PyAudioRecognizer(BaseAudioRecognizer):
         self._stop_requested = threading.Event() # Use Event for clearer signaling
         self._listen_thread: Optional[threading.Thread] = None
         self._callback: Optional[Callable[[str], None]] = None
+        # The energy threshold persists on self.recognizer, so calibrate once per instance
+        self._ambient_calibrated = False
 
     def get_name(self) -> str:
         """Return the unique name for this recognizer."""
@@ -67,18 +69,22 @@ class PyAudioRecognizer(BaseAudioRecognizer):
         Main listening loop that captures audio from the microphone using PyAudio.
 
         This loop runs in a separate thread. It continuously listens for audio input,
-        adjusts for ambient noise once at the beginning, and then processes captured
+        adjusts for ambient noise on the first session only, and then processes captured
         audio segments. Each segment is passed to the base class for recognition.
         The loop can be stopped via the `_stop_requested` event.
         """
         try:
             with sr.Microphone() as source:
-                self.logger.info("Adjusting for ambient noise (PyAudio)...")
-                try:
-                    self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                    self.logger.info("Ambient noise adjustment complete (PyAudio).")
-                except Exception as e:
-                    self.logger.error(f"Error during ambient noise adjustment: {e}. Continuing...")
+                if not self._ambient_calibrated:
+                    self.logger.info("Adjusting for ambient noise (PyAudio)...")
+                    try:
+                        self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
+                        self._ambient_calibrated = True
+                        self.logger.info("Ambient noise adjustment complete (PyAudio).")
+                    except Exception as e:
+                        self.logger.error(f"Error during ambient noise adjustment: {e}. Continuing...")
+                else:
+                    self.logger.debug("Reusing ambient noise calibration (PyAudio).")
 
                 while not self._stop_requested.is_set():
                     if not self._is_listening_state: # Double check, in case stop_listening was called
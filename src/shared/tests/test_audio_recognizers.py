@@ -422,26 +422,20 @@ def test_pyaudio_noise_handling(mock_microphone_class, pyaudio_recognizer_fixtur
     mock_mic_instance = MagicMock()
     mock_microphone_class.return_value.__enter__.return_value = mock_mic_instance
 
-    # The fixture already mocks recognizer.recognizer (the sr.Recognizer instance)
-    
-    # To prevent the thread from actually running its loop and calling listen etc.
-    # we can patch the _listen_loop method itself for this specific test.
-    with patch.object(recognizer, '_listen_loop', MagicMock()): # Patch instance method
-      recognizer.start_listening(MagicMock()) # Call start_listening to trigger adjust_for_ambient_noise
+    # The fixture already mocks recognizer.recognizer (the sr.Recognizer instance).
+    # Calibration happens inside _listen_loop, so run the loop on this thread;
+    # with a stop already requested it returns without listening.
+    recognizer._stop_requested.set()
+    recognizer._listen_loop()
     
     recognizer.recognizer.adjust_for_ambient_noise.assert_called_once_with(mock_mic_instance, duration=0.5)
+    assert recognizer._ambient_calibrated
 
-    # Test if it's called again if start_listening is called after stop (it should be)
-    recognizer.recognizer.reset_mock() # Reset call count for adjust_for_ambient_noise
-    
-    # Simulate stopping and starting again
-    recognizer._is_listening_state = False 
-    recognizer._stop_requested.clear()
-
-    with patch.object(recognizer, '_listen_loop', MagicMock()):
-        recognizer.start_listening(MagicMock())
+    # A later session on the same instance reuses the calibration
+    recognizer._listen_loop()
     
-    recognizer.recognizer.adjust_for_ambient_noise.assert_called_once_with(mock_mic_instance, duration=0.5)
+    recognizer.recognizer.adjust_for_ambient_noise.assert_called_once()
+    recognizer.recognizer.listen.assert_not_called()
 
 
 # --- Test specific BaseAudioRecognizer logic ---
@@ -8,6 +8,7 @@ import pytest
 from pathlib import Path
 from typing import Dict, Any
 
+from .. import config as config_module
 from ..config import ConfigHandler
 
 @pytest.fixture
@@ -104,6 +105,22 @@ def test_update_multiple_values(config_handler):
     assert config_handler.get('test_int') == 100
     assert config_handler.get('new_key') == 'new_value'
 
+def test_patch_section(config_handler, default_config):
+    """Test patching fields of a section in place"""
+    section = config_handler.get('test_dict')
+    assert config_handler.patch('test_dict', {'key2': 'patched'}) is section
+    assert section == {'key1': 'value1', 'key2': 'patched'}
+    
+    # Missing sections start from the defaults without editing them
+    del config_handler.config['test_dict']
+    config_handler.patch('test_dict', {'key1': 'patched'})
+    assert config_handler.get('test_dict') == {'key1': 'patched', 'key2': 'value2'}
+    assert default_config['test_dict']['key1'] == 'value1'
+    
+    # Verify persistence
+    config_handler.load_config()
+    assert config_handler.get('test_dict')['key1'] == 'patched'
+
 def test_reset_to_defaults(config_handler, default_config):
     """Test resetting configuration to defaults"""
     # Modify some values
@@ -126,6 +143,18 @@ def test_reset_to_defaults(config_handler, default_config):
         assert config_handler.get(key) == value
     assert config_handler.get('new_key') is None
 
+def test_reset_does_not_share_defaults(config_handler, default_config):
+    """Test that edits after a reset never reach the defaults"""
+    config_handler.reset()
+    config_handler.get('test_list').append('d')
+    config_handler.get('test_dict')['key1'] = 'changed'
+    
+    assert default_config['test_list'] == ['a', 'b', 'c']
+    assert default_config['test_dict']['key1'] == 'value1'
+    
+    config_handler.reset()
+    assert config_handler.get('test_list') == ['a', 'b', 'c']
+
 def test_load_invalid_config(config_handler):
     """Test loading invalid configuration file"""
     # Write invalid JSON
@@ -139,17 +168,66 @@ def test_load_invalid_config(config_handler):
 
 def test_save_error_handling(config_handler, monkeypatch):
     """Test error handling when saving configuration"""
-    def mock_dump(*args, **kwargs):
+    def mock_dumps(*args, **kwargs):
         raise IOError("Mock save error")
     
-    monkeypatch.setattr(json, 'dump', mock_dump)
+    monkeypatch.setattr(config_module, '_dumps', mock_dumps)
     
     # Should not raise exception
-    config_handler.save_config()
+    config_handler.set('new_key', 'new_value')
+    assert config_handler.dirty
     
     # Config should still be accessible
     assert config_handler.get('test_str') == 'default'
 
+def test_change_during_save_stays_dirty(config_handler, monkeypatch):
+    """Test a change made while a save is writing is not marked saved"""
+    real_write = config_handler._write_file
+    
+    def write_and_change(data):
+        real_write(data)
+        config_handler.dirty = True  # As if another thread changed a value
+    
+    monkeypatch.setattr(config_handler, '_write_file', write_and_change)
+    config_handler.set('new_key', 'new_value')
+    assert config_handler.dirty
+
+def test_save_skips_unchanged_config(config_handler, temp_config_dir, monkeypatch):
+    """Test that saving only rewrites the file when values changed"""
+    replaced = []
+    real_replace = os.replace
+    
+    def mock_replace(src, dst):
+        replaced.append(dst)
+        real_replace(src, dst)
+    
+    monkeypatch.setattr(os, 'replace', mock_replace)
+    
+    # Unchanged configuration should not touch the file
+    config_handler.save_config()
+    config_handler.set('test_str', 'default')
+    assert replaced == []
+    assert not config_handler.dirty
+    
+    # Changed configuration is written atomically
+    config_handler.set('test_str', 'updated')
+    assert len(replaced) == 1
+    assert not (temp_config_dir / "test_config.json.tmp").exists()
+    
+    with open(temp_config_dir / "test_config.json", 'r') as f:
+        assert json.load(f)['test_str'] == 'updated'
+
+def test_forced_save_writes_direct_edits(config_handler, temp_config_dir):
+    """Test that a forced save writes edits made to the config dict directly"""
+    config_handler.config['test_str'] = 'edited'
+    assert not config_handler.dirty
+    
+    config_handler.save_config()
+    assert 'edited' not in (temp_config_dir / "test_config.json").read_text(encoding='utf-8')
+    
+    assert config_handler.save_config(force=True)
+    assert 'edited' in (temp_config_dir / "test_config.json").read_text(encoding='utf-8')
+
 def test_config_type_preservation(config_handler):
     """Test that value types are preserved"""
     values = {
@@ -169,4 +247,14 @@ def test_config_type_preservation(config_handler):
     config_handler.load_config()
     for key, value in values.items():
         assert isinstance(config_handler.get(key), type(value))
-        assert config_handler.get(key) == value 
\ No newline at end of file
+        assert config_handler.get(key) == value 
+
+def test_non_ascii_round_trip(config_handler, temp_config_dir):
+    """Test text outside ASCII is saved as UTF-8 and loaded back"""
+    config_handler.set('test_str', 'Grüße – 日本語')
+    
+    raw = (temp_config_dir / "test_config.json").read_bytes()
+    assert 'test_str' in json.loads(raw.decode('utf-8'))
+    
+    config_handler.load_config()
+    assert config_handler.get('test_str') == 'Grüße – 日本語'
@@ -5,8 +5,7 @@ Integrates the command palette, listening interface, and notes editor
 
 import sys
 import logging
-import time
-import keyboard
+import subprocess
 
 from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction
 from PyQt5.QtCore import QObject, QThread, pyqtSignal, QTimer
@@ -21,6 +20,14 @@ from .quick_dictation import QuickDictationController
 from .styles import COLORS
 
 
+# Tray icon color and tooltip for each application state
+TRAY_STATES = {
+    'idle': ('accent_blue', "Mumble - Ready"),
+    'waiting': ('accent_green', "Mumble - Transcribing quick dictation..."),
+    'listening': ('accent_red', "Mumble - Listening..."),
+}
+
+
 class HotkeyMonitor(QThread):
     """Thread for monitoring global hotkeys"""
     
@@ -36,6 +43,10 @@ class HotkeyMonitor(QThread):
         """Monitor for hotkeys"""
         self.running = True
         try:
+            # Imported here so the keyboard hook stack loads on the monitor
+            # thread instead of delaying application startup.
+            import keyboard
+
             # Register palette hotkey (Ctrl+Shift+Space)
             self._hotkey_handles.append(
                 keyboard.add_hotkey('ctrl+shift+space', self.on_palette_hotkey, suppress=True)
@@ -70,6 +81,11 @@ class HotkeyMonitor(QThread):
 
     def _remove_hotkeys(self):
         """Remove only the hotkeys registered by this monitor."""
+        if not self._hotkey_handles:
+            return
+
+        import keyboard
+
         while self._hotkey_handles:
             handle = self._hotkey_handles.pop()
             try:
@@ -103,6 +119,8 @@ class MumbleApp(QObject):
         
         # System tray
         self.tray_icon = None
+        self._tray_icons = {}
+        self._tray_state = None
         self.setup_system_tray()
         
         # Hotkey monitoring
@@ -139,10 +157,13 @@ class MumbleApp(QObject):
         # Create tray icon
         self.tray_icon = QSystemTrayIcon()
         
-        # Create a simple colored icon
-        icon_pixmap = QPixmap(16, 16)
-        icon_pixmap.fill(QColor(COLORS['accent_blue']))
-        self.tray_icon.setIcon(QIcon(icon_pixmap))
+        # Build one simple colored icon per state up front so state changes
+        # only swap references instead of painting a new pixmap
+        for state, (color, _tooltip) in TRAY_STATES.items():
+            icon_pixmap = QPixmap(16, 16)
+            icon_pixmap.fill(QColor(COLORS[color]))
+            self._tray_icons[state] = QIcon(icon_pixmap)
+        self.tray_icon.setIcon(self._tray_icons['idle'])
         
         # Create context menu
         tray_menu = QMenu()
@@ -345,17 +366,32 @@ class MumbleApp(QObject):
             previous_clipboard = self._get_clipboard_text()
             self._set_clipboard_text(text)
 
-            # Give the OS clipboard a moment to propagate before pasting.
-            time.sleep(0.05)
+            # Give the OS clipboard a moment to propagate before pasting,
+            # without stalling the Qt event loop while we wait.
+            QTimer.singleShot(
+                50,
+                lambda text=text, previous_clipboard=previous_clipboard: self._paste_to_active_app(
+                    text, previous_clipboard
+                ),
+            )
+            
+        except Exception as e:
+            self._insert_text_into_notes(text, e)
+
+    def _paste_to_active_app(self, text: str, previous_clipboard: str):
+        """Paste the clipboard into the active application once it has settled."""
+        try:
             self._paste_clipboard_to_active_app()
             self._schedule_clipboard_restore(previous_clipboard)
             self.logger.info("Text inserted into active application")
-            
         except Exception as e:
-            self.logger.error(f"Failed to insert text: {e}")
-            # Fallback: open notes editor with the text
-            self.notes_manager.open_editor(text)
-            self._connect_notes_editor_signals()
+            self._insert_text_into_notes(text, e)
+
+    def _insert_text_into_notes(self, text: str, error: Exception):
+        """Fallback: open notes editor with the text"""
+        self.logger.error(f"Failed to insert text: {error}")
+        self.notes_manager.open_editor(text)
+        self._connect_notes_editor_signals()
 
     def _get_clipboard_text(self) -> str:
         """Read the current clipboard contents."""
@@ -371,9 +407,22 @@ class MumbleApp(QObject):
 
     def _paste_clipboard_to_active_app(self):
         """Send the OS paste hotkey to the active application."""
-        import pyautogui
+        if sys.platform == 'darwin':
+            subprocess.run(
+                ['osascript', '-e', 'tell application "System Events" to keystroke "v" using command down'],
+                check=False,
+            )
+            return
 
-        pyautogui.hotkey('ctrl', 'v')
+        try:
+            import keyboard
+
+            keyboard.send('ctrl+v')
+        except Exception as e:
+            self.logger.warning(f"Native paste failed, falling back to pyautogui: {e}")
+            import pyautogui
+
+            pyautogui.hotkey('ctrl', 'v', _pause=False)
 
     def _schedule_clipboard_restore(self, previous_clipboard: str):
         """Restore the previous clipboard contents after the paste completes."""
@@ -435,27 +484,12 @@ class MumbleApp(QObject):
     
     def update_tray_icon_state(self, state: str):
         """Update tray icon state"""
-        if not self.tray_icon:
+        if not self.tray_icon or state == self._tray_state or state not in TRAY_STATES:
             return
         
-        # Create a colored icon based on the state
-        icon_pixmap = QPixmap(16, 16)
-        if state == 'idle':
-            icon_pixmap.fill(QColor(COLORS['accent_blue']))
-        elif state == 'waiting':
-            icon_pixmap.fill(QColor(COLORS['accent_green']))
-        elif state == 'listening':
-            icon_pixmap.fill(QColor(COLORS['accent_red']))
-        
-        self.tray_icon.setIcon(QIcon(icon_pixmap))
-        
-        # Update tooltip
-        if state == 'idle':
-            self.tray_icon.setToolTip("Mumble - Ready")
-        elif state == 'waiting':
-            self.tray_icon.setToolTip("Mumble - Transcribing quick dictation...")
-        elif state == 'listening':
-            self.tray_icon.setToolTip("Mumble - Listening...")
+        self._tray_state = state
+        self.tray_icon.setIcon(self._tray_icons[state])
+        self.tray_icon.setToolTip(TRAY_STATES[state][1])
 
 
 def main():
@@ -5,11 +5,11 @@ Deterministic quick dictation controller for the modern Qt app.
 from __future__ import annotations
 
 import logging
+import queue
 import threading
 from typing import Callable, Optional
 
 from PyQt5.QtCore import QObject, pyqtSignal
-import speech_recognition as sr
 
 try:
     import sounddevice as sd
@@ -36,6 +36,7 @@ class QuickDictationController(QObject):
         self._callback: Optional[Callable[[str], None]] = None
         self._is_recording = False
         self._is_transcribing = False
+        self._transcription_jobs: queue.Queue = queue.Queue()
         self._transcription_thread: Optional[threading.Thread] = None
 
         self.transcription_ready.connect(self._forward_transcription)
@@ -107,12 +108,8 @@ class QuickDictationController(QObject):
 
         self._is_transcribing = True
         self.state_changed.emit("transcribing")
-        self._transcription_thread = threading.Thread(
-            target=self._transcribe_audio,
-            args=(audio_bytes, self.sample_rate),
-            daemon=True,
-        )
-        self._transcription_thread.start()
+        self._ensure_transcription_worker()
+        self._transcription_jobs.put((audio_bytes, self.sample_rate))
         self.logger.info("Quick dictation recording stopped; transcription started")
 
     def cancel_listening(self) -> None:
@@ -153,8 +150,36 @@ class QuickDictationController(QObject):
             return b""
         return audio_bytes
 
+    def _ensure_transcription_worker(self) -> None:
+        """Start the long-lived transcription worker on first use."""
+        if self._transcription_thread is not None and self._transcription_thread.is_alive():
+            return
+
+        self._transcription_thread = threading.Thread(
+            target=self._transcription_worker,
+            name="mumble-quick-transcription",
+            daemon=True,
+        )
+        self._transcription_thread.start()
+
+    def _transcription_worker(self) -> None:
+        """Transcribe queued recordings one at a time off the Qt thread."""
+        while True:
+            audio_bytes, sample_rate = self._transcription_jobs.get()
+            # A failing job must not end the only worker the queue has
+            try:
+                self._transcribe_audio(audio_bytes, sample_rate)
+            except Exception as exc:
+                self.logger.exception("Quick dictation transcription failed")
+                self.transcription_failed.emit(f"Dictation failed: {exc}")
+            finally:
+                self._is_transcribing = False
+                self.state_changed.emit("idle")
+
     def _transcribe_audio(self, audio_bytes: bytes, sample_rate: int) -> None:
         """Transcribe captured PCM audio in a background thread."""
+        import speech_recognition as sr
+
         recognizer = sr.Recognizer()
         try:
             audio_data = sr.AudioData(audio_bytes, sample_rate, self.sample_width)
@@ -169,9 +194,6 @@ class QuickDictationController(QObject):
             self.transcription_failed.emit(f"Speech service unavailable: {exc}")
         except Exception as exc:  # pragma: no cover - defensive runtime path
             self.transcription_failed.emit(f"Dictation failed: {exc}")
-        finally:
-            self._is_transcribing = False
-            self.state_changed.emit("idle")
 
     def _forward_transcription(self, text: str) -> None:
         """Deliver a successful transcription to the registered callback."""
@@ -65,7 +65,7 @@ def main():
         print("\nUsage:")
         print("- Run 'python src/launcher.py' to use the launcher")
         print("- Mumble Notes will show a window when started")
-        print("- Mumble Quick runs hidden, press Ctrl+Alt to activate")
+        print("- Mumble Quick runs hidden, press Ctrl+Alt+Space to activate")
     else:
         print("❌ Some applications failed to start")
         print("Check the logs in src/logs/ for more details")
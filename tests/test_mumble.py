@@ -9,6 +9,7 @@ import logging
 import types
 import inspect
 import builtins
+import threading
 from pathlib import Path
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
@@ -21,7 +22,7 @@ for import_root in (PROJECT_ROOT, SRC_ROOT):
     if import_root_str not in sys.path:
         sys.path.insert(0, import_root_str)
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
 from PyQt5.QtWidgets import QApplication
 
 from shared.adaptive_speech import create_adaptive_speech_recognizer
@@ -424,7 +425,6 @@ def test_insert_text_restores_clipboard_after_paste(monkeypatch):
     clipboard_events = []
 
     monkeypatch.setattr(main_app.QTimer, "singleShot", lambda delay, callback: callback())
-    monkeypatch.setattr(main_app.time, "sleep", lambda seconds: None)
     monkeypatch.setattr(
         main_app.MumbleApp,
         "_get_clipboard_text",
@@ -448,3 +448,170 @@ def test_insert_text_restores_clipboard_after_paste(monkeypatch):
         ("paste", None),
         ("set", "previous clipboard"),
     ]
+
+
+def test_tray_state_updates_reuse_cached_icons(monkeypatch):
+    """Tray state changes should swap prebuilt icons and skip redundant updates."""
+    get_app()
+
+    class DummyRecognizer:
+        def __init__(self):
+            self.is_listening = False
+            self.is_available = True
+            self.is_busy = False
+            self.is_transcribing = False
+            self.backend_name = "dummy"
+
+    class DummyTrayIcon:
+        def __init__(self):
+            self.icons = []
+            self.tooltips = []
+
+        def setIcon(self, icon):
+            self.icons.append(icon)
+
+        def setToolTip(self, tooltip):
+            self.tooltips.append(tooltip)
+
+    app = build_headless_app(monkeypatch, DummyRecognizer)
+    app.tray_icon = DummyTrayIcon()
+    app._tray_icons = {state: object() for state in main_app.TRAY_STATES}
+    app._tray_state = None
+
+    app.update_tray_icon_state('listening')
+    app.update_tray_icon_state('listening')
+    app.update_tray_icon_state('idle')
+
+    assert app.tray_icon.icons == [app._tray_icons['listening'], app._tray_icons['idle']]
+    assert app.tray_icon.tooltips == ["Mumble - Listening...", "Mumble - Ready"]
+
+
+def test_insert_text_defers_paste_without_blocking(monkeypatch):
+    """Active-app paste should be scheduled on the event loop, not slept on."""
+    get_app()
+
+    class DummyRecognizer:
+        def __init__(self):
+            self.is_listening = False
+            self.is_available = True
+            self.is_busy = False
+            self.is_transcribing = False
+            self.backend_name = "dummy"
+
+    app = build_headless_app(monkeypatch, DummyRecognizer)
+
+    scheduled = []
+    pasted = []
+
+    monkeypatch.setattr(
+        main_app.QTimer,
+        "singleShot",
+        lambda delay, callback: scheduled.append((delay, callback)),
+    )
+    monkeypatch.setattr(main_app.MumbleApp, "_get_clipboard_text", lambda self: "")
+    monkeypatch.setattr(main_app.MumbleApp, "_set_clipboard_text", lambda self, text: None)
+    monkeypatch.setattr(
+        main_app.MumbleApp,
+        "_paste_clipboard_to_active_app",
+        lambda self: pasted.append(True),
+    )
+
+    app.insert_text_to_active_app("new dictation")
+
+    assert pasted == []
+    assert [delay for delay, _callback in scheduled] == [50]
+
+    scheduled[0][1]()
+    assert pasted == [True]
+
+
+def test_paste_prefers_native_keyboard_send(monkeypatch):
+    """The paste hotkey should go through keyboard, with pyautogui as fallback."""
+    get_app()
+
+    class DummyRecognizer:
+        def __init__(self):
+            self.is_listening = False
+            self.is_available = True
+            self.is_busy = False
+            self.is_transcribing = False
+            self.backend_name = "dummy"
+
+    app = build_headless_app(monkeypatch, DummyRecognizer)
+
+    sent = []
+    fallback = []
+
+    def failing_send(hotkey):
+        sent.append(hotkey)
+        raise OSError("no input access")
+
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setitem(sys.modules, "keyboard", types.SimpleNamespace(send=sent.append))
+    monkeypatch.setitem(
+        sys.modules,
+        "pyautogui",
+        types.SimpleNamespace(hotkey=lambda *keys, **kwargs: fallback.append(keys)),
+    )
+
+    app._paste_clipboard_to_active_app()
+    assert sent == ["ctrl+v"]
+    assert fallback == []
+
+    monkeypatch.setitem(sys.modules, "keyboard", types.SimpleNamespace(send=failing_send))
+    app._paste_clipboard_to_active_app()
+    assert fallback == [("ctrl", "v")]
+
+
+def test_quick_dictation_reuses_single_transcription_worker(monkeypatch):
+    """Consecutive recordings should be transcribed on one long-lived worker."""
+    get_app()
+    controller = QuickDictationController()
+
+    transcribed = []
+    done = threading.Event()
+
+    def fake_transcribe(audio_bytes, sample_rate):
+        transcribed.append(threading.current_thread().name)
+        if len(transcribed) == 2:
+            done.set()
+
+    monkeypatch.setattr(controller, "_transcribe_audio", fake_transcribe)
+
+    one_second = b"\0" * (controller.sample_rate * controller.sample_width)
+    for _ in range(2):
+        controller._is_recording = True
+        controller._buffer = bytearray(one_second)
+        controller.stop_listening()
+
+    assert done.wait(2)
+    assert transcribed == [controller._transcription_thread.name] * 2
+
+
+def test_quick_dictation_worker_survives_failed_job(monkeypatch):
+    """A job that raises should report failure and leave the worker running."""
+    get_app()
+    controller = QuickDictationController()
+
+    failures = []
+    transcribed = []
+    done = threading.Event()
+    controller.transcription_failed.connect(failures.append, Qt.DirectConnection)
+
+    def flaky_transcribe(audio_bytes, sample_rate):
+        transcribed.append(audio_bytes)
+        if len(transcribed) == 1:
+            raise ImportError("No module named 'speech_recognition'")
+        done.set()
+
+    monkeypatch.setattr(controller, "_transcribe_audio", flaky_transcribe)
+
+    one_second = b"\0" * (controller.sample_rate * controller.sample_width)
+    for _ in range(2):
+        controller._is_recording = True
+        controller._buffer = bytearray(one_second)
+        controller.stop_listening()
+
+    assert done.wait(2)
+    assert len(transcribed) == 2
+    assert failures and "speech_recognition" in failures[0]